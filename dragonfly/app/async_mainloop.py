@@ -0,0 +1,99 @@
+import asyncio
+
+import hive
+
+from ..sys.process import Process as _Process
+
+
+class _AsyncMainloop(object):
+
+    @hive.types(tick_rate='int')
+    def __init__(self, tick_rate=60):
+        self._hive = hive.get_run_hive()
+        self.tick_rate = tick_rate
+
+        self._loop = None
+        self._task = None
+        self._stopped = None
+        self._tick_handle = None
+        self._next_tick_time = None
+
+        hive.add_dispose_callback(self.stop)
+
+    def run(self):
+        """Run until stopped.
+
+        If an event loop is running, the mainloop is scheduled as a task of that loop, otherwise a new event loop is
+        run (which blocks until stopped)
+        """
+        try:
+            loop = asyncio.get_running_loop()
+
+        except RuntimeError:
+            asyncio.run(self.run_async())
+
+        else:
+            self._task = loop.create_task(self.run_async())
+
+    async def run_async(self):
+        """Coroutine which ticks the hive on the running event loop until stopped"""
+        if self._stopped is not None:
+            raise RuntimeError("Mainloop is already running")
+
+        self._loop = loop = asyncio.get_running_loop()
+        self._stopped = loop.create_future()
+
+        self._hive.on_started()
+
+        self._next_tick_time = loop.time()
+        self._tick_handle = loop.call_at(self._next_tick_time, self._tick)
+
+        try:
+            await self._stopped
+
+        finally:
+            self._tick_handle.cancel()
+            self._stopped = self._task = None
+
+            self._hive.on_stopped()
+
+    def _tick(self):
+        loop = self._loop
+        self._next_tick_time += 1.0 / self.tick_rate
+
+        # Skip ticks which are too late (as the blocking Mainloop limits its accumulator)
+        if loop.time() - self._next_tick_time > 0.25:
+            self._next_tick_time = loop.time()
+
+        self._tick_handle = loop.call_at(self._next_tick_time, self._tick)
+        self._hive.tick()
+
+    def get_tick_rate(self):
+        return self.tick_rate
+
+    def stop(self):
+        stopped = self._stopped
+
+        if stopped is not None and not stopped.done():
+            stopped.set_result(None)
+
+
+def build_async_mainloop(cls, i, ex, args):
+    """Non-blocking fixed-timestep trigger generator, scheduled on an asyncio event loop"""
+    i.tick = hive.triggerfunc()
+    i.stop = hive.triggerable(cls.stop)
+    i.run = hive.triggerable(cls.run)
+
+    ex.tick = hive.hook(i.tick)
+    ex.run = hive.entry(i.run)
+    ex.stop = hive.entry(i.stop)
+
+    i.tick_rate = hive.property(cls, "tick_rate", 'int')
+    i.pull_tick_rate = hive.pull_out(i.tick_rate)
+    ex.tick_rate = hive.output(i.pull_tick_rate)
+
+    ex.get_tick_rate = hive.plugin(cls.get_tick_rate, identifier="app.get_tick_rate")
+    ex.quit = hive.plugin(cls.stop, identifier="app.quit")
+
+
+AsyncMainloop = _Process.extend("AsyncMainloop", build_async_mainloop, _AsyncMainloop)
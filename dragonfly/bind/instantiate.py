@@ -131,9 +131,10 @@ class InstantiatorClass:
 
     @hive.types(process_id="int.process_id")
     def stop_hive(self, process_id):
-        """Forget child hive when it is stopped"""
+        """Stop child hive, and dispose it"""
         instance = self._active_hives.pop(process_id)
         instance.on_stopped()
+        instance.dispose()
 
     def stop_all_processes(self):
         """Stop all child hives if instantiator is stopped"""
@@ -141,25 +142,34 @@ class InstantiatorClass:
             self.stop_hive(instance_id)
 
     def instantiate(self):
+        self._instantiate_hives(1)
+
+    @hive.types(count="int")
+    def instantiate_many(self, count):
+        """Instantiate a batch of child hives, sharing the context and bind class lookup"""
+        self._instantiate_hives(count)
+
+    def _instantiate_hives(self, count):
         context = self._create_context()
 
         bind_meta_args = self._hive._hive_object._hive_meta_args_frozen
-        print("PRE", (self.bind_meta_class))
         bind_class = self.bind_meta_class(bind_meta_args=bind_meta_args, hive_class=self.hive_class)
 
-        # Create Hive and track ID
-        environment_hive = bind_class(context)
-        process_id = next(self._process_id_generator)
+        # Create Hives and track IDs
+        environment_hives = bind_class.instantiate_many(count, context)
+
+        for environment_hive in environment_hives:
+            process_id = next(self._process_id_generator)
 
-        # Store ID of process
-        self.last_created_process_id = process_id
-        self._active_hives[process_id] = environment_hive
+            # Store ID of process
+            self.last_created_process_id = process_id
+            self._active_hives[process_id] = environment_hive
 
-        # Notify bind classes of new hive instance (environment_hive)
-        for callback in self._bind_class_creation_callbacks:
-            callback(process_id, environment_hive)
+            # Notify bind classes of new hive instance (environment_hive)
+            for callback in self._bind_class_creation_callbacks:
+                callback(process_id, environment_hive)
 
-        environment_hive.on_started()
+            environment_hive.on_started()
 
 
 def declare_instantiator(meta_args):
@@ -185,6 +195,12 @@ def build_instantiator(cls, i, ex, args, meta_args):
 
     hive.trigger(i.trig_instantiate, i.pull_hive_class, pretrigger=True)
 
+    # Batch instantiation
+    i.push_create_many = hive.push_in(cls.instantiate_many)
+    ex.create_many = hive.antenna(i.push_create_many)
+
+    hive.trigger(i.push_create_many, i.pull_hive_class, pretrigger=True)
+
     ex.process_id = hive.property(cls, "last_created_process_id", "int.process_id")
     i.pull_process_id = hive.pull_out(ex.process_id)
     ex.last_process_id = hive.output(i.pull_process_id)
@@ -64,10 +64,12 @@ def build_scene(cls, i, ex, args):
     import dragonfly
     ex.on_tick = dragonfly.event.Tick()
 
+    i.spawned = hive.variable("bool", False)
+
     def f(self):
         print("I")
-        if not hasattr(self, 'a'):
-            self.a = 1
+        if not self._spawned:
+            self._spawned = True
 
             self.spawn_entity.plugin()("Cube", "c1")
 
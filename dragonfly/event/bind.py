@@ -84,6 +84,7 @@ class EventEnvironmentClass(factory.create_environment_class()):
         leader = context.config.get('leader', None)
         self._main_handler = EventHandler(self.handle_event, leader)
         self._handler_is_registered = False
+        self._is_closed = False
 
     def _update_listener_state(self):
         has_handlers = self._dispatcher.has_handlers
@@ -116,6 +117,10 @@ class EventEnvironmentClass(factory.create_environment_class()):
         self._update_listener_state()
 
     def remove_handler(self, handler):
+        # Handlers are cleared when the environment is closed, before its hive is disposed
+        if self._is_closed:
+            return
+
         self._dispatcher.remove_handler(handler)
         self._update_listener_state()
 
@@ -125,6 +130,7 @@ class EventEnvironmentClass(factory.create_environment_class()):
     def on_closed(self):
         """Disconnect from external event stream"""
         self._dispatcher.clear_handlers()
+        self._is_closed = True
 
         self._update_listener_state()
 
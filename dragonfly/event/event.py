@@ -44,6 +44,24 @@ class EventHandler:
                     self.callback()
 
 
+class _HandlerRemovalMixin:
+    """Builder-class mixin which removes the EventHandler added by the hive (self._handler) when it is disposed"""
+
+    def __init__(self):
+        self._handler = None
+        self._remove_handler = None
+
+        hive.add_dispose_callback(self.remove_handler)
+
+    def set_remove_handler(self, remove_handler):
+        self._remove_handler = remove_handler
+
+    def remove_handler(self):
+        if self._handler is not None and self._remove_handler is not None:
+            self._remove_handler(self._handler)
+            self._handler = None
+
+
 class EventDispatcher:
 
     def __init__(self):
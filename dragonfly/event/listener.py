@@ -1,12 +1,14 @@
 import hive
 
-from .event import EventHandler
+from .event import EventHandler, _HandlerRemovalMixin
 
 
-class _ListenerCls:
+class _ListenerCls(_HandlerRemovalMixin):
 
     @hive.types(event="tuple.event", mode="str")
     def __init__(self, event=()):
+        super().__init__()
+
         self.add_handler = None
         self.event = event
 
@@ -32,7 +34,7 @@ class _ListenerCls:
         else:
             callback = self.on_event
 
-        handler = EventHandler(callback, self.event, mode=mode)
+        self._handler = handler = EventHandler(callback, self.event, mode=mode)
         add_handler(handler)
 
 
@@ -46,6 +48,7 @@ def build_listener(cls, i, ex, args, meta_args):
     ex.on_event = hive.hook(i.on_event)
 
     ex.get_add_handler = hive.socket(cls.set_add_handler, "event.add_handler")
+    ex.get_remove_handler = hive.socket(cls.set_remove_handler, "event.remove_handler", policy=hive.SingleOptional)
 
     if meta_args.mode == 'leader':
         i.after_leader = hive.property(cls, 'after_leader', 'tuple')
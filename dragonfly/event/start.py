@@ -1,22 +1,25 @@
 import hive
 
-from .event import EventHandler
+from .event import EventHandler, _HandlerRemovalMixin
 
 
-class _OnStart:
+class _OnStart(_HandlerRemovalMixin):
 
     def __init__(self):
+        super().__init__()
+
         self._hive = hive.get_run_hive()
 
     def set_add_handler(self, add_handler):
         callback = self._hive._on_started
-        handler = EventHandler(callback, ("start",), mode='match')
+        self._handler = handler = EventHandler(callback, ("start",), mode='match')
         add_handler(handler)
 
 
 def build_on_start(cls, i, ex, args):
     """Listen for start event"""
     ex.get_add_handler = hive.socket(cls.set_add_handler, "event.add_handler")
+    ex.get_remove_handler = hive.socket(cls.set_remove_handler, "event.remove_handler", policy=hive.SingleOptional)
 
     i.on_started = hive.triggerfunc()
     ex.on_started = hive.hook(i.on_started)
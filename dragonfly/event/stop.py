@@ -1,22 +1,25 @@
 import hive
 
-from .event import EventHandler
+from .event import EventHandler, _HandlerRemovalMixin
 
 
-class OnStopClass:
+class OnStopClass(_HandlerRemovalMixin):
 
     def __init__(self):
+        super().__init__()
+
         self._hive = hive.get_run_hive()
 
     def set_add_handler(self, add_handler):
         callback = self._hive._on_stop
-        handler = EventHandler(callback, ("stop",), mode='match')
+        self._handler = handler = EventHandler(callback, ("stop",), mode='match')
         add_handler(handler)
 
 
 def build_on_stop(cls, i, ex, args):
     """Listen for quit event"""
     ex.get_add_handler = hive.socket(cls.set_add_handler, "event.add_handler")
+    ex.get_remove_handler = hive.socket(cls.set_remove_handler, "event.remove_handler", policy=hive.SingleOptional)
 
     i.on_stop = hive.triggerfunc()
     ex.on_stop = hive.hook(i.on_stop)
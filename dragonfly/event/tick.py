@@ -15,6 +15,8 @@ class _TickCls:
         self._active = False
         self._activate_on_started = activate_on_start
 
+        hive.add_dispose_callback(self.disable)
+
     def set_add_handler(self, add_handler):
         self._add_handler = add_handler
 
@@ -1,2 +1,5 @@
+from .channel import Channel
 from .import_ import Import
-from .process import Process
\ No newline at end of file
+from .job import Job
+from .process import Process
+from .process_pool import HiveProcessPool
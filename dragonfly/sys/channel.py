@@ -0,0 +1,336 @@
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+import os
+from pickle import dumps, loads, HIGHEST_PROTOCOL
+from struct import Struct
+from time import sleep
+
+import hive
+from hive.typing import TypeName, parse_type_string
+
+
+# Struct formats of data types with fixed size records
+FIXED_SIZE_FORMATS = {"int": "<q", "float": "<d", "bool": "<?"}
+
+
+class StructRecordLayout:
+    """Fixed size record layout of a single struct field"""
+
+    def __init__(self, fmt):
+        self._struct = Struct(fmt)
+        self.size = self._struct.size
+
+    def pack_into(self, buffer, offset, value):
+        self._struct.pack_into(buffer, offset, value)
+
+    def unpack_from(self, buffer, offset):
+        return self._struct.unpack_from(buffer, offset)[0]
+
+
+class PickleRecordLayout:
+    """Record layout of pickled values, within records of a maximum size"""
+
+    _length = Struct("<I")
+
+    def __init__(self, size):
+        if size <= self._length.size:
+            raise ValueError("Record size must be larger than {} bytes".format(self._length.size))
+
+        self.size = size
+
+    def pack_into(self, buffer, offset, value):
+        data = dumps(value, HIGHEST_PROTOCOL)
+        length = len(data)
+        start = offset + self._length.size
+
+        if start + length > offset + self.size:
+            raise ValueError("Pickled value ({} bytes) is too large for record size ({} bytes)"
+                             .format(length, self.size - self._length.size))
+
+        self._length.pack_into(buffer, offset, length)
+        buffer[start: start + length] = data
+
+    def unpack_from(self, buffer, offset):
+        length, = self._length.unpack_from(buffer, offset)
+        start = offset + self._length.size
+        return loads(buffer[start: start + length])
+
+
+def attach_shared_memory(name):
+    """Attach to an existing shared memory block, without registering it with the resource tracker of this process.
+
+    The resource tracker unlinks the blocks registered with it when its process exits, which would destroy the block
+    of another (unrelated) process that created it
+
+    :param name: name of shared memory block
+    """
+    try:
+        # Python 3.13+
+        return SharedMemory(name, track=False)
+
+    except TypeError:
+        pass
+
+    memory = SharedMemory(name)
+
+    if os.name == "posix":
+        resource_tracker.unregister(memory._name, "shared_memory")
+
+    return memory
+
+
+def unlink_shared_memory(memory):
+    """Unlink a shared memory block created by this process, if it has not already been unlinked
+
+    :param memory: SharedMemory instance
+    """
+    if os.name == "posix":
+        # Processes started by multiprocessing share the resource tracker of this process, so their attached blocks
+        # were unregistered from it. Register the block again, so that it is unregistered exactly once by unlink()
+        resource_tracker.register(memory._name, "shared_memory")
+
+    try:
+        memory.unlink()
+
+    except FileNotFoundError:
+        if os.name == "posix":
+            resource_tracker.unregister(memory._name, "shared_memory")
+
+
+def get_record_layout(data_type, record_size):
+    """Return record layout for a data type, using pickle for types without a fixed size
+
+    :param data_type: hive data type
+    :param record_size: size of records of pickled values
+    """
+    type_ast = parse_type_string(data_type)
+
+    if isinstance(type_ast, TypeName):
+        fmt = FIXED_SIZE_FORMATS.get(type_ast.type_name[0])
+
+        if fmt is not None:
+            return StructRecordLayout(fmt)
+
+    return PickleRecordLayout(record_size)
+
+
+class SharedRingBuffer:
+    """Single producer, single consumer ring buffer of records in shared memory.
+
+    The write and read indices are monotonic counters, on separate cache lines, which are written only by the producer
+    and consumer respectively. A record is written before the write index is advanced, and read before the read index
+    is advanced. Each side reads the index of the other only when required (the consumer once per receive(), the
+    producer when the buffer appears full), to limit traffic between cores.
+    """
+
+    _layout = Struct("<II")
+
+    # Items of the (native, unsigned 64 bit) index view. Indices are assigned through a memoryview, which copies them
+    # whole (Struct.pack_into clears the bytes before packing, so a concurrent read could observe zero)
+    WRITE_INDEX = 0
+    READ_INDEX = 8
+
+    LAYOUT_OFFSET = 128
+    RECORDS_OFFSET = 192
+
+    def __init__(self, record_layout, name=None, create=False, capacity=1024):
+        """Create or attach to the shared memory of a ring buffer
+
+        :param record_layout: layout of records
+        :param name: name of shared memory block (generated if None and create is True)
+        :param create: create the shared memory block, rather than attach to it
+        :param capacity: number of records (if created)
+        """
+        self._record_layout = record_layout
+        self._record_size = record_size = record_layout.size
+
+        if create:
+            self._memory = SharedMemory(name, create=True, size=self.RECORDS_OFFSET + capacity * record_size)
+            self._layout.pack_into(self._memory.buf, self.LAYOUT_OFFSET, capacity, record_size)
+
+        else:
+            self._memory = attach_shared_memory(name)
+            capacity, created_record_size = self._layout.unpack_from(self._memory.buf, self.LAYOUT_OFFSET)
+
+            if created_record_size != record_size:
+                self._memory.close()
+                raise ValueError("Record size of shared ring buffer '{}' ({}) does not match record layout ({})"
+                                 .format(name, created_record_size, record_size))
+
+        self._owner = create
+        self._capacity = capacity
+        self._buffer = self._memory.buf
+        self._indices = self._buffer[:self.LAYOUT_OFFSET].cast("Q")
+
+        if create:
+            self._indices[self.WRITE_INDEX] = 0
+            self._indices[self.READ_INDEX] = 0
+
+        # Local copies of the indices, each is written by one side only
+        self._write_index = self._indices[self.WRITE_INDEX]
+        self._read_index = self._indices[self.READ_INDEX]
+
+        # Producer's last known read index, so that the shared read index is only read when the buffer appears full
+        self._known_read_index = self._read_index
+
+    @property
+    def name(self):
+        return self._memory.name
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    def push(self, value, wait_interval=1e-4):
+        """Write a value, waiting for the consumer whilst the buffer is full
+
+        :param value: value to write
+        :param wait_interval: time slept between polls of the read index
+        """
+        write_index = self._write_index
+
+        if write_index - self._known_read_index >= self._capacity:
+            indices = self._indices
+
+            while True:
+                self._known_read_index = indices[self.READ_INDEX]
+                if write_index - self._known_read_index < self._capacity:
+                    break
+
+                sleep(wait_interval)
+
+        offset = self.RECORDS_OFFSET + (write_index % self._capacity) * self._record_size
+        self._record_layout.pack_into(self._buffer, offset, value)
+
+        self._write_index = self._indices[self.WRITE_INDEX] = write_index + 1
+
+    def receive(self):
+        """Return a list of the values written since the last call.
+
+        The read index is advanced once for all values, after they are read
+        """
+        read_index = self._read_index
+        write_index = self._indices[self.WRITE_INDEX]
+
+        if read_index == write_index:
+            return []
+
+        buffer = self._buffer
+        unpack_from = self._record_layout.unpack_from
+        capacity = self._capacity
+        record_size = self._record_size
+        records_offset = self.RECORDS_OFFSET
+
+        values = [unpack_from(buffer, records_offset + (index % capacity) * record_size)
+                  for index in range(read_index, write_index)]
+
+        self._read_index = self._indices[self.READ_INDEX] = write_index
+
+        return values
+
+    def close(self):
+        """Detach from the shared memory, which is destroyed if this buffer created it"""
+        if self._buffer is None:
+            return
+
+        # Views of the shared memory must be released before it is closed
+        self._indices.release()
+        self._indices = self._buffer = None
+        self._memory.close()
+
+        if self._owner:
+            unlink_shared_memory(self._memory)
+
+
+class _ChannelClass:
+
+    @hive.types(name="str", create="bool", capacity="int", record_size="int")
+    def __init__(self, name=None, create=False, capacity=1024, record_size=256):
+        self._hive = hive.get_run_hive()
+
+        self._name = name
+        self._create = create
+        self._capacity = capacity
+        self._record_size = record_size
+
+        self.data_type = None
+        self.value = None
+        self.received_value = None
+
+        self._ring_buffer = None
+
+        hive.add_dispose_callback(self._close)
+
+    @hive.typed_property("str")
+    def name(self):
+        return self._get_ring_buffer().name
+
+    def _get_ring_buffer(self):
+        # The data type (a property) is set after __init__
+        if self._ring_buffer is None:
+            record_layout = get_record_layout(self.data_type, self._record_size)
+            self._ring_buffer = SharedRingBuffer(record_layout, self._name, self._create, self._capacity)
+
+        return self._ring_buffer
+
+    def open(self):
+        self._get_ring_buffer()
+
+    def _close(self):
+        if self._ring_buffer is not None:
+            self._ring_buffer.close()
+            self._ring_buffer = None
+
+    def push(self):
+        self._get_ring_buffer().push(self.value)
+
+    def synchronise(self):
+        for value in self._get_ring_buffer().receive():
+            self.received_value = value
+            self._hive._on_received()
+
+
+def declare_channel(meta_args):
+    meta_args.data_type = hive.parameter("str", "int")
+
+
+def build_channel(cls, i, ex, args, meta_args):
+    """Transfer values between hives in different processes through a shared memory ring buffer.
+
+    One endpoint creates the shared memory (create=True), and the other attaches to it by name. Values pushed to
+    value_in are written as records whose layout is derived from the data type (int, float and bool are fixed size,
+    other types are pickled into records of record_size bytes). Written values are pushed to value_out by the other
+    endpoint when it is synchronised (e.g. each tick). Pushing to a full buffer waits for the other endpoint.
+
+    The shared memory is created (or attached to) when the channel is opened, which happens on first use (pulling
+    name, pushing a value or synchronising), when open is triggered, or when the enclosing process is started.
+    """
+    i.data_type = hive.property(cls, "data_type", "str", meta_args.data_type)
+
+    i.value = hive.property(cls, "value", meta_args.data_type)
+    i.push_value = hive.push_in(i.value)
+    ex.value_in = hive.antenna(i.push_value)
+
+    i.do_push = hive.triggerable(cls.push)
+    hive.trigger(i.push_value, i.do_push)
+
+    i.received_value = hive.property(cls, "received_value", meta_args.data_type)
+    i.push_received_value = hive.push_out(i.received_value)
+    ex.value_out = hive.output(i.push_received_value)
+
+    i.on_received = hive.triggerfunc()
+    hive.trigger(i.on_received, i.push_received_value)
+
+    i.do_synchronise = hive.triggerable(cls.synchronise)
+    ex.synchronise = hive.entry(i.do_synchronise)
+
+    i.pull_name = hive.pull_out(cls.name)
+    ex.name = hive.output(i.pull_name)
+
+    i.do_open = hive.triggerable(cls.open)
+    ex.open = hive.entry(i.do_open)
+
+    ex.on_started = hive.plugin(cls.open, identifier="on_started")
+
+
+Channel = hive.dyna_hive("Channel", build_channel, declare_channel, builder_cls=_ChannelClass)
@@ -0,0 +1,193 @@
+from collections import deque
+from concurrent.futures import CancelledError, ThreadPoolExecutor, ProcessPoolExecutor
+
+import hive
+
+from ..event import EventHandler
+
+
+EXECUTOR_CLASSES = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+
+class _JobClass:
+
+    @hive.types(max_workers="int", max_pending="int")
+    def __init__(self, max_workers=1, max_pending=0):
+        self._hive = hive.get_run_hive()
+
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.executor = None
+
+        self.function = None
+        self.arguments = ()
+
+        self.result = None
+        self.error = None
+
+        self._executor = None
+        self._owns_executor = False
+        self._get_shared_executor = None
+
+        # Futures of submitted calls whose results have not been delivered. Only accessed from the hive's thread
+        self._pending = set()
+        # Completed futures, appended from executor threads by done callbacks
+        self._completed = deque()
+
+        self._handler = EventHandler(self.synchronise, ("tick",), mode="match")
+        self._remove_handler = None
+
+        hive.add_dispose_callback(self._close)
+
+    @hive.typed_property("int")
+    def pending(self):
+        return len(self._pending)
+
+    def set_get_executor(self, get_executor):
+        self._get_shared_executor = get_executor
+
+    def set_add_handler(self, add_handler):
+        add_handler(self._handler)
+
+    def set_remove_handler(self, remove_handler):
+        self._remove_handler = remove_handler
+
+    def _get_executor(self):
+        if self._executor is None:
+            if self._get_shared_executor is not None:
+                self._executor = self._get_shared_executor()
+                return self._executor
+
+            self._executor = EXECUTOR_CLASSES[self.executor](max_workers=self.max_workers)
+            self._owns_executor = True
+
+        return self._executor
+
+    def submit(self):
+        """Submit a call of the function with the current arguments, unless the backlog is full"""
+        if self.max_pending and len(self._pending) >= self.max_pending:
+            self._hive._on_rejected()
+            return
+
+        future = self._get_executor().submit(self.function, *self.arguments)
+        self._pending.add(future)
+        future.add_done_callback(self._completed.append)
+
+    def cancel(self):
+        """Cancel pending calls. Calls which have already started run to completion, but their results are discarded"""
+        pending = self._pending
+        self._pending = set()
+
+        for future in pending:
+            future.cancel()
+
+    def synchronise(self):
+        """Push the results of calls which have completed, in order of completion"""
+        completed = self._completed
+        pending = self._pending
+
+        while completed:
+            future = completed.popleft()
+
+            # Cancelled
+            if future not in pending:
+                continue
+
+            pending.remove(future)
+
+            # Cancelled outside of the job (e.g. by the shutdown of a shared executor)
+            if future.cancelled():
+                self.error = CancelledError()
+                self._hive._on_error()
+                continue
+
+            error = future.exception()
+            if error is not None:
+                self.error = error
+                self._hive._on_error()
+
+            else:
+                self.result = future.result()
+                self._hive._on_result()
+
+    def _close(self):
+        if self._remove_handler is not None:
+            self._remove_handler(self._handler)
+            self._remove_handler = None
+
+        self.cancel()
+        self._completed.clear()
+
+        if self._owns_executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._owns_executor = False
+
+        self._executor = self._get_shared_executor = None
+
+
+def declare_job(meta_args):
+    meta_args.executor = hive.parameter("str", "thread", {"thread", "process"})
+    meta_args.result_type = hive.parameter("str", "")
+
+
+def build_job(cls, i, ex, args, meta_args):
+    """Call a function in a concurrent.futures executor, without blocking the tick.
+
+    Arguments pushed to arguments_in (or the current arguments, when submit is triggered) are submitted as a call of
+    the function pulled from function_in. Results are pushed to result_out on the first tick after the call completes
+    (or when synchronise is triggered), and exceptions raised by the call to error_out (as is a CancelledError for calls
+    cancelled by the executor). Calls of a process executor must be picklable.
+
+    The executor is created on first use (of thread or process workers), unless one is shared by a parent hive through
+    the "sys.executor" plugin. Cancelling discards the results of all pending calls. If max_pending is non-zero,
+    submissions are rejected (triggering on_rejected) whilst that many results are pending.
+    """
+    i.executor = hive.property(cls, "executor", "str", meta_args.executor)
+
+    i.function = hive.property(cls, "function")
+    i.pull_function = hive.pull_in(i.function)
+    ex.function_in = hive.antenna(i.pull_function)
+
+    i.arguments = hive.property(cls, "arguments", "tuple")
+    i.push_arguments = hive.push_in(i.arguments)
+    ex.arguments_in = hive.antenna(i.push_arguments)
+
+    i.do_submit = hive.triggerfunc(cls.submit)
+    hive.trigger(i.do_submit, i.pull_function, pretrigger=True)
+
+    i.submit = hive.triggerable(i.do_submit)
+    ex.submit = hive.entry(i.submit)
+    hive.trigger(i.push_arguments, i.submit)
+
+    i.do_cancel = hive.triggerable(cls.cancel)
+    ex.cancel = hive.entry(i.do_cancel)
+
+    i.do_synchronise = hive.triggerable(cls.synchronise)
+    ex.synchronise = hive.entry(i.do_synchronise)
+
+    i.result = hive.property(cls, "result", meta_args.result_type)
+    i.push_result = hive.push_out(i.result)
+    ex.result_out = hive.output(i.push_result)
+
+    i.on_result = hive.triggerfunc()
+    hive.trigger(i.on_result, i.push_result)
+
+    i.error = hive.property(cls, "error", "object")
+    i.push_error = hive.push_out(i.error)
+    ex.error_out = hive.output(i.push_error)
+
+    i.on_error = hive.triggerfunc()
+    hive.trigger(i.on_error, i.push_error)
+
+    i.on_rejected = hive.triggerfunc()
+    ex.on_rejected = hive.hook(i.on_rejected)
+
+    i.pull_pending = hive.pull_out(cls.pending)
+    ex.pending = hive.output(i.pull_pending)
+
+    ex.get_executor = hive.socket(cls.set_get_executor, "sys.executor", policy=hive.SingleOptional)
+    ex.get_add_handler = hive.socket(cls.set_add_handler, "event.add_handler", policy=hive.SingleOptional)
+    ex.get_remove_handler = hive.socket(cls.set_remove_handler, "event.remove_handler", policy=hive.SingleOptional)
+
+
+Job = hive.dyna_hive("Job", build_job, declare_job, builder_cls=_JobClass)
@@ -0,0 +1,259 @@
+from importlib import import_module
+import multiprocessing
+
+import hive
+
+from .process import ProcessClass, build_process
+
+
+def import_hive_class(hive_path):
+    """Import a hive class from its path (package.module.HiveName)
+
+    :param hive_path: path of hive class
+    """
+    module_name, _, class_name = hive_path.rpartition(".")
+    if not module_name:
+        raise ValueError("Hive path must include the module name: '{}'".format(hive_path))
+
+    return getattr(import_module(module_name), class_name)
+
+
+class _PoolWorkerClass(ProcessClass):
+
+    def __init__(self):
+        super().__init__()
+
+        self._hive = hive.get_run_hive()
+
+        self.connection = None
+        self.message_in = None
+        self.message_out = None
+
+    def run(self):
+        """Push messages received from the parent process to the hive, until the pool is stopped"""
+        connection = self.connection
+        self._hive.on_started()
+
+        try:
+            while True:
+                try:
+                    message = connection.recv()
+
+                except EOFError:
+                    break
+
+                # Stop sentinel
+                if message is None:
+                    break
+
+                self.message_in = message
+                self._hive._receive()
+
+        finally:
+            self._hive.on_stopped()
+            connection.close()
+
+    def send(self):
+        self.connection.send(self.message_out)
+
+
+def declare_pool_worker(meta_args):
+    meta_args.hive_path = hive.parameter("str")
+
+
+def build_pool_worker(cls, i, ex, args, meta_args):
+    """Host of a hive instance in a worker process of a HiveProcessPool"""
+    build_process(cls, i, ex, args)
+
+    i.hive = import_hive_class(meta_args.hive_path)()
+
+    # Messages from the parent process
+    i.message_in = hive.property(cls, "message_in")
+    i.push_message_in = hive.push_out(i.message_in)
+    hive.connect(i.push_message_in, i.hive.message_in)
+
+    i.receive = hive.triggerfunc()
+    hive.trigger(i.receive, i.push_message_in)
+
+    # Messages to the parent process
+    i.message_out = hive.property(cls, "message_out")
+    i.push_message_out = hive.push_in(i.message_out)
+    hive.connect(i.hive.message_out, i.push_message_out)
+
+    i.send = hive.triggerable(cls.send)
+    hive.trigger(i.push_message_out, i.send)
+
+    i.connection = hive.property(cls, "connection", "object")
+    i.push_connection = hive.push_in(i.connection)
+    ex.run = hive.antenna(i.push_connection)
+
+    i.run = hive.triggerable(cls.run)
+    hive.trigger(i.push_connection, i.run)
+
+
+HiveProcessPoolWorker = hive.dyna_hive("HiveProcessPoolWorker", build_pool_worker, declare_pool_worker,
+                                       builder_cls=_PoolWorkerClass)
+
+
+def run_pool_worker(hive_path, connection):
+    """Entry point of worker processes, instantiates the hive and pushes messages to it until stopped"""
+    worker = HiveProcessPoolWorker(hive_path=hive_path)
+    worker.run.push(connection)
+    worker.dispose()
+
+
+class _HiveProcessPoolClass:
+
+    @hive.types(processes='int')
+    def __init__(self, processes=1):
+        self._hive = hive.get_run_hive()
+
+        self.processes = processes
+        self.hive_path = None
+        self.start_method = None
+
+        self.message = None
+        self.received_message = None
+
+        # (process, connection) pairs, indexed by process ID
+        self._workers = []
+
+        hive.add_dispose_callback(self._close)
+
+    def start(self):
+        if self._workers:
+            raise RuntimeError("Process pool is already running")
+
+        # Build the worker hive class before forking, so that workers only instantiate it
+        HiveProcessPoolWorker.prebuild(hive_path=self.hive_path)
+
+        start_method = None if self.start_method == "default" else self.start_method
+        context = multiprocessing.get_context(start_method)
+
+        for _ in range(self.processes):
+            connection, worker_connection = context.Pipe()
+            process = context.Process(target=run_pool_worker, args=(self.hive_path, worker_connection), daemon=True)
+            process.start()
+
+            # Only the worker may hold its end of the pipe, so that the pool receives EOF when the worker exits
+            worker_connection.close()
+            self._workers.append((process, connection))
+
+    def stop(self):
+        self._shutdown(dispatch=True)
+
+    def _close(self):
+        self._shutdown(dispatch=False)
+
+    def _shutdown(self, dispatch):
+        """Stop the worker processes, receiving any messages sent before they exited
+
+        :param dispatch: push received messages to the message_out output
+        """
+        workers = self._workers
+        self._workers = []
+
+        for process, connection in workers:
+            try:
+                connection.send(None)
+
+            except OSError:
+                pass
+
+        for process_id, (process, connection) in enumerate(workers):
+            while True:
+                try:
+                    data = connection.recv()
+
+                except (EOFError, OSError):
+                    break
+
+                if dispatch:
+                    self._dispatch(process_id, data)
+
+            process.join()
+            connection.close()
+
+    def _dispatch(self, process_id, data):
+        self.received_message = process_id, data
+        self._hive._on_received()
+
+    def send(self):
+        process_id, data = self.message
+        self._workers[process_id][1].send(data)
+
+    def broadcast(self):
+        for process, connection in self._workers:
+            connection.send(self.message)
+
+    def synchronise(self):
+        """Push messages received from worker processes to the message_out output"""
+        for process_id, (process, connection) in enumerate(self._workers):
+            while connection.poll():
+                try:
+                    data = connection.recv()
+
+                except EOFError:
+                    break
+
+                self._dispatch(process_id, data)
+
+
+def declare_process_pool(meta_args):
+    meta_args.hive_path = hive.parameter("str")
+    meta_args.start_method = hive.parameter("str", "default", {"default", "fork", "spawn", "forkserver"})
+
+
+def build_process_pool(cls, i, ex, args, meta_args):
+    """Run independent instances of a hive in worker processes.
+
+    The hive class is imported from hive_path (package.module.HiveName), and must export message_in (antenna of a
+    push_in) and message_out (output of a push_out). Messages are exchanged as (process_id, data) tuples, and are
+    pushed to message_out when the pool is synchronised (e.g. each tick). Hives within workers receive the
+    on_started and on_stopped callbacks of a Process.
+    """
+    i.hive_path = hive.property(cls, "hive_path", "str", meta_args.hive_path)
+    i.start_method = hive.property(cls, "start_method", "str", meta_args.start_method)
+
+    i.processes = hive.property(cls, "processes", "int")
+    i.pull_processes = hive.pull_out(i.processes)
+    ex.processes = hive.output(i.pull_processes)
+
+    i.do_start = hive.triggerable(cls.start)
+    i.do_stop = hive.triggerable(cls.stop)
+    ex.start = hive.entry(i.do_start)
+    ex.stop = hive.entry(i.do_stop)
+
+    # Run the pool with the enclosing process
+    ex.on_started = hive.plugin(cls.start, identifier="on_started")
+    ex.on_stopped = hive.plugin(cls.stop, identifier="on_stopped")
+
+    # Messages to worker processes
+    i.message = hive.property(cls, "message", "tuple")
+    i.push_message = hive.push_in(i.message)
+    ex.message_in = hive.antenna(i.push_message)
+
+    i.do_send = hive.triggerable(cls.send)
+    hive.trigger(i.push_message, i.do_send)
+
+    i.broadcast_message = hive.property(cls, "message")
+    i.push_broadcast_message = hive.push_in(i.broadcast_message)
+    ex.broadcast = hive.antenna(i.push_broadcast_message)
+
+    i.do_broadcast = hive.triggerable(cls.broadcast)
+    hive.trigger(i.push_broadcast_message, i.do_broadcast)
+
+    # Messages from worker processes
+    i.received_message = hive.property(cls, "received_message", "tuple")
+    i.push_received_message = hive.push_out(i.received_message)
+    ex.message_out = hive.output(i.push_received_message)
+
+    i.on_received = hive.triggerfunc()
+    hive.trigger(i.on_received, i.push_received_message)
+
+    i.do_synchronise = hive.triggerable(cls.synchronise)
+    ex.synchronise = hive.entry(i.do_synchronise)
+
+
+HiveProcessPool = hive.dyna_hive("HiveProcessPool", build_process_pool, declare_process_pool,
+                                 builder_cls=_HiveProcessPoolClass)
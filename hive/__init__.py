@@ -26,26 +26,32 @@ logging_config = {
 logging.config.dictConfig(logging_config)
 
 from .hive import (hive, dyna_hive, meta_hive, HiveBuilder, RuntimeHive, MetaHivePrimitive, HiveObject,
-                   validate_external_name, validate_internal_name)
+                   validate_external_name, validate_internal_name, add_dispose_callback, set_hive_object_class_cache_size,
+                   get_hive_object_class_statistics, HiveObjectClassInfo)
 from .typing import (data_types_match, MatchFlags, parse_type_string, data_type_is_untyped, is_valid_data_type,
                      find_matching_ast, type_asts_match, CompositeType, SimpleType, SequenceType, MappingType, Type,
                      TypeName, AnyType, get_base_data_type)
 from .identifier import is_valid_identifier
 from .contexts import (get_building_hive, get_mode, get_run_hive, get_matchmaker_validation_enabled, set_matchmaker_validation_enabled,
                        matchmaker_validation_enabled_as)
-from .manager import memo_property, memoize, MemoProperty, ModeFactory
+from .manager import memo_property, memoize, MemoProperty, MemoInfo, get_memo_statistics, ModeFactory
 
 # i primitives
 from .triggerfunc import triggerfunc
 from .triggerable import triggerable
-from .modifier import modifier
-from .ppin import push_in, pull_in
+from .modifier import modifier, async_modifier
+from .ppin import push_in, pull_in, async_pull_in
 from .ppout import push_out, pull_out
 
 # connection primitives
 from .connect import connect
 from .trigger import trigger
 
+# runtime optimisation
+from .compiler import compile_hive
+from .profiler import profile_build, BuildProfiler
+from .freezer import freeze_hive
+
 # i/ex primitives
 from .property import property
 from .variable import variable
@@ -62,7 +68,7 @@ from .output import output
 
 # args primitives
 from .parameter import parameter
-from .exception import HiveException
+from .exception import HiveException, FreezeError
 
 from .annotations import (types, options, return_type, get_argument_options, get_argument_types, get_return_type,
                           update_wrapper, typed_property)
@@ -1,4 +1,4 @@
-from .manager import ModeFactory
+from .manager import ModeFactory, memoize
 from .protocols import Bee, Antenna, Exportable
 
 
@@ -14,6 +14,7 @@ class HiveAntenna(Exportable, Antenna):
 
         super().__init__()
 
+    @memoize
     def export(self):
         # TODO: somehow log the redirection path
         target = self._target
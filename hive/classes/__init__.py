@@ -2,5 +2,7 @@ HIVE_OBJECT_NAMES = ("parent", "implements", "instantiate")
 
 from .hive_class_proxy import HiveClassProxy
 from .hive_wrappers import HiveExportableWrapper, HiveInternalWrapper, HiveArgsWrapper, HiveMetaArgsWrapper
+from .identifier_namespace import IdentifierNamespace
+from .lazy_endpoint import LazyEndpoint
 from .pusher import Pusher
-
+from .task_set import TaskSet
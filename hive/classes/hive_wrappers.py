@@ -1,11 +1,66 @@
 from abc import ABC, abstractproperty
 from collections import OrderedDict, namedtuple
+from keyword import iskeyword
 
 from ..compatability import next
 from ..protocols import Bee, Exportable, Parameter
 
 HiveArgsExtraction = namedtuple("HiveArgsExtraction", "args kwargs parameter_values")
 
+# Maximum number of frozen views cached by each args wrapper
+FROZEN_VIEW_CACHE_SIZE = 128
+
+_BINDER_ARGS_NAME = "_hive_binder_args"
+_BINDER_KWARGS_NAME = "_hive_binder_kwargs"
+
+_BINDER_TEMPLATE = """
+def bind({parameters}*{args}, **{kwargs}):
+{checks}    return HiveArgsExtraction({args}, {kwargs}, ({values}))
+"""
+
+
+def compile_binder(parameters):
+    """Compile a function which binds call arguments to parameters, as a Python call would.
+
+    The function returns a HiveArgsExtraction, and raises TypeError if the arguments cannot be bound (including if a
+    parameter is given both positionally and by keyword). Return None if the parameter names cannot be used as Python
+    argument names.
+
+    :param parameters: sequence of (name, Parameter) pairs, in order
+    """
+    names = [name for name, parameter in parameters]
+    if not all(name.isidentifier() and not iskeyword(name) for name in names):
+        return None
+
+    if _BINDER_ARGS_NAME in names or _BINDER_KWARGS_NAME in names:
+        return None
+
+    namespace = {"HiveArgsExtraction": HiveArgsExtraction, "no_value": Parameter.no_value}
+    declarations = []
+    checks = []
+    has_default = False
+
+    for i, (name, parameter) in enumerate(parameters):
+        if parameter.start_value is not Parameter.no_value:
+            default_name = "_default_{}".format(i)
+            namespace[default_name] = parameter.start_value
+            declarations.append("{}={}, ".format(name, default_name))
+            has_default = True
+
+        # Required parameters may not follow optional parameters in Python signatures
+        elif has_default:
+            declarations.append("{}=no_value, ".format(name))
+            checks.append("    if {} is no_value:\n        raise TypeError('{}')\n".format(name, name))
+
+        else:
+            declarations.append("{}, ".format(name))
+
+    source = _BINDER_TEMPLATE.format(parameters="".join(declarations), args=_BINDER_ARGS_NAME,
+                                     kwargs=_BINDER_KWARGS_NAME, checks="".join(checks),
+                                     values="".join("{}, ".format(name) for name in names))
+    exec(source, namespace)
+    return namespace["bind"]
+
 
 class MappingObject(object):
     def __init__(self, validator=None):
@@ -183,7 +238,16 @@ class HiveArgsWrapperView(MappingObject):
 
 
 class HiveArgsWrapperBase(MappingObject):
-    """Base class for hive argument wrappers"""
+    """Base class for hive argument wrappers
+
+    Arguments are bound to parameters by a function compiled for the current parameters, and frozen views are cached
+    for hashable parameter values.
+    """
+
+    # Compiled binder, or False if the parameters cannot be compiled
+    _binder = None
+    _frozen_views = None
+    _options = None
 
     def _validate_attribute(self, name, value):
         super()._validate_attribute(name, value)
@@ -194,24 +258,63 @@ class HiveArgsWrapperBase(MappingObject):
 
         value._hive_parameter_name = name
 
+        self._invalidate_compiled()
+
+    def __delattr__(self, name):
+        super().__delattr__(name)
+
+        self._invalidate_compiled()
+
+    def _invalidate_compiled(self):
+        self._binder = None
+        self._frozen_views = None
+        self._options = None
+
     def freeze(self, parameter_values):
         """Resolve all parameter values with their parameter objects and return FrozenHiveArgs view
 
         :param parameter_values: parameter values returned from extract_parameter_values
         """
-        parameter_dict = {}
+        frozen_views = self._frozen_views
+        if frozen_views is None:
+            frozen_views = self._frozen_views = {}
+
+        # Views are read-only, so may be shared between HiveObjects with the same parameter values (of the same types,
+        # as 1 == 1.0 == True)
+        key = parameter_values, tuple(map(type, parameter_values))
+
+        try:
+            return frozen_views[key]
+
+        except KeyError:
+            pass
 
-        for param_name, parameter_value in zip(self._members, parameter_values):
-            parameter = self._members[param_name]
+        except TypeError:
+            return self._freeze(parameter_values)
 
-            options = parameter.options
-            if options is not None and parameter_value not in options:
-                raise ValueError("{} is not in the permitted options {} for {}".format(repr(parameter_value), options,
-                                                                                       param_name))
+        view = self._freeze(parameter_values)
 
-            parameter_dict[param_name] = parameter_value
+        if len(frozen_views) >= FROZEN_VIEW_CACHE_SIZE:
+            frozen_views.clear()
 
-        return HiveArgsWrapperView(self, parameter_dict)
+        frozen_views[key] = view
+        return view
+
+    def _freeze(self, parameter_values):
+        options = self._options
+        if options is None:
+            options = self._options = [(i, param_name, parameter.options)
+                                       for i, (param_name, parameter) in enumerate(self._members.items())
+                                       if parameter.options is not None]
+
+        for i, param_name, param_options in options:
+            parameter_value = parameter_values[i]
+
+            if parameter_value not in param_options:
+                raise ValueError("{} is not in the permitted options {} for {}".format(repr(parameter_value),
+                                                                                       param_options, param_name))
+
+        return HiveArgsWrapperView(self, dict(zip(self._members, parameter_values)))
 
     def extract_from_args(self, args, kwargs):
         """Extract parameter values from arguments and keyword arguments provided to the building hive.
@@ -221,6 +324,22 @@ class HiveArgsWrapperBase(MappingObject):
         :param args: tuple of argument values
         :param kwargs: dict of keyword name value pairs
         """
+        binder = self._binder
+        if binder is None:
+            binder = self._binder = compile_binder(tuple(self._members.items())) or False
+
+        if binder:
+            # Arguments which cannot be bound by a Python call are bound by the general rules, which permit some
+            # calls that Python would not, and raise the appropriate errors
+            try:
+                return binder(*args, **kwargs)
+
+            except TypeError:
+                pass
+
+        return self._extract_from_args(args, kwargs)
+
+    def _extract_from_args(self, args, kwargs):
         parameter_values = []
         use_args = True
         iter_args = iter(args)
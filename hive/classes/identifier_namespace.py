@@ -0,0 +1,39 @@
+class IdentifierNamespace(object):
+    """Scoped mapping from identifiers to the tuple of items registered with them.
+
+    A child namespace sees the items registered with its ancestors without copying them. Items registered with a child
+    are visible to its own descendants, but not to its parent or siblings.
+
+    Ancestors must not be modified once they have children, so that lookups can be cached by each namespace.
+    """
+    __slots__ = ("_parent", "_items")
+
+    def __init__(self, parent=None):
+        self._parent = parent
+        self._items = {}
+
+    def child(self):
+        """Return a new child namespace"""
+        return self.__class__(self)
+
+    def __getitem__(self, identifier):
+        try:
+            return self._items[identifier]
+
+        except KeyError:
+            pass
+
+        parent = self._parent
+        items = self._items[identifier] = () if parent is None else parent[identifier]
+        return items
+
+    def __contains__(self, identifier):
+        return bool(self[identifier])
+
+    def register(self, identifier, item):
+        """Register an item with an identifier
+
+        :param identifier: identifier
+        :param item: item to register
+        """
+        self._items[identifier] = self[identifier] + (item,)
@@ -0,0 +1,37 @@
+class LazyEndpoint(object):
+    """Stand-in for a bee of a lazy child hive, which is connected to (or triggered by) a bee of its parent hive.
+
+    The child hive is materialised when the endpoint is first called, after which calls are forwarded to the function
+    resolved from the bound bee.
+    """
+    __slots__ = ("_run_hive", "_lazy_children", "_func")
+
+    def __init__(self, run_hive, lazy_children):
+        self._run_hive = run_hive
+        self._lazy_children = lazy_children
+        self._func = None
+
+    def resolve(self, func):
+        """Forward calls to the function of the bound bee
+
+        :param func: callable of the bound bee
+        """
+        assert callable(func)
+        self._func = func
+
+    def __call__(self, *args, **kwargs):
+        func = self._func
+
+        if func is None:
+            self._run_hive._hive_materialise(self._lazy_children)
+            func = self._func
+
+        return func(*args, **kwargs)
+
+    def _hive_trigger_target(self):
+        return self
+
+    push = pull = __call__
+
+    def __repr__(self):
+        return "LazyEndpoint({!r}, {!r})".format(self._lazy_children, self._func)
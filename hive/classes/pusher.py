@@ -1,17 +1,100 @@
 from weakref import ref
 
 
+def _push_nothing(*args, **kwargs):
+    pass
+
+
+def _push_two(first, second):
+    def push(*args, **kwargs):
+        first(*args, **kwargs)
+        second(*args, **kwargs)
+
+    return push
+
+
+def _push_three(first, second, third):
+    def push(*args, **kwargs):
+        first(*args, **kwargs)
+        second(*args, **kwargs)
+        third(*args, **kwargs)
+
+    return push
+
+
+def _push_many(targets):
+    def push(*args, **kwargs):
+        for target in targets:
+            # TODO: exception handling
+            target(*args, **kwargs)
+
+    return push
+
+
+def specialise_push(targets):
+    """Return a callable which calls each target in order, specialised for the number of targets
+
+    :param targets: sequence of callables
+    """
+    targets = tuple(targets)
+    count = len(targets)
+
+    if count == 0:
+        return _push_nothing
+
+    if count == 1:
+        return targets[0]
+
+    if count == 2:
+        return _push_two(*targets)
+
+    if count == 3:
+        return _push_three(*targets)
+
+    return _push_many(targets)
+
+
 class Pusher(object):
+    """Calls a list of targets with the same arguments.
 
-    def __init__(self, parent):
+    The push attribute is re-specialised whenever the targets change (a no-op, the target itself, or an unrolled loop).
+    Owners which call the pusher frequently can ask for the specialised callable to be bound to one of their own
+    attributes (bind_as), which is kept up to date.
+    """
+    __slots__ = ("_targets", "_parent", "_bind_as", "push")
+
+    def __init__(self, parent, bind_as=None):
         self._targets = []
         self._parent = ref(parent)
+        self._bind_as = bind_as
+
+        self._specialise()
+
+    def _specialise(self):
+        push = self.push = specialise_push(self._targets)
+
+        if self._bind_as is not None:
+            parent = self._parent()
+
+            if parent is not None:
+                setattr(parent, self._bind_as, push)
 
     def add_target(self, target):
         assert callable(target)
         self._targets.append(target)
+        self._specialise()
 
-    def push(self, *args, **kwargs):
-        for target in self._targets:
-            # TODO: exception handling
-            target(*args, **kwargs)
+    def replace_target(self, old, new):
+        """Replace a target, keeping its position
+
+        :param old: existing target
+        :param new: replacement target
+        """
+        assert callable(new)
+        targets = self._targets
+        targets[targets.index(old)] = new
+        self._specialise()
+
+    def clear(self):
+        self._targets.clear()
+        self._specialise()
@@ -0,0 +1,40 @@
+from asyncio import get_running_loop
+
+
+class TaskSet(object):
+    """Schedules coroutines as tasks on the running event loop, holding them until they are done.
+
+    The event loop holds only weak references to tasks, so tasks which are not otherwise referenced could be garbage
+    collected before they finish.
+    """
+    __slots__ = ("_tasks",)
+
+    def __init__(self):
+        self._tasks = set()
+
+    def __len__(self):
+        return len(self._tasks)
+
+    def create_task(self, coroutine):
+        """Schedule a coroutine on the running event loop, returning its task
+
+        :param coroutine: coroutine object
+        """
+        try:
+            loop = get_running_loop()
+
+        except RuntimeError:
+            coroutine.close()
+            raise RuntimeError("Asynchronous bees must be triggered whilst an asyncio event loop is running")
+
+        task = loop.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def cancel(self):
+        """Cancel all pending tasks"""
+        for task in list(self._tasks):
+            task.cancel()
+
+        self._tasks.clear()
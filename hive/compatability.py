@@ -1,4 +1,5 @@
 from inspect import isfunction
+from weakref import WeakKeyDictionary
 
 
 try:
@@ -23,8 +24,41 @@ def is_method(func):
     return isfunction(func)
 
 
+# Call shapes (number of positional arguments, and keyword names) for which signatures have been validated
+_validated_signature_shapes = WeakKeyDictionary()
+
+
 def validate_signature(obj, *args, **kwargs):
-    """Check call signature is satisfied by provided args"""
+    """Check call signature is satisfied by provided args.
+
+    Validation depends only on the number of positional arguments and the keyword names, so each shape is validated
+    once for weakly referenceable objects (e.g. classes)
+    """
+    shape = len(args), frozenset(kwargs)
+
+    try:
+        validated_shapes = _validated_signature_shapes[obj]
+
+    except KeyError:
+        validated_shapes = None
+
+    except TypeError:
+        _validate_signature(obj, args, kwargs)
+        return
+
+    else:
+        if shape in validated_shapes:
+            return
+
+    _validate_signature(obj, args, kwargs)
+
+    if validated_shapes is None:
+        validated_shapes = _validated_signature_shapes[obj] = set()
+
+    validated_shapes.add(shape)
+
+
+def _validate_signature(obj, args, kwargs):
     try:
         from inspect import signature
 
@@ -0,0 +1,245 @@
+"""Fusion of the static push and trigger chains of runtime hives into generated functions.
+
+Pushing a value from a push_out to a push_in, and triggering the bees which follow, dispatches through several layers
+(Pusher instances, bound methods, setters). compile_hive() generates a function for each push_out and push_in, which
+calls the underlying callables directly, inlining the push_ins, push_outs, triggerables and modifiers that follow.
+The pushers of the runtime hive are then redirected to these functions.
+
+Chains are compiled from the connections which exist when compile_hive() is called; the runtime hive must be compiled
+again if connections are later added.
+"""
+from functools import partial
+
+from .contexts import building_hive_as, hive_mode_as
+from .hive import RuntimeHive
+from .modifier import Modifier
+from .ppin import PushIn
+from .ppout import PushOut
+from .triggerable import Triggerable
+
+# Maximum number of push_outs and push_ins inlined into a single function
+MAX_INLINE_DEPTH = 8
+
+
+def iter_bound_bees(run_hive):
+    """Yield the bees bound to a runtime hive, and to its (materialised) child hives
+
+    :param run_hive: runtime hive
+    """
+    visited = set()
+    run_hives = [run_hive]
+
+    while run_hives:
+        run_hive = run_hives.pop()
+
+        if run_hive._hive_disposed:
+            raise ValueError("Cannot compile disposed runtime hive {}".format(run_hive))
+
+        hive_object = run_hive._hive_object
+        deferred_steps = set(run_hive._hive_deferred_steps or ())
+
+        with building_hive_as(hive_object.__class__), hive_mode_as("build"):
+            for step in hive_object._hive_instantiation_plan.steps:
+                if not step.bindable or step in deferred_steps:
+                    continue
+
+                # Bound bees are memoized, so this returns the bee bound during instantiation
+                instance = step.bee.getinstance(hive_object).bind(run_hive)
+
+                if instance is None or id(instance) in visited:
+                    continue
+
+                visited.add(id(instance))
+
+                if isinstance(instance, RuntimeHive):
+                    run_hives.append(instance)
+
+                else:
+                    yield instance
+
+
+def _get_bound_method(target, func):
+    """Return the bee to which target is bound, if target is a bound method of func, otherwise None.
+
+    Bees whose classes override func are not matched
+
+    :param target: callable
+    :param func: function of the bee class
+    """
+    if getattr(target, "__func__", None) is not func:
+        return None
+
+    return target.__self__
+
+
+class FusionCompiler(object):
+    """Generate fused functions for push_outs and push_ins"""
+
+    def __init__(self):
+        self._namespace = {}
+        self._constant_names = {}
+        self._function_names = {}
+        self._pending = []
+        self._sources = []
+
+    def _constant(self, obj):
+        """Return the name under which a constant is stored in the namespace of the generated functions"""
+        try:
+            return self._constant_names[id(obj)]
+
+        except KeyError:
+            name = self._constant_names[id(obj)] = "c{}".format(len(self._constant_names))
+            self._namespace[name] = obj
+            return name
+
+    def function_name(self, bee):
+        """Return the name of the fused function for a push_out or push_in, compiling it later if required
+
+        :param bee: PushOut or PushIn instance
+        """
+        try:
+            return self._function_names[bee]
+
+        except KeyError:
+            name = self._function_names[bee] = "fused_{}_{}".format(bee.__class__.__name__.lower(),
+                                                                    len(self._function_names))
+            self._pending.append(bee)
+            return name
+
+    def _emit_trigger(self, target, lines, stack):
+        """Emit a call to a trigger target (a callable without arguments)"""
+        push_out = _get_bound_method(target, PushOut.push)
+        if push_out is not None:
+            if push_out in stack or len(stack) >= MAX_INLINE_DEPTH:
+                lines.append("{}()".format(self.function_name(push_out)))
+
+            else:
+                self._emit_push_out(push_out, lines, stack)
+
+            return
+
+        triggerable = _get_bound_method(target, Triggerable.trigger)
+        if triggerable is not None:
+            self._emit_trigger(triggerable._func, lines, stack)
+            return
+
+        modifier = _get_bound_method(target, Modifier.trigger)
+        if modifier is not None:
+            lines.append("{}({})".format(self._constant(modifier._func), self._constant(modifier._run_hive)))
+            return
+
+        lines.append("{}()".format(self._constant(target)))
+
+    def _emit_push_out(self, push_out, lines, stack):
+        stack = stack + (push_out,)
+        value_name = "value_{}".format(len(stack))
+
+        for target in push_out._pretrigger._targets:
+            self._emit_trigger(target, lines, stack)
+
+        lines.append("{} = {}()".format(value_name, self._constant(push_out._get_value)))
+
+        for target in push_out._targets:
+            push_in = _get_bound_method(target, PushIn.push)
+
+            if push_in is None:
+                lines.append("{}({})".format(self._constant(target), value_name))
+
+            elif push_in in stack or len(stack) >= MAX_INLINE_DEPTH:
+                lines.append("{}({})".format(self.function_name(push_in), value_name))
+
+            else:
+                self._emit_push_in(push_in, value_name, lines, stack)
+
+        for target in push_out._trigger._targets:
+            self._emit_trigger(target, lines, stack)
+
+    def _emit_push_in(self, push_in, value_name, lines, stack):
+        stack = stack + (push_in,)
+
+        for target in push_in._pretrigger._targets:
+            self._emit_trigger(target, lines, stack)
+
+        lines.append("{}({})".format(self._constant(push_in._set_value), value_name))
+
+        for target in push_in._trigger._targets:
+            self._emit_trigger(target, lines, stack)
+
+    def _compile_pending(self):
+        while self._pending:
+            bee = self._pending.pop()
+            name = self._function_names[bee]
+            lines = []
+
+            if isinstance(bee, PushOut):
+                self._emit_push_out(bee, lines, ())
+                signature = "{}()".format(name)
+
+            else:
+                self._emit_push_in(bee, "value_0", lines, ())
+                signature = "{}(value_0)".format(name)
+
+            self._sources.append("def {}:\n    {}\n".format(signature, "\n    ".join(lines or ["pass"])))
+
+    def build(self):
+        """Generate the fused functions, and return a dictionary mapping each bee to its function"""
+        self._compile_pending()
+
+        source = "\n".join(self._sources)
+        exec(compile(source, "<hive fused chains>", "exec"), self._namespace)
+
+        return {bee: self._namespace[name] for bee, name in self._function_names.items()}
+
+
+def _get_direct_target(target, fused_functions):
+    """Return the callable which may replace a target in a pusher, or None if it should not be replaced"""
+    for func in (PushOut.push, PushIn.push):
+        bee = _get_bound_method(target, func)
+        if bee is not None:
+            return fused_functions.get(bee)
+
+    triggerable = _get_bound_method(target, Triggerable.trigger)
+    if triggerable is not None:
+        return _get_direct_target(triggerable._func, fused_functions) or triggerable._func
+
+    modifier = _get_bound_method(target, Modifier.trigger)
+    if modifier is not None:
+        return partial(modifier._func, modifier._run_hive)
+
+    return None
+
+
+def compile_hive(run_hive):
+    """Fuse the static push and trigger chains of a runtime hive (and its child hives) into generated functions.
+
+    The pushers of the runtime hive are redirected to the fused functions. Return a dictionary mapping each bound
+    push_out and push_in to its fused function.
+
+    :param run_hive: runtime hive (usually a root hive, after instantiation)
+    """
+    bees = list(iter_bound_bees(run_hive))
+    compiler = FusionCompiler()
+
+    for bee in bees:
+        push = getattr(bee, "push", None)
+
+        if _get_bound_method(push, PushOut.push) is not None or _get_bound_method(push, PushIn.push) is not None:
+            compiler.function_name(bee)
+
+    fused_functions = compiler.build()
+
+    # Redirect pushers
+    for bee in bees:
+        pushers = [getattr(bee, name) for name in ("_pretrigger", "_trigger") if hasattr(bee, name)]
+
+        for pusher in pushers:
+            for target in list(pusher._targets):
+                direct_target = _get_direct_target(target, fused_functions)
+
+                if direct_target is not None:
+                    pusher.replace_target(target, direct_target)
+
+        if isinstance(bee, PushOut):
+            bee._targets[:] = [_get_direct_target(target, fused_functions) or target for target in bee._targets]
+
+    return fused_functions
@@ -4,17 +4,58 @@ from operator import itemgetter
 
 from .contexts import get_mode, register_bee
 from .debug import get_debug_context
-from .exception import MatchFailedError
+from .exception import HiveConnectionError, MatchFailedError
 from .manager import memoize
 from .protocols import (ConnectSourceBase, ConnectSourceDerived, ConnectTargetBase, ConnectTargetDerived, Bee, Bindable,
                         Exportable)
-from .typing import get_match_score, find_matching_ast, MatchFlags, parse_type_string
+from .typing import find_scored_matching_ast, MatchFlags, parse_type_string, AnyType, CompositeType
 
 ConnectionCandidate = namedtuple("ConnectionCandidate", ("bee_name", "data_type"))
 
 _first_item = itemgetter(0)
 
 
+def get_connection_key(bee):
+    """Return the key under which a connect source or target is indexed: (mode, base type name).
+
+    The base type name is None for untyped bees. Bees can only connect if their modes are equal, and their base type
+    names are equal (or the target is untyped)
+
+    :param bee: connect source or target (exported bee)
+    """
+    type_ast = parse_type_string(bee.data_type)
+
+    if isinstance(type_ast, AnyType):
+        base_type = None
+
+    elif isinstance(type_ast, CompositeType):
+        base_type = type_ast.type
+
+    else:
+        base_type = type_ast.type_name[0]
+
+    return getattr(bee, "mode", None), base_type
+
+
+def iter_candidate_pairs(sources_by_key, targets_by_key):
+    """Yield pairs of connect source and target candidates which may connect, joining them by connection key
+
+    :param sources_by_key: mapping from connection key to connect source candidates
+    :param targets_by_key: mapping from connection key to connect target candidates
+    """
+    for (mode, base_type), source_candidates in sources_by_key.items():
+        # Any source may connect to an untyped target
+        untyped_targets = targets_by_key.get((mode, None), ())
+
+        if base_type is None:
+            target_candidates = untyped_targets
+
+        else:
+            target_candidates = targets_by_key.get((mode, base_type), ()) + untyped_targets
+
+        yield from product(source_candidates, target_candidates)
+
+
 def sorted_candidates_from_scored(scored_candidates):
     """Return sorted list of candidate pairs from list of scored candidates
     
@@ -26,17 +67,17 @@ def sorted_candidates_from_scored(scored_candidates):
 def find_connection_candidates(source_hive, target_hive):
     """Finds appropriate connections between ConnectionSources and ConnectionTargets
 
-    :param sources: connection sources
-    :param targets: connection targets
-    :param support_untyped_target: require target type definitions to be declared
+    :param source_hive: hive providing connection sources
+    :param target_hive: hive providing connection targets
     """
     scored_typed_candidates = []
     scored_untyped_candidates = []
 
-    sources = source_hive._hive_find_connect_sources()
-    targets = target_hive._hive_find_connect_targets()
+    # Only pairs with the same mode and base type (or an untyped target) can match
+    candidate_pairs = iter_candidate_pairs(source_hive._hive_find_connect_sources_by_key(),
+                                           target_hive._hive_find_connect_targets_by_key())
 
-    for source_candidate, target_candidate in product(sources, targets):
+    for source_candidate, target_candidate in candidate_pairs:
         source_bee = getattr(source_hive, source_candidate.bee_name)
         target_bee = getattr(target_hive, target_candidate.bee_name)
 
@@ -44,7 +85,7 @@ def find_connection_candidates(source_hive, target_hive):
         try:
             source_bee._hive_is_connectable_source(target_bee)
             target_bee._hive_is_connectable_target(source_bee)
-        except ConnectionError:
+        except HiveConnectionError:
             continue
 
         # Use new match API & score API
@@ -56,20 +97,19 @@ def find_connection_candidates(source_hive, target_hive):
 
         # First match without permitting untyped targets
         try:
-            match = find_matching_ast(left_ast, right_ast, MatchFlags.match_shortest)
+            _, typed_score = find_scored_matching_ast(left_ast, right_ast, MatchFlags.match_shortest)
 
         except MatchFailedError:
             # Then fall back on matching untyped targets
             try:
-                match = find_matching_ast(left_ast, right_ast, MatchFlags.match_shortest | MatchFlags.permit_any_target)
+                _, untyped_score = find_scored_matching_ast(left_ast, right_ast,
+                                                            MatchFlags.match_shortest | MatchFlags.permit_any_target)
             except MatchFailedError:
                 continue
 
-            untyped_score = get_match_score(match)
             scored_untyped_candidates.append((untyped_score, source_candidate, target_candidate))
 
         else:
-            typed_score = get_match_score(match)
             scored_typed_candidates.append((typed_score, source_candidate, target_candidate))
 
     # Sort candidates according to length of match (largest first)
@@ -84,9 +124,9 @@ def find_connection_candidates(source_hive, target_hive):
 
 
 # TODO allow multiple connections when they're all unique!
-def find_connection_between_hives(source_hive, target_hive):
-    """Find best connection between two runtime hives.
-    
+def find_connection_names_between_hives(source_hive, target_hive):
+    """Find names of the bees forming the best connection between two runtime hives.
+
     For each legal connection, first attempt to find typed target connection between source and target.
     If a typed target connection cannot be made, attempt a typed source untyped target connection
     """
@@ -104,34 +144,66 @@ def find_connection_between_hives(source_hive, target_hive):
                         .format(source_hive, target_hive, candidate_names))
 
     source_candidate, target_candidate = candidates[0]
+    return source_candidate.bee_name, target_candidate.bee_name
+
+
+def find_connection_between_hives(source_hive, target_hive):
+    """Find best connection between two runtime hives, returning the runtime bees"""
+    source_name, target_name = find_connection_names_between_hives(source_hive, target_hive)
 
     # Get runtime bees
-    source = getattr(source_hive, source_candidate.bee_name)
-    target = getattr(target_hive, target_candidate.bee_name)
+    source = getattr(source_hive, source_name)
+    target = getattr(target_hive, target_name)
 
     return source, target
 
 
-def resolve_endpoints(source, target):
-    """Find resolved endpoints for source/targets which are dervived connection sources/targets (Hives)"""
-    # TODO: register connection, or insert a listener function in between
+def resolve_endpoint_names(source, target):
+    """Find names of resolved endpoints for source/targets which are derived connection sources/targets (Hives).
+
+    Return a pair of names, where None indicates that the endpoint is used directly
+    """
     hive_source = isinstance(source, ConnectSourceDerived)
     hive_target = isinstance(target, ConnectTargetDerived)
 
     # Find appropriate bees to connect within respective hives
     if hive_source and hive_target:
-        source, target = find_connection_between_hives(source, target)
+        return find_connection_names_between_hives(source, target)
 
-    else:
-        if hive_source:
-            source = source._hive_get_connect_source(target)
+    if hive_source:
+        return source._hive_find_connect_source(target), None
+
+    if hive_target:
+        return None, target._hive_find_connect_target(source)
+
+    return None, None
+
+
+def resolve_endpoints(source, target):
+    """Find resolved endpoints for source/targets which are dervived connection sources/targets (Hives)"""
+    # TODO: register connection, or insert a listener function in between
+    source_name, target_name = resolve_endpoint_names(source, target)
 
-        elif hive_target:
-            target = target._hive_get_connect_target(source)
+    if source_name is not None:
+        source = getattr(source, source_name)
+
+    if target_name is not None:
+        target = getattr(target, target_name)
 
     return source, target
 
 
+def wire_connection(source, target):
+    """Connect resolved source and target, which have been found to be connectable"""
+    debug_context = get_debug_context()
+    if debug_context is not None:
+        debug_context.build_connection(source, target)
+
+    else:
+        target._hive_connect_target(source)
+        source._hive_connect_source(target)
+
+
 def build_connection(source, target):
     """Runtime connection builder between source and target"""
     source, target = resolve_endpoints(source, target)
@@ -140,21 +212,32 @@ def build_connection(source, target):
     source._hive_is_connectable_source(target)
     target._hive_is_connectable_target(source)
 
-    debug_context = get_debug_context()
-    if debug_context is not None:
-        debug_context.build_connection(source, target)
+    wire_connection(source, target)
 
-    else:
-        target._hive_connect_target(source)
-        source._hive_connect_source(target)
+
+def _get_resolution_key(endpoint):
+    """Return the part of the key of resolved endpoint names contributed by a bound endpoint.
+
+    Runtime hive classes are unique to a HiveObject class, so resolution can be shared between their instances
+    """
+    if isinstance(endpoint, (ConnectSourceDerived, ConnectTargetDerived)):
+        return endpoint.__class__
+
+    return None
 
 
 class Connection(Bindable):
 
-    def __init__(self, source, target):
+    def __init__(self, source, target, resolved_names=None):
         self._source = source
         self._target = target
 
+        # Resolved endpoint names, shared by the connections of a ConnectionBuilder
+        if resolved_names is None:
+            resolved_names = {}
+
+        self._resolved_names = resolved_names
+
         super().__init__()
 
     @memoize
@@ -168,7 +251,40 @@ class Connection(Bindable):
         if isinstance(target, Bindable):
             target = target.bind(run_hive)
 
-        return build_connection(source, target)
+        key = _get_resolution_key(source), _get_resolution_key(target)
+
+        try:
+            source_name, target_name = self._resolved_names[key]
+
+        except KeyError:
+            source_name, target_name = resolve_endpoint_names(source, target)
+            is_resolved = False
+
+        else:
+            is_resolved = True
+
+        if source_name is not None:
+            source = getattr(source, source_name)
+
+        if target_name is not None:
+            target = getattr(target, target_name)
+
+        # Connectability does not change between runtime hives of the same classes, so is only checked once
+        if not is_resolved:
+            # raises an Exception if incompatible
+            source._hive_is_connectable_source(target)
+            target._hive_is_connectable_target(source)
+
+            self._resolved_names[key] = source_name, target_name
+
+        return wire_connection(source, target)
+
+    def unbind(self, run_hive):
+        for bee in (self._source, self._target):
+            if isinstance(bee, Bindable):
+                bee.unbind(run_hive)
+
+        return super().unbind(run_hive)
 
     def __repr__(self):
         return "Connection({!r}, {!r})".format(self._source, self._target)
@@ -180,9 +296,12 @@ class ConnectionBuilder(Bee):
         self._source = source
         self._target = target
 
+        # Endpoint names resolved by the first connection bound for each pair of runtime hive classes
+        self._resolved_names = {}
+
         super().__init__()
 
-    @memoize
+    @memoize(weak_keys=True)
     def getinstance(self, hive_object):
         source = self._source
         target = self._target
@@ -203,7 +322,7 @@ class ConnectionBuilder(Bee):
             return build_connection(source, target)
 
         else:
-            return Connection(source, target)
+            return Connection(source, target, self._resolved_names)
 
     def __repr__(self):
         return "ConnectionBuilder({!r}, {!r})".format(self._source, self._target)
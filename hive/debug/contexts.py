@@ -1,3 +1,4 @@
+from contextvars import ContextVar
 from csv import writer as csv_writer
 from weakref import ref
 
@@ -9,18 +10,17 @@ from ..protocols import Nameable
 from .bees import DebugPushOutTarget, DebugPretriggerTarget, DebugPullInSource, DebugTriggerTarget
 
 
-_debug_context = None
+_debug_context = ContextVar("hive_debug_context", default=None)
 
 
 def get_debug_context():
-    return _debug_context
+    return _debug_context.get()
 
 
 def set_debug_context(context):
-    global _debug_context
     if context is not None:
-        assert _debug_context is None
-    _debug_context = context
+        assert _debug_context.get() is None
+    _debug_context.set(context)
 
 
 class DebugContextBase(object):
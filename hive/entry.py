@@ -1,4 +1,4 @@
-from .manager import ModeFactory
+from .manager import ModeFactory, memoize
 from .protocols import Bee, TriggerTarget, Exportable
 
 
@@ -13,6 +13,7 @@ class Entry(Exportable):
 
         super().__init__()
 
+    @memoize
     def export(self):
         # TODO: somehow log the redirection path
         target = self._target
@@ -21,6 +22,13 @@ class Entry(Exportable):
 
         return target
 
+    def implements(self, cls):
+        # The target implements TriggerTarget (see __init__)
+        if cls is TriggerTarget:
+            return True
+
+        return super().implements(cls)
+
     def __repr__(self):
         return "Entry({!r})".format(self._target)
 
@@ -6,6 +6,10 @@ class HiveConnectionError(HiveException):
     pass
 
 
+class FreezeError(HiveException):
+    pass
+
+
 # Matchmaking
 class MatchmakingPolicyError(HiveException):
     pass
@@ -0,0 +1,562 @@
+"""Ahead-of-time freezing of built hives into importable Python modules.
+
+freeze_hive() instantiates a reference runtime hive for a root HiveObject class, and emits the source of a module whose
+instantiate() function recreates the same runtime graph directly: builder-class instances are allocated and
+initialised, Stateful storage is assigned, bound bees are constructed from their runtime classes, and the connections
+and triggers made by the reference runtime hive (including plugin/socket bindings) are replayed.
+Builders, wrappers, ResolveBees and matchmaking are not invoked by the frozen module.
+
+Frozen runtime hives expose the same attributes (bees, child hives and Stateful values) as runtime hives, but do not
+support introspection of their HiveObject, disposal, or lazy instantiation (lazy child hives are instantiated eagerly).
+
+Builder classes, and functions used by bees, must be importable by their qualified names (not lambdas or closures).
+Builder-class arguments, and the values of Stateful bees, must be literals.
+"""
+import re
+from functools import partial
+from importlib import import_module
+from math import isfinite
+from types import MemberDescriptorType
+
+from .contexts import run_hive_as
+from .debug import DebugContextBase, get_debug_context
+from .exception import FreezeError
+from .hive import HiveBuilder, HiveObject, RuntimeHive
+from .modifier import Modifier
+from .plugin import HivePlugin
+from .ppin import PushIn, PullIn
+from .ppout import PushOut, PullOut
+from .property import Property
+from .protocols import Stateful
+from .socket import HiveSocket
+from .triggerable import Triggerable
+from .triggerfunc import TriggerFunc
+from .variable import Variable
+
+
+class FrozenRuntimeHive:
+    """Base class of runtime hive classes generated by freeze_hive()"""
+
+    __slots__ = ("_bee_names",)
+
+    def __iter__(self):
+        return iter(self._bee_names)
+
+    def __dir__(self):
+        return self._bee_names
+
+
+class FrozenSlot(Stateful):
+    """Stateful value held in a slot of a frozen runtime hive class (see Variable)"""
+
+    __slots__ = ("_slot", "data_type")
+
+    def __init__(self, slot, data_type):
+        self._slot = slot
+        self.data_type = data_type
+
+    def _hive_stateful_getter(self, run_hive):
+        return self._slot.__get__(run_hive)
+
+    def _hive_stateful_setter(self, run_hive, value):
+        self._slot.__set__(run_hive, value)
+
+    def _hive_stateful_bound_getter(self, run_hive):
+        return partial(self._slot.__get__, run_hive)
+
+    def _hive_stateful_bound_setter(self, run_hive):
+        return partial(self._slot.__set__, run_hive)
+
+
+class FrozenAttribute(Stateful):
+    """Stateful attribute of a builder-class instance of a frozen runtime hive (see Property)"""
+
+    __slots__ = ("_drone_attribute", "_attr", "data_type")
+
+    def __init__(self, drone_attribute, attr, data_type):
+        self._drone_attribute = drone_attribute
+        self._attr = attr
+        self.data_type = data_type
+
+    def _hive_stateful_getter(self, run_hive):
+        return getattr(getattr(run_hive, self._drone_attribute), self._attr)
+
+    def _hive_stateful_setter(self, run_hive, value):
+        setattr(getattr(run_hive, self._drone_attribute), self._attr, value)
+
+    def _hive_stateful_bound_getter(self, run_hive):
+        return partial(getattr, getattr(run_hive, self._drone_attribute), self._attr)
+
+    def _hive_stateful_bound_setter(self, run_hive):
+        return partial(setattr, getattr(run_hive, self._drone_attribute), self._attr)
+
+
+def frozen_drone_property(drone_attribute, attr):
+    """Return a descriptor which exposes an attribute of a builder-class instance of a frozen runtime hive
+
+    :param drone_attribute: attribute name of the builder-class instance
+    :param attr: attribute name of the value
+    """
+    def fget(run_hive):
+        return getattr(getattr(run_hive, drone_attribute), attr)
+
+    def fset(run_hive, value):
+        setattr(getattr(run_hive, drone_attribute), attr, value)
+
+    return property(fget, fset)
+
+
+class _WiringRecorder(DebugContextBase):
+    """Debug context which records the connections and triggers built whilst a reference runtime hive is instantiated"""
+
+    def __init__(self):
+        self.operations = []
+
+    def build_connection(self, source, target):
+        self.operations.append(("connect", source, target))
+
+        target._hive_connect_target(source)
+        source._hive_connect_source(target)
+
+    def build_trigger(self, source, target, pre):
+        self.operations.append(("pretrigger" if pre else "trigger", source, target))
+
+        target_func = target._hive_trigger_target()
+
+        if pre:
+            source._hive_pretrigger_source(target_func)
+
+        else:
+            source._hive_trigger_source(target_func)
+
+
+def _materialise_lazy_children(run_hive):
+    """Materialise the lazy child hives of a runtime hive, and of its child hives"""
+    pending = [run_hive]
+
+    while pending:
+        run_hive = pending.pop()
+        deferred_steps = run_hive._hive_deferred_steps
+
+        if deferred_steps:
+            run_hive._hive_materialise({name for step in deferred_steps for name in step.lazy_children})
+
+        pending.extend(instance for instance in run_hive._hive_bee_instances.values()
+                       if isinstance(instance, RuntimeHive))
+
+
+def _iter_runtime_hives(run_hive):
+    """Yield a runtime hive and its child hives, parents first"""
+    visited = set()
+    pending = [run_hive]
+
+    while pending:
+        run_hive = pending.pop(0)
+
+        if id(run_hive) in visited:
+            continue
+
+        visited.add(id(run_hive))
+        yield run_hive
+
+        pending.extend(instance for instance in run_hive._hive_bee_instances.values()
+                       if isinstance(instance, RuntimeHive))
+
+
+def _get_stateful_bees(hive_object_class):
+    """Return the (attribute name, bee) pairs of the Stateful bees of a HiveObject class (see _hive_build_runtime_class)
+    """
+    stateful_bees = [("_{}".format(bee_name), bee) for bee_name, bee in hive_object_class._hive_i._items
+                     if isinstance(bee, Stateful)]
+    stateful_bees.extend((bee_name, bee) for bee_name, bee in hive_object_class._hive_ex._items
+                         if isinstance(bee, Stateful))
+    return stateful_bees
+
+
+class HiveFreezer(object):
+    """Emit the source of a module which recreates the runtime graph of a reference runtime hive"""
+
+    # Bees constructed as <class>(<target>, <data_type>, <run_hive>)
+    typed_bee_classes = (PushIn, PullIn, PushOut, PullOut)
+    # Bees constructed as <class>(<func>, <data_type>, <run_hive>)
+    typed_func_bee_classes = (HivePlugin, HiveSocket)
+    # Bees constructed as <class>(<func>, <run_hive>)
+    func_bee_classes = (TriggerFunc, Triggerable, Modifier)
+
+    def __init__(self):
+        self._names = {}
+        # Hold referenced objects, so that their ids remain unique
+        self._objects = []
+
+        self._imports = {}
+        self._import_names = {}
+        self._import_lines = []
+
+        self._class_names = {}
+        self._class_sources = []
+
+        self._lines = []
+        self._name_counts = {}
+
+    def _new_name(self, prefix):
+        count = self._name_counts.get(prefix, 0)
+        self._name_counts[prefix] = count + 1
+        return "{}{}".format(prefix, count)
+
+    def _assign(self, obj, prefix, expression):
+        """Emit a statement assigning an expression to a new local name, which refers to obj"""
+        name = self._new_name(prefix)
+        self._lines.append("{} = {}".format(name, expression))
+        self._names[id(obj)] = name
+        self._objects.append(obj)
+        return name
+
+    def import_name(self, obj):
+        """Return an expression which refers to an importable class or function"""
+        try:
+            return self._imports[id(obj)]
+
+        except KeyError:
+            pass
+
+        module_name = getattr(obj, "__module__", None)
+        qualname = getattr(obj, "__qualname__", None)
+
+        if not (module_name and qualname) or "<" in qualname:
+            raise FreezeError("{!r} cannot be imported by the frozen module (it may be a lambda or closure)".format(obj))
+
+        value = import_module(module_name)
+        for part in qualname.split("."):
+            value = getattr(value, part, None)
+
+        if value is not obj:
+            raise FreezeError("{!r} is not importable as {}.{}".format(obj, module_name, qualname))
+
+        head, _, tail = qualname.partition(".")
+        import_key = module_name, head
+
+        try:
+            name = self._import_names[import_key]
+
+        except KeyError:
+            name = head
+            if name in self._import_names.values():
+                name = "{}_{}".format(head, len(self._import_names))
+
+            self._import_names[import_key] = name
+
+            if name == head:
+                self._import_lines.append("from {} import {}".format(module_name, head))
+
+            else:
+                self._import_lines.append("from {} import {} as {}".format(module_name, head, name))
+
+        expression = "{}.{}".format(name, tail) if tail else name
+        self._imports[id(obj)] = expression
+        self._objects.append(obj)
+        return expression
+
+    def literal(self, value):
+        """Return the source of a literal value"""
+        if value is None or isinstance(value, (bool, int, str, bytes)):
+            return repr(value)
+
+        if isinstance(value, float):
+            return repr(value) if isfinite(value) else "float({!r})".format(repr(value))
+
+        if isinstance(value, tuple):
+            return "({})".format("".join("{}, ".format(self.literal(v)) for v in value))
+
+        if isinstance(value, list):
+            return "[{}]".format(", ".join(self.literal(v) for v in value))
+
+        if isinstance(value, (set, frozenset)):
+            return "{}([{}])".format(type(value).__name__, ", ".join(self.literal(v) for v in value))
+
+        if isinstance(value, dict):
+            return "{{{}}}".format(", ".join("{}: {}".format(self.literal(k), self.literal(v))
+                                             for k, v in value.items()))
+
+        if isinstance(value, type):
+            return self.import_name(value)
+
+        raise FreezeError("Value {!r} cannot be frozen as a literal".format(value))
+
+    def expression(self, obj):
+        """Return an expression which refers to a runtime object, emitting statements to construct it if required"""
+        try:
+            return self._names[id(obj)]
+
+        except KeyError:
+            pass
+
+        if isinstance(obj, RuntimeHive):
+            raise FreezeError("Runtime hive {!r} does not belong to the frozen hive".format(obj))
+
+        if isinstance(obj, self.typed_bee_classes + self.typed_func_bee_classes + self.func_bee_classes):
+            return self._emit_bee(obj)
+
+        if isinstance(obj, partial):
+            arguments = [self.expression(obj.func)]
+            arguments.extend(self.expression(arg) for arg in obj.args)
+            arguments.extend("{}={}".format(key, self.expression(value)) for key, value in obj.keywords.items())
+            return "{}({})".format(self.import_name(partial), ", ".join(arguments))
+
+        if isinstance(obj, MemberDescriptorType):
+            try:
+                class_name = self._class_names[obj.__objclass__]
+
+            except KeyError:
+                raise FreezeError("Slot {!r} does not belong to a frozen runtime hive class".format(obj))
+
+            return "{}.{}".format(class_name, obj.__name__)
+
+        owner = getattr(obj, "__self__", None)
+        if owner is not None and not isinstance(owner, type(import_module)) and callable(obj):
+            name = obj.__name__
+
+            if getattr(owner, name, None) != obj:
+                raise FreezeError("Bound method {!r} cannot be frozen".format(obj))
+
+            if isinstance(owner, type):
+                return "{}.{}".format(self.import_name(owner), name)
+
+            return "{}.{}".format(self.expression(owner), name)
+
+        if isinstance(obj, type) or callable(obj):
+            return self.import_name(obj)
+
+        return self.literal(obj)
+
+    def _stateful_expression(self, bee, run_hive):
+        """Return an expression which constructs a Stateful stand-in for a bound Variable or Property
+
+        :param bee: Stateful bee
+        :param run_hive: runtime hive to which the bee is bound
+        """
+        if isinstance(bee, Variable) and bee._values is None:
+            slot = bee._get_value.__self__
+            return "{}({}, {})".format(self.import_name(FrozenSlot), self.expression(slot),
+                                       self.literal(bee.data_type))
+
+        if isinstance(bee, Property):
+            drone_attribute = run_hive._hive_drone_attributes[bee._cls]
+            return "{}({!r}, {!r}, {})".format(self.import_name(FrozenAttribute), drone_attribute, bee._attr,
+                                               self.literal(bee.data_type))
+
+        raise FreezeError("Stateful bee {!r} cannot be frozen".format(bee))
+
+    def _emit_bee(self, bee):
+        run_hive = self._names.get(id(bee._run_hive))
+        if run_hive is None:
+            raise FreezeError("Bee {!r} is not bound to a runtime hive of the frozen hive".format(bee))
+
+        cls = self.import_name(bee.__class__)
+
+        if isinstance(bee, self.typed_bee_classes):
+            target = bee.target
+
+            if isinstance(target, Stateful):
+                target = self._stateful_expression(target, bee._run_hive)
+
+            else:
+                target = self.expression(target)
+
+            return self._assign(bee, "bee_", "{}({}, {}, {})".format(cls, target, self.literal(bee.data_type),
+                                                                     run_hive))
+
+        func = "None" if bee._func is None else self.expression(bee._func)
+
+        if isinstance(bee, self.typed_func_bee_classes):
+            return self._assign(bee, "bee_", "{}({}, {}, {})".format(cls, func, self.literal(bee.data_type),
+                                                                     run_hive))
+
+        return self._assign(bee, "bee_", "{}({}, {})".format(cls, func, run_hive))
+
+    def _emit_class(self, run_hive_class, hive_object_class):
+        """Emit a FrozenRuntimeHive subclass with the attributes of a runtime hive class"""
+        class_name = "Frozen{}_{}".format(re.sub(r"\W", "_", hive_object_class._hive_parent_class.__name__),
+                                          len(self._class_names))
+        self._class_names[run_hive_class] = class_name
+
+        drone_attributes = run_hive_class._hive_drone_attributes
+
+        slots = tuple(name for name in run_hive_class.__slots__ if name != "__dict__")
+        if len(slots) != len(run_hive_class.__slots__):
+            slots += ("__dict__",)
+
+        body = ["__slots__ = {}".format(self.literal(slots))]
+        aliases = []
+
+        for attribute_name, bee in _get_stateful_bees(hive_object_class):
+            if bee.stateful_slot_storage:
+                slot = run_hive_class.__dict__[attribute_name]
+                if slot.__name__ != attribute_name:
+                    aliases.append((attribute_name, slot.__name__))
+
+            elif isinstance(bee, Property):
+                body.append("{} = {}({!r}, {!r})".format(attribute_name, self.import_name(frozen_drone_property),
+                                                         drone_attributes[bee._cls], bee._attr))
+
+            else:
+                raise FreezeError("Stateful bee {!r} cannot be frozen".format(bee))
+
+        source = "class {}({}):\n    {}\n".format(class_name, self.import_name(FrozenRuntimeHive),
+                                                   "\n\n    ".join(body))
+
+        if aliases:
+            source += "\n\n" + "\n".join("{0}.{1} = {0}.{2}".format(class_name, attribute_name, slot_name)
+                                         for attribute_name, slot_name in aliases)
+
+        self._class_sources.append(source)
+        return class_name
+
+    def _emit_runtime_hive(self, run_hive):
+        """Emit statements which allocate a runtime hive and its builder-class instances"""
+        run_hive_class = run_hive.__class__
+        hive_object = run_hive._hive_object
+
+        try:
+            class_name = self._class_names[run_hive_class]
+
+        except KeyError:
+            class_name = self._emit_class(run_hive_class, hive_object.__class__)
+
+        name = self._assign(run_hive, "hive_", "{}()".format(class_name))
+
+        # Exposed bees are assigned once the graph is constructed
+        self._lines.append("{}._bee_names = {!r}".format(name, list(run_hive._bee_names)))
+
+        drones = run_hive._hive_build_class_to_instance
+        for builder_cls, drone_attribute in run_hive_class._hive_drone_attributes.items():
+            drone_class = self.import_name(builder_cls)
+            drone_name = self._assign(drones[builder_cls], "drone_", "{0}.__new__({0})".format(drone_class))
+            self._lines.append("{}.{} = {}".format(name, drone_attribute, drone_name))
+
+        if drones:
+            arguments = [self.literal(arg) for arg in hive_object._hive_builder_args]
+            arguments.extend("{}={}".format(key, self.literal(value))
+                             for key, value in hive_object._hive_builder_kwargs.items())
+
+            self._lines.append("with {}({}):".format(self.import_name(run_hive_as), name))
+            for builder_cls in run_hive_class._hive_drone_attributes:
+                self._lines.append("    {}.__init__({})".format(self._names[id(drones[builder_cls])],
+                                                                ", ".join(arguments)))
+
+    def _emit_stateful_values(self, run_hive):
+        """Emit statements which assign the start values of the Stateful bees of a runtime hive"""
+        name = self._names[id(run_hive)]
+        assigned_slots = set()
+
+        for attribute_name, bee in _get_stateful_bees(run_hive._hive_object.__class__):
+            if bee.stateful_slot_storage:
+                slot_name = run_hive.__class__.__dict__[attribute_name].__name__
+                if slot_name in assigned_slots:
+                    continue
+
+                assigned_slots.add(slot_name)
+                self._lines.append("{}.{} = {}".format(name, slot_name, self.literal(getattr(run_hive, attribute_name))))
+
+            elif isinstance(bee, Property):
+                drone_name = self._names[id(run_hive._hive_build_class_to_instance[bee._cls])]
+
+                if bee.start_value is None:
+                    self._lines.append("if not hasattr({0}, {1!r}):\n    {0}.{2} = None".format(drone_name, bee._attr,
+                                                                                               bee._attr))
+
+                else:
+                    self._lines.append("{}.{} = {}".format(drone_name, bee._attr,
+                                                           self.literal(getattr(run_hive, attribute_name))))
+
+    def _emit_attribute(self, name, attribute_name, expression):
+        """Emit a statement which sets an attribute of a runtime hive"""
+        if attribute_name.isidentifier() and not attribute_name.startswith("__"):
+            self._lines.append("{}.{} = {}".format(name, attribute_name, expression))
+
+        else:
+            self._lines.append("setattr({}, {!r}, {})".format(name, attribute_name, expression))
+
+    def freeze(self, run_hive, operations):
+        """Return the source of a module which recreates the runtime graph of a runtime hive
+
+        :param run_hive: reference runtime hive, with materialised child hives
+        :param operations: (kind, source, target) connections and triggers made by the runtime hive
+        """
+        run_hives = list(_iter_runtime_hives(run_hive))
+
+        for child_hive in run_hives:
+            self._emit_runtime_hive(child_hive)
+
+        for child_hive in run_hives:
+            self._emit_stateful_values(child_hive)
+
+        for child_hive in run_hives:
+            name = self._names[id(child_hive)]
+
+            for bee_name, instance in child_hive._hive_bee_instances.items():
+                self._emit_attribute(name, bee_name, self.expression(instance))
+
+        for kind, source, target in operations:
+            if kind == "connect":
+                source, target = self.expression(source), self.expression(target)
+                self._lines.append("{}._hive_connect_target({})".format(target, source))
+                self._lines.append("{}._hive_connect_source({})".format(source, target))
+                continue
+
+            # Triggers of runtime hives are resolved to their trigger source and target bees
+            if isinstance(source, RuntimeHive):
+                source = source._hive_bee_instances[source._hive_object._hive_find_trigger_source()]
+
+            if isinstance(target, RuntimeHive):
+                target = target._hive_bee_instances[target._hive_object._hive_find_trigger_target()]
+
+            source, target = self.expression(source), self.expression(target)
+            self._lines.append("{}._hive_{}_source({}._hive_trigger_target())".format(source, kind, target))
+
+        self._lines.append("return {}".format(self._names[id(run_hive)]))
+
+        hive_name = run_hive._hive_object._hive_parent_class.__name__
+        sections = ['"""Frozen runtime graph of {}, generated by hive.freeze_hive()"""'.format(hive_name),
+                    "\n".join(sorted(self._import_lines))]
+        sections.extend(self._class_sources)
+        sections.append('def instantiate():\n    """Return a new frozen runtime hive"""\n    {}\n'.format(
+            "\n    ".join(line.replace("\n", "\n    ") for line in self._lines)))
+
+        return "\n\n\n".join(sections)
+
+
+def freeze_hive(hive_object_class, *args, **kwargs):
+    """Return the source of a module which instantiates the runtime graph of a root HiveObject class directly.
+
+    The module defines instantiate(), which returns a new frozen runtime hive:
+        with open("my_hive_frozen.py", "w") as f:
+            f.write(hive.freeze_hive(MyHive, 2, meta_arg=1))
+
+        from my_hive_frozen import instantiate
+
+    :param hive_object_class: root HiveObject class, or HiveBuilder (whose HiveObject class is built for the meta args
+    given in args and kwargs)
+    :param args: arguments passed to the HiveObject (and so to builder classes)
+    :param kwargs: keyword arguments passed to the HiveObject
+    """
+    if isinstance(hive_object_class, type) and issubclass(hive_object_class, HiveBuilder):
+        args, kwargs, hive_object_class = hive_object_class._hive_get_hive_object_class(args, kwargs)
+
+    if not (isinstance(hive_object_class, type) and issubclass(hive_object_class, HiveObject)):
+        raise TypeError("Expected a HiveObject class, not {!r}".format(hive_object_class))
+
+    if get_debug_context() is not None:
+        raise FreezeError("Hives cannot be frozen whilst a debug context is active")
+
+    hive_object = hive_object_class(*args, **kwargs)
+    recorder = _WiringRecorder()
+
+    with recorder:
+        run_hive = hive_object.instantiate()
+        _materialise_lazy_children(run_hive)
+
+    try:
+        return HiveFreezer().freeze(run_hive, recorder.operations)
+
+    finally:
+        run_hive.dispose()
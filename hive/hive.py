@@ -1,16 +1,23 @@
 from abc import ABC, abstractproperty
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+from functools import partial
+from weakref import WeakSet
 from itertools import count, chain
+from threading import RLock
 
-from .classes import HiveInternalWrapper, HiveExportableWrapper, HiveArgsWrapper, HiveMetaArgsWrapper, HiveClassProxy
+from .classes import (HiveInternalWrapper, HiveExportableWrapper, HiveArgsWrapper, HiveMetaArgsWrapper, HiveClassProxy,
+                      IdentifierNamespace, LazyEndpoint)
 from .compatability import next, validate_signature
-from .connect import connect, ConnectionCandidate
+from .connect import connect, get_connection_key, Connection, ConnectionCandidate
 from .contexts import (bee_register_context, get_mode, hive_mode_as, building_hive_as, run_hive_as,
-                       get_matchmaker_validation_enabled, get_building_hive)
+                       get_matchmaker_validation_enabled, get_building_hive, get_run_hive)
+from .debug import get_debug_context
 from .manager import memoize
 from .policies import MatchmakingPolicyError
+from .profiler import get_build_profiler, profile_section
 from .protocols import *
-from .resolve_bee import ResolveBee
+from .resolve_bee import ResolveBee, BindableResolveBee
+from .trigger import Trigger
 from .typing import MatchFlags, data_types_match
 
 
@@ -20,33 +27,272 @@ def generate_anonymous_names(fmt_string='anonymous_bee_{}'):
         yield fmt_string.format(i)
 
 
+# Maximum number of HiveObject classes (one for each distinct combination of meta args) cached by each HiveBuilder
+HIVE_OBJECT_CLASS_CACHE_SIZE = 256
+
+HiveObjectClassInfo = namedtuple("HiveObjectClassInfo", "cached live maxsize")
+
+# All HiveObject classes which are alive, including those evicted from the HiveBuilder cache
+_hive_object_classes = WeakSet()
+
+# Guards the first construction of the meta args wrapper of each HiveBuilder
+_meta_args_lock = RLock()
+
+
+def _canonicalise_meta_arg_value(value):
+    """Return hashable representation of a meta arg value.
+
+    Lists, tuples, sets and dicts are converted (recursively) to tuples tagged with the original type, so that values
+    of different types do not share a representation
+    """
+    if isinstance(value, (list, tuple)):
+        return type(value), tuple(_canonicalise_meta_arg_value(v) for v in value)
+
+    if isinstance(value, (set, frozenset)):
+        return type(value), frozenset(_canonicalise_meta_arg_value(v) for v in value)
+
+    if isinstance(value, dict):
+        items = [(_canonicalise_meta_arg_value(k), _canonicalise_meta_arg_value(v)) for k, v in value.items()]
+
+        try:
+            items.sort()
+
+        except TypeError:
+            items.sort(key=repr)
+
+        return type(value), tuple(items)
+
+    try:
+        hash(value)
+
+    except TypeError:
+        raise TypeError("Meta arg value {!r} is unhashable and cannot be canonicalised".format(value))
+
+    return value
+
+
+def _meta_arg_values_key(args):
+    """Return memoize cache key for the arguments of HiveBuilder._hive_build
+
+    :param args: tuple of (meta_arg_values,)
+    """
+    try:
+        hash(args)
+
+    except TypeError:
+        meta_arg_values, = args
+        return (tuple(_canonicalise_meta_arg_value(v) for v in meta_arg_values),)
+
+    return args
+
+
+InstantiationStep = namedtuple("InstantiationStep", "bee_name attribute_name bee bindable register_alias lazy_children "
+                                                    "lazy_endpoint")
+
+# Names of the external bees of a HiveObject class which are trigger and connect endpoints. Connect endpoints are also
+# bucketed by connection key (see get_connection_key)
+ExternalBeeIndex = namedtuple("ExternalBeeIndex", "trigger_sources trigger_targets connect_sources connect_targets "
+                                                  "connect_sources_by_key connect_targets_by_key")
+
+
+class InstantiationPlan:
+    """Flat record of the bees bound by RuntimeHive.__init__ for a HiveObject class.
+
+    Each step holds the bee of the HiveObject class (exported, for external bees), whether the bee returned by its
+    getinstance() is Bindable, the name used to alias the bound bee and the attribute name used to expose it on the
+    runtime hive (or None).
+
+    Steps which require lazy child hives hold the names of those hives, and the kind of LazyEndpoint (if any) which
+    materialises them when a bee of the parent hive first pushes, pulls or triggers.
+
+    Steps which bind, alias or expose a bee are also compiled into (attribute name, bee, binder) triples, whose binder
+    performs only the work of that step. HiveObjects of the same class do not share bee instances, so each HiveObject
+    resolves the bees of these triples with getinstance() once (see HiveObject._hive_get_bee_factories). Binding is
+    per runtime hive, so bind() is still called for each bindable bee of each runtime hive.
+    """
+
+    def __init__(self, steps):
+        self.steps = tuple(steps)
+
+        # Attributes exposed by steps which are deferred until lazy child hives are materialised
+        self.lazy_attributes = {step.attribute_name: step.lazy_children for step in self.steps
+                                if step.lazy_children and step.attribute_name is not None}
+        self.has_lazy_children = any(step.lazy_children for step in self.steps)
+
+        # Steps which neither bind, alias nor expose their bee have no effect when replayed
+        self.binders = tuple((step.attribute_name, step.bee, _get_step_binder(step)) for step in self.steps
+                             if step.bindable or step.register_alias or step.attribute_name is not None)
+
+    def __iter__(self):
+        return iter(self.steps)
+
+    def __len__(self):
+        return len(self.steps)
+
+    def __repr__(self):
+        return "InstantiationPlan({!r})".format(self.steps)
+
+
+def _get_step_binder(step):
+    """Return a function which binds the bee instance of an InstantiationStep to a runtime hive, returning the bound
+    bee (or None, for bees which bind to None)
+
+    :param step: InstantiationStep instance
+    """
+    bee_name = step.bee_name
+
+    if step.bindable:
+        if not step.register_alias:
+            return _bind_instance
+
+        def bind_and_alias(instance, run_hive):
+            bound_instance = instance.bind(run_hive)
+            bound_instance.register_alias(run_hive, bee_name)
+            return bound_instance
+
+        return bind_and_alias
+
+    if step.register_alias:
+        def alias(instance, run_hive):
+            instance.register_alias(run_hive, bee_name)
+            return instance
+
+        return alias
+
+    return _return_instance
+
+
+def _bind_instance(instance, run_hive):
+    return instance.bind(run_hive)
+
+
+def _return_instance(instance, run_hive):
+    return instance
+
+
+def _get_bee_instance(bee, hive_object, profiler):
+    """Return bee.getinstance(hive_object), recorded by the profiler unless it is None"""
+    if profiler is None:
+        return bee.getinstance(hive_object)
+
+    return profiler.call("getinstance", bee.__class__, bee.getinstance, hive_object)
+
+
+def _bind_bee_instance(instance, run_hive, profiler):
+    """Return instance.bind(run_hive), recorded by the profiler unless it is None"""
+    if profiler is None:
+        return instance.bind(run_hive)
+
+    return profiler.call("bind", instance.__class__, instance.bind, run_hive)
+
+
+def _get_lazy_child_name(bee, lazy_children):
+    """Return the name of the lazy child hive to which a bee (returned by getinstance()) belongs, or None
+
+    :param bee: bee instance
+    :param lazy_children: mapping from lazy child HiveObject to bee name
+    """
+    if isinstance(bee, BindableResolveBee):
+        bee = bee._unbound_run_hive
+
+    if isinstance(bee, RuntimeHiveInstantiator):
+        return lazy_children.get(bee._hive_object)
+
+    return None
+
+
+def _find_lazy_dependencies(instance, lazy_children):
+    """Return the names of the lazy child hives required to bind a bee, and the kind of LazyEndpoint which may stand in
+    for the bee of the lazy child hive (or None)
+
+    :param instance: bee returned by getinstance()
+    :param lazy_children: mapping from lazy child HiveObject to bee name
+    """
+    if not isinstance(instance, (Connection, Trigger)):
+        name = _get_lazy_child_name(instance, lazy_children)
+        if name is None:
+            return (), None
+
+        return (name,), None
+
+    source, target = instance._source, instance._target
+    source_name = _get_lazy_child_name(source, lazy_children)
+    target_name = _get_lazy_child_name(target, lazy_children)
+
+    if source_name is None and target_name is None:
+        return (), None
+
+    names = tuple(sorted({source_name, target_name} - {None}))
+
+    # Only bees (not hives) may be stood in for
+    if source_name is None and not isinstance(source, RuntimeHiveInstantiator):
+        if isinstance(instance, Trigger):
+            return names, "pretrigger" if instance._pretrigger else "trigger"
+
+        if isinstance(target, BindableResolveBee):
+            target = target._bee
+
+            if isinstance(target, Antenna) and target.mode == "push":
+                return names, "push"
+
+            if isinstance(target, TriggerTarget):
+                return names, "connect_trigger"
+
+    elif target_name is None and not isinstance(target, RuntimeHiveInstantiator):
+        if isinstance(instance, Connection) and isinstance(source, BindableResolveBee):
+            source = source._bee
+
+            if isinstance(source, Output) and source.mode == "pull":
+                return names, "pull"
+
+    return names, None
+
+
 class RuntimeHiveInstantiator(Bindable):
     """Instantiator Bee to instantiate runtime hives.
 
      Create a new RuntimeHive for a HiveObject instance when bound to parent hive.
      """
+    __slots__ = ("_hive_object",)
 
     def __init__(self, hive_object):
         # TODO, maybe setattr for bee.getinstance(hive_object) in hive ex/i wrappers
         self._hive_object = hive_object
 
+        super().__init__()
+
     @memoize
     def bind(self, run_hive):
         return self._hive_object.instantiate()
 
+    def unbind(self, run_hive):
+        child_hive = super().unbind(run_hive)
+
+        if child_hive is not None:
+            child_hive.dispose()
+
+        return child_hive
+
 
 class RuntimeHive(Bee, ConnectSourceDerived, ConnectTargetDerived, TriggerSource, TriggerTarget, Nameable):
     """Unique Hive instance that is created at runtime for a Hive object.
 
-    Lightweight instantiation is supported through caching performed by the HiveObject instance.
+    Lightweight instantiation is supported through the instantiation plan recorded for each HiveObject class.
+
+    Runtime hives do not have an instance dictionary; the RuntimeHive subclass built for each HiveObject class declares
+    slots for the bees exposed by its instances.
+
+    Runtime hives which are no longer required may be disposed, to release the bees bound to them.
+
+    Child hives declared with lazy=True are not instantiated until one of their bees is accessed (or pushed to, pulled
+    from, or triggered by a bee of this hive), when their connections and triggers are also bound. The first runtime
+    hive of each HiveObject class records the instantiation plan, and so instantiates lazy child hives immediately.
     """
+    __slots__ = ("_hive_bee_name", "_hive_object", "_hive_build_class_to_instance", "_hive_bee_instances", "_bee_names",
+                 "_drones", "_hive_dispose_callbacks", "_hive_disposed", "_hive_deferred_steps",
+                 "_hive_lazy_endpoints")
 
-    _hive_bee_name = ()
-    _hive_object = None
-    _hive_build_class_to_instance = None
-    _hive_bee_instances = None
-    _bee_names = None
-    _drones = None
+    _hive_drone_attributes = {}
 
     def __init__(self, hive_object, builders):
         super().__init__()
@@ -57,81 +303,439 @@ class RuntimeHive(Bee, ConnectSourceDerived, ConnectTargetDerived, TriggerSource
         self._hive_bee_instances = {}
         self._bee_names = ["_drones"]
         self._drones = []
+        self._hive_dispose_callbacks = None
+        self._hive_disposed = False
+        self._hive_deferred_steps = None
+        self._hive_lazy_endpoints = None
+
+        profiler = get_build_profiler()
 
         with run_hive_as(self):
-            # Build args
-            args = hive_object._hive_builder_args
-            kwargs = hive_object._hive_builder_kwargs
+            if profiler is None:
+                self._hive_instantiate(builders, None)
 
-            for builder, builder_cls in builders:
+            else:
+                with profiler.section("instantiate", hive_object._hive_parent_class.__name__):
+                    self._hive_instantiate(builders, profiler)
 
-                if builder_cls is not None:
-                    assert builder_cls not in self._hive_build_class_to_instance, builder_cls
+    def _hive_instantiate(self, builders, profiler):
+        """Initialise the builder-class instances, and bind the bees of the HiveObject to this runtime hive
 
-                    # Do not initialise instance yet
-                    build_class_instance = builder_cls.__new__(builder_cls)
+        :param builders: (builder, builder_cls) pairs of the HiveBuilder
+        :param profiler: active BuildProfiler, or None
+        """
+        hive_object = self._hive_object
 
-                    self._hive_build_class_to_instance[builder_cls] = build_class_instance
-                    self._drones.append(build_class_instance)
+        # Build args
+        args = hive_object._hive_builder_args
+        kwargs = hive_object._hive_builder_kwargs
 
+        drone_attributes = self._hive_drone_attributes
+
+        for builder, builder_cls in builders:
+
+            if builder_cls is not None:
+                assert builder_cls not in self._hive_build_class_to_instance, builder_cls
+
+                # Do not initialise instance yet
+                build_class_instance = builder_cls.__new__(builder_cls)
+
+                self._hive_build_class_to_instance[builder_cls] = build_class_instance
+                self._drones.append(build_class_instance)
+
+                # Store instance under the attribute used by precompiled stateful descriptors
+                setattr(self, drone_attributes[builder_cls], build_class_instance)
+
+                if profiler is None:
                     build_class_instance.__init__(*args, **kwargs)
 
-            with building_hive_as(hive_object.__class__), hive_mode_as("build"):
-                # Add external bees to runtime hive
-                exposed_bees = []
+                else:
+                    with profiler.section("builder_cls", builder_cls):
+                        build_class_instance.__init__(*args, **kwargs)
+
+        with building_hive_as(hive_object.__class__), hive_mode_as("build"):
+            plan = hive_object._hive_instantiation_plan
+
+            # First instance of this HiveObject class records the plan
+            if plan is None:
+                plan, exposed_bees = self._hive_record_instantiation_plan(profiler)
+                hive_object.__class__._hive_instantiation_plan = plan
+
+            else:
+                exposed_bees = self._hive_replay_instantiation_plan(plan, profiler)
+
+            self._hive_expose_bees(exposed_bees)
+
+    def __getattr__(self, name):
+        # Invoked only for missing attributes, which include the bees of lazy child hives that are not materialised
+        try:
+            deferred_steps = object.__getattribute__(self, "_hive_deferred_steps")
+
+        except AttributeError:
+            deferred_steps = None
+
+        if deferred_steps:
+            lazy_children = self._hive_object._hive_instantiation_plan.lazy_attributes.get(name)
+
+            if lazy_children is not None and self._hive_materialise(lazy_children):
+                return getattr(self, name)
+
+        raise AttributeError("'{}' object has no attribute '{}'".format(self.__class__.__name__, name))
+
+    def _hive_expose_bees(self, exposed_bees):
+        """Set bound bees as attributes of this runtime hive
+
+        :param exposed_bees: (name, instance) pairs
+        """
+        for bee_name, instance in exposed_bees:
+            # Risk that multiple references to same bee exist
+            self._hive_bee_instances[bee_name] = instance
+            self._bee_names.append(bee_name)
+
+            setattr(self, bee_name, instance)
+
+    def _hive_record_instantiation_plan(self, profiler):
+        """Walk the bees of the HiveObject, binding them to this runtime hive.
+
+        Return the recorded InstantiationPlan, and the (name, instance) pairs to expose on this runtime hive
+
+        :param profiler: active BuildProfiler, or None
+        """
+        hive_object = self._hive_object
+        steps = []
+
+        internal_bees = hive_object._hive_i
+        lazy_children = {bee: bee_name for bee_name, bee in internal_bees._items
+                         if isinstance(bee, HiveObject) and bee._hive_lazy}
+
+        # Add external bees to runtime hive
+        external_bees = hive_object._hive_ex
+        for bee_name, bee in external_bees._items:
+            exported_bee = bee.export()
+
+            # TODO: nice exception reporting
+            instance = _get_bee_instance(exported_bee, hive_object, profiler)
+            step = self._hive_record_instantiation_step(bee_name, bee_name, exported_bee, instance, lazy_children,
+                                                        profiler)
+            steps.append(step)
+
+        # Add internal bees (that are hives, Callable or Stateful) to runtime hive
+        for bee_name, bee in internal_bees._items:
+            private_name = "_" + bee_name
+
+            # Some runtime hive attributes are protected, but in the case of Stateful bees,
+            # The RuntimeHive already has corresponding property descriptors
+            # Bee.implements indicates that the final bee (following bee.getinstance(...)) will be Stateful
+            if not bee.implements(Stateful):
+                assert not hasattr(self, private_name), private_name
+
+            if bee.implements(HiveObject) or bee.implements(Callable):
+                attribute_name = private_name
+
+            else:
+                attribute_name = None
+
+            # TODO: nice exception reporting
+            instance = _get_bee_instance(bee, hive_object, profiler)
+            step = self._hive_record_instantiation_step(bee_name, attribute_name, bee, instance, lazy_children,
+                                                        profiler)
+            steps.append(step)
+
+        plan = InstantiationPlan(steps)
+
+        # Lazy child hives are already bound to this runtime hive
+        return plan, self._hive_replay_instantiation_steps(plan.steps, False, profiler)
+
+    def _hive_record_instantiation_step(self, bee_name, attribute_name, bee, instance, lazy_children, profiler):
+        """Resolve the InstantiationStep which binds a bee instance to a runtime hive.
+
+        Bound bees are memoized, so the bound instance used to resolve the step is the same as that which is later
+        returned by replaying the step.
+
+        :param bee_name: name under which the bee is aliased
+        :param attribute_name: name under which the bee is exposed on the runtime hive, or None
+        :param bee: bee of the HiveObject class
+        :param instance: bee returned by bee.getinstance()
+        :param lazy_children: mapping from lazy child HiveObject to bee name
+        :param profiler: active BuildProfiler, or None
+        """
+        bindable = isinstance(instance, Bindable)
+
+        if bindable:
+            lazy_names, lazy_endpoint = _find_lazy_dependencies(instance, lazy_children)
+
+            bound_instance = _bind_bee_instance(instance, self, profiler)
+
+            # Bees which bind to None (connections, triggers) are not stored
+            if bound_instance is None:
+                return InstantiationStep(bee_name, None, bee, True, False, lazy_names, lazy_endpoint)
+
+        else:
+            lazy_names, lazy_endpoint = (), None
+
+            bound_instance = instance
+
+        # Stateful bees are accessed through property descriptors of the runtime hive class
+        if isinstance(bound_instance, Stateful):
+            attribute_name = None
+
+        register_alias = isinstance(bound_instance, Nameable)
+        return InstantiationStep(bee_name, attribute_name, bee, bindable, register_alias, lazy_names, lazy_endpoint)
+
+    def _hive_replay_instantiation_plan(self, plan, profiler):
+        """Bind the bees of an InstantiationPlan to this runtime hive.
+
+        Return the (name, instance) pairs to expose on this runtime hive
+
+        :param plan: InstantiationPlan instance
+        :param profiler: active BuildProfiler, or None
+        """
+        # Lazy steps may be deferred, and profiled getinstance() and bind() calls must be recorded
+        if plan.has_lazy_children or profiler is not None:
+            return self._hive_replay_instantiation_steps(plan.steps, plan.has_lazy_children, profiler)
+
+        exposed_bees = []
+
+        for attribute_name, factory in self._hive_object._hive_get_bee_factories(plan):
+            instance = factory(self)
+
+            if attribute_name is not None:
+                exposed_bees.append((attribute_name, instance))
+
+        return exposed_bees
+
+    def _hive_replay_instantiation_steps(self, steps, defer_lazy_steps, profiler):
+        """Bind the bees of a sequence of InstantiationSteps to this runtime hive.
+
+        Return the (name, instance) pairs to expose on this runtime hive
+
+        :param steps: InstantiationStep instances
+        :param defer_lazy_steps: defer steps which require lazy child hives, until they are materialised
+        :param profiler: active BuildProfiler, or None
+        """
+        hive_object = self._hive_object
+        exposed_bees = []
+
+        for step in steps:
+            bee_name, attribute_name, bee, bindable, register_alias, lazy_children, lazy_endpoint = step
+
+            instance = _get_bee_instance(bee, hive_object, profiler)
+
+            if lazy_children:
+                if defer_lazy_steps:
+                    self._hive_defer_instantiation_step(step, instance)
+                    continue
+
+                # Connections and triggers which were stood in for by a LazyEndpoint are only resolved
+                if self._hive_lazy_endpoints is not None and step in self._hive_lazy_endpoints:
+                    self._hive_resolve_lazy_endpoint(step, instance)
+                    continue
+
+            if bindable:
+                instance = _bind_bee_instance(instance, self, profiler)
+                if instance is None:
+                    continue
+
+            # Store runtime information on bee
+            if register_alias:
+                instance.register_alias(self, bee_name)
+
+            if attribute_name is not None:
+                exposed_bees.append((attribute_name, instance))
+
+        return exposed_bees
+
+    def _hive_defer_instantiation_step(self, step, instance):
+        """Defer an InstantiationStep until the lazy child hives it requires are materialised.
+
+        Connections and triggers from the bees of this hive to those of the lazy child hives are stood in for by a
+        LazyEndpoint, which materialises the child hives when called.
+
+        :param step: InstantiationStep instance
+        :param instance: bee returned by step.bee.getinstance()
+        """
+        if self._hive_deferred_steps is None:
+            self._hive_deferred_steps = []
+
+        self._hive_deferred_steps.append(step)
+
+        lazy_endpoint = step.lazy_endpoint
+        if lazy_endpoint is None or get_debug_context() is not None:
+            return
+
+        endpoint = LazyEndpoint(self, step.lazy_children)
+
+        if lazy_endpoint == "pull":
+            target = instance._target
+            if isinstance(target, Bindable):
+                target = target.bind(self)
+
+            target._hive_connect_target(endpoint)
+
+        else:
+            source = instance._source
+            if isinstance(source, Bindable):
+                source = source.bind(self)
+
+            if lazy_endpoint == "trigger":
+                source._hive_trigger_source(endpoint)
+
+            elif lazy_endpoint == "pretrigger":
+                source._hive_pretrigger_source(endpoint)
+
+            else:
+                source._hive_connect_source(endpoint)
+
+        if self._hive_lazy_endpoints is None:
+            self._hive_lazy_endpoints = {}
+
+        self._hive_lazy_endpoints[step] = endpoint
+
+    def _hive_resolve_lazy_endpoint(self, step, instance):
+        """Bind the bee of a lazy child hive which was stood in for by a LazyEndpoint, and forward the endpoint to it
+
+        :param step: InstantiationStep instance
+        :param instance: bee returned by step.bee.getinstance() (Connection or Trigger)
+        """
+        endpoint = self._hive_lazy_endpoints.pop(step)
+        lazy_endpoint = step.lazy_endpoint
+
+        source = instance._source
+        if isinstance(source, Bindable):
+            source = source.bind(self)
 
-                external_bees = hive_object._hive_ex
-                for bee_name, bee in external_bees._items:
-                    exported_bee = bee.export()
+        target = instance._target
+        if isinstance(target, Bindable):
+            target = target.bind(self)
 
-                    # TODO: nice exception reporting
-                    instance = exported_bee.getinstance(self._hive_object)
+        if lazy_endpoint in ("trigger", "pretrigger"):
+            endpoint.resolve(target._hive_trigger_target())
+            return
 
-                    if isinstance(instance, Bindable):
-                        instance = instance.bind(self)
-                        if instance is None:
-                            continue
+        # raises an Exception if incompatible
+        source._hive_is_connectable_source(target)
+        target._hive_is_connectable_target(source)
 
-                    # Store runtime information on exported bee
-                    if isinstance(instance, Nameable):
-                        instance.register_alias(self, bee_name)
+        if lazy_endpoint == "pull":
+            source._hive_connect_source(target)
+            endpoint.resolve(source.pull)
 
-                    exposed_bees.append((bee_name, instance))
+        else:
+            target._hive_connect_target(source)
+
+            if lazy_endpoint == "push":
+                endpoint.resolve(target.push)
+
+            else:
+                endpoint.resolve(target._hive_trigger_target())
+
+    def _hive_materialise(self, lazy_children):
+        """Instantiate lazy child hives, and bind the deferred steps which require them.
+
+        Return True if any deferred steps were bound
+
+        :param lazy_children: names of lazy child hives
+        """
+        deferred_steps = self._hive_deferred_steps
+        if not deferred_steps:
+            return False
+
+        # Steps which require other lazy child hives (e.g. connections between them) materialise those too
+        names = set(lazy_children)
+        ready_steps = []
+        remaining_steps = []
+
+        for step in deferred_steps:
+            if names.isdisjoint(step.lazy_children):
+                remaining_steps.append(step)
+
+            else:
+                ready_steps.append(step)
+                names.update(step.lazy_children)
 
-                # Add internal bees (that are hives, Callable or Stateful) to runtime hive
-                internal_bees = hive_object._hive_i
-                for bee_name, bee in internal_bees._items:
-                    private_name = "_" + bee_name
+        while True:
+            newly_ready = [step for step in remaining_steps if not names.isdisjoint(step.lazy_children)]
+            if not newly_ready:
+                break
 
-                    # Some runtime hive attributes are protected, but in the case of Stateful bees,
-                    # The RuntimeHive already has corresponding property descriptors
-                    # Bee.implements indicates that the final bee (following bee.getinstance(...)) will be Stateful
-                    if not bee.implements(Stateful):
-                        assert not hasattr(self, private_name), private_name
+            for step in newly_ready:
+                remaining_steps.remove(step)
+                ready_steps.append(step)
+                names.update(step.lazy_children)
 
-                    # TODO: nice exception reporting
-                    instance = bee.getinstance(self._hive_object)
-                    if isinstance(instance, Bindable):
-                        instance = instance.bind(self)
-                        if instance is None:
-                            continue
+        if not ready_steps:
+            return False
+
+        self._hive_deferred_steps = remaining_steps
+
+        # Bind in plan order
+        order = {step: i for i, step in enumerate(deferred_steps)}
+        ready_steps.sort(key=order.__getitem__)
+
+        hive_object = self._hive_object
+
+        with run_hive_as(self), building_hive_as(hive_object.__class__), hive_mode_as("build"):
+            exposed_bees = self._hive_replay_instantiation_steps(ready_steps, False, get_build_profiler())
+
+        self._hive_expose_bees(exposed_bees)
+        return True
+
+    def _hive_add_dispose_callback(self, callback):
+        """Register callback to be invoked when this runtime hive is disposed
+
+        :param callback: callable accepting no arguments
+        """
+        if self._hive_dispose_callbacks is None:
+            self._hive_dispose_callbacks = []
+
+        self._hive_dispose_callbacks.append(callback)
+
+    def dispose(self):
+        """Release the bees bound to this runtime hive, and dispose its child hives.
+
+        Dispose callbacks are invoked (in reverse order of registration), before the memoized bind() results for this
+        runtime hive are evicted, connections to its bound bees are dropped, and references to its bees and
+        builder-class instances are cleared. A disposed runtime hive cannot be used.
+        """
+        if self._hive_disposed:
+            return
 
-                    # Store runtime information on bee
-                    if isinstance(instance, Nameable):
-                        instance.register_alias(self, bee_name)
+        self._hive_disposed = True
 
-                    if bee.implements(HiveObject) or bee.implements(Callable):
-                        exposed_bees.append((private_name, instance))
+        callbacks = self._hive_dispose_callbacks
+        if callbacks is not None:
+            self._hive_dispose_callbacks = None
 
-                for bee_name, instance in exposed_bees:
-                    if isinstance(instance, Stateful):
-                        continue
+            for callback in reversed(callbacks):
+                callback()
 
-                    # Risk that multiple references to same bee exist
-                    self._hive_bee_instances[bee_name] = instance
-                    self._bee_names.append(bee_name)
+        hive_object = self._hive_object
+        plan = hive_object._hive_instantiation_plan
 
-                    setattr(self, bee_name, instance)
+        with building_hive_as(hive_object.__class__), hive_mode_as("build"):
+            for step in reversed(plan.steps):
+                instance = step.bee.getinstance(hive_object)
+
+                if step.bindable:
+                    instance.unbind(self)
+
+                elif step.register_alias:
+                    instance.unregister_aliases(self)
+
+        # Break reference cycles between this runtime hive, its bees and builder-class instances
+        for bee_name in self._bee_names:
+            if bee_name != "_drones":
+                delattr(self, bee_name)
+
+        for attribute_name in self._hive_drone_attributes.values():
+            delattr(self, attribute_name)
+
+        self._hive_build_class_to_instance.clear()
+        self._hive_bee_instances.clear()
+        self._bee_names = ["_drones"]
+        self._drones = []
+        self._hive_deferred_steps = None
+        self._hive_lazy_endpoints = None
 
     @staticmethod
     def _hive_can_connect_hive(other):
@@ -143,6 +747,12 @@ class RuntimeHive(Bee, ConnectSourceDerived, ConnectTargetDerived, TriggerSource
     def _hive_find_connect_targets(self):
         return self._hive_object._hive_find_connect_targets()
 
+    def _hive_find_connect_sources_by_key(self):
+        return self._hive_object._hive_find_connect_sources_by_key()
+
+    def _hive_find_connect_targets_by_key(self):
+        return self._hive_object._hive_find_connect_targets_by_key()
+
     def _hive_trigger_source(self, target_func):
         source_name = self._hive_object._hive_find_trigger_source()
         instance = self._hive_bee_instances[source_name]
@@ -153,12 +763,18 @@ class RuntimeHive(Bee, ConnectSourceDerived, ConnectTargetDerived, TriggerSource
         instance = self._hive_bee_instances[target_name]
         return instance._hive_trigger_target()
 
+    def _hive_find_connect_source(self, target):
+        return self._hive_object._hive_find_connect_source(target)
+
+    def _hive_find_connect_target(self, source):
+        return self._hive_object._hive_find_connect_target(source)
+
     def _hive_get_connect_source(self, target):
-        source_name = self._hive_object._hive_find_connect_source(target)
+        source_name = self._hive_find_connect_source(target)
         return getattr(self, source_name)
 
     def _hive_get_connect_target(self, source):
-        target_name = self._hive_object._hive_find_connect_target(source)
+        target_name = self._hive_find_connect_target(source)
         return getattr(self, target_name)
 
     def implements(self, cls):
@@ -184,9 +800,13 @@ class HiveObject(Exportable, ConnectSourceDerived, ConnectTargetDerived, Trigger
     _hive_i = None
     _hive_ex = None
     _hive_exportable_to_parent = None
+    _hive_instantiation_plan = None
+    _hive_bee_factories = None
 
     _hive_args = None
     _hive_meta_args_frozen = None
+    _hive_lazy = False
+    _hive_external_index = None
 
     export_only = False
 
@@ -197,6 +817,9 @@ class HiveObject(Exportable, ConnectSourceDerived, ConnectTargetDerived, Trigger
         self._hive_allow_import_namespace = kwargs.pop("import_namespace", True)
         self._hive_allow_export_namespace = kwargs.pop("export_namespace", True)
 
+        # Defer instantiation (as a child hive) until first used
+        self._hive_lazy = kwargs.pop("lazy", False)
+
         # Take out args parameters
         remaining_args, remaining_kwargs, arg_wrapper_values = self._hive_args.extract_from_args(args, kwargs)
         self._hive_args_frozen = self._hive_args.freeze(arg_wrapper_values)
@@ -224,42 +847,116 @@ class HiveObject(Exportable, ConnectSourceDerived, ConnectTargetDerived, Trigger
 
                 setattr(self, bee_name, resolve_bee)
 
-    @memoize
+    @memoize(weak_keys=True)
     def getinstance(self, parent_hive_object):
         """Return a RuntimeHiveInstantiator for this parent hive_object"""
         return RuntimeHiveInstantiator(self)
 
+    def _hive_get_bee_factories(self, plan):
+        """Return the (attribute name, factory) pairs which bind the bees of this Hive object to a runtime hive.
+
+        Bees are resolved with getinstance() when first requested, so that each factory only binds (and aliases) its
+        bee when called with a runtime hive
+
+        :param plan: InstantiationPlan of this Hive object's class
+        """
+        bee_factories = self._hive_bee_factories
+
+        if bee_factories is None:
+            bee_factories = self._hive_bee_factories = tuple(
+                (attribute_name, partial(binder, bee.getinstance(self)))
+                for attribute_name, bee, binder in plan.binders)
+
+        return bee_factories
+
     def instantiate(self):
         """Return an instance of the runtime Hive for this Hive object."""
         return self._hive_runtime_class(self, self._hive_parent_class._builders)
 
+    def instantiate_many(self, count):
+        """Return a list of new runtime Hive instances for this Hive object.
+
+        Argument extraction and builder-class validation are performed once for this Hive object, so only per-instance
+        state is allocated for each runtime hive.
+
+        :param count: number of runtime hives to create
+        """
+        runtime_class = self._hive_runtime_class
+        builders = self._hive_parent_class._builders
+
+        return [runtime_class(self, builders) for _ in range(count)]
+
     @staticmethod
     def _hive_can_connect_hive(other):
         return isinstance(other, HiveObject)
 
     @classmethod
-    def _hive_find_trigger_target(cls):
-        """Find name of single external bee that supported TriggerTarget interface.
-
-        Raise TypeError if such a condition cannot be met
-        """
-        external_bees = cls._hive_ex
+    def _hive_build_external_index(cls):
+        """Build the ExternalBeeIndex of the external bees of this class"""
+        trigger_sources = []
         trigger_targets = []
+        connect_sources = []
+        connect_targets = []
+        connect_sources_by_key = defaultdict(list)
+        connect_targets_by_key = defaultdict(list)
 
-        for bee_name, bee in external_bees._items:
+        for bee_name, bee in cls._hive_ex._items:
             exported_bee = bee.export()
 
+            if isinstance(exported_bee, TriggerSource):
+                trigger_sources.append(bee_name)
+
             if isinstance(exported_bee, TriggerTarget):
-                assert bee.implements(TriggerTarget)
                 trigger_targets.append(bee_name)
 
+            if exported_bee.implements(ConnectSource):
+                candidate = ConnectionCandidate(bee_name, exported_bee.data_type)
+                connect_sources.append(candidate)
+                connect_sources_by_key[get_connection_key(exported_bee)].append(candidate)
+
+            if exported_bee.implements(ConnectTarget):
+                candidate = ConnectionCandidate(bee_name, exported_bee.data_type)
+                connect_targets.append(candidate)
+                connect_targets_by_key[get_connection_key(exported_bee)].append(candidate)
+
+        return ExternalBeeIndex(tuple(trigger_sources), tuple(trigger_targets), tuple(connect_sources),
+                                tuple(connect_targets),
+                                {key: tuple(candidates) for key, candidates in connect_sources_by_key.items()},
+                                {key: tuple(candidates) for key, candidates in connect_targets_by_key.items()})
+
+    @classmethod
+    def _hive_get_external_index(cls):
+        """Return the ExternalBeeIndex of this class, which is built once the class is built"""
+        index = cls._hive_external_index
+        if index is not None:
+            return index
+
+        index = cls._hive_build_external_index()
+
+        # External bees may still be added whilst building
+        if cls._hive_runtime_class is not None:
+            cls._hive_external_index = index
+
+        return index
+
+    @classmethod
+    def _hive_find_trigger_target(cls):
+        """Find name of single external bee that supported TriggerTarget interface.
+
+        Raise TypeError if such a condition cannot be met
+        """
+        trigger_targets = cls._hive_get_external_index().trigger_targets
+
         if not trigger_targets:
             raise TypeError("No trigger targets in %s" % cls)
 
         elif len(trigger_targets) > 1:
-            raise TypeError("Multiple trigger targets in {}: {}".format(cls, trigger_targets))
+            raise TypeError("Multiple trigger targets in {}: {}".format(cls, list(trigger_targets)))
+
+        trigger_target = trigger_targets[0]
+        assert getattr(cls._hive_ex, trigger_target).implements(TriggerTarget)
 
-        return trigger_targets[0]
+        return trigger_target
 
     @classmethod
     def _hive_find_trigger_source(cls):
@@ -267,56 +964,33 @@ class HiveObject(Exportable, ConnectSourceDerived, ConnectTargetDerived, Trigger
 
         Raise TypeError if such a condition cannot be met
         """
-        external_bees = cls._hive_ex
-        trigger_sources = []
-
-        for bee_name, bee in external_bees._items:
-            exported_bee = bee.export()
-
-            if isinstance(exported_bee, TriggerSource):
-                trigger_sources.append(bee_name)
+        trigger_sources = cls._hive_get_external_index().trigger_sources
 
         if not trigger_sources:
             raise TypeError("No TriggerSources in %s" % cls)
 
         elif len(trigger_sources) > 1:
-            raise TypeError("Multiple TriggerSources in %s: %s" % (cls, trigger_sources))
+            raise TypeError("Multiple TriggerSources in %s: %s" % (cls, list(trigger_sources)))
 
         return trigger_sources[0]
 
     @classmethod
     def _hive_find_connect_sources(cls):
-        externals = cls._hive_ex
-
-        # Find source hive ConnectSources
-        connect_sources = []
-        for bee_name, bee in externals._items:
-            exported_bee = bee.export()
-
-            if not exported_bee.implements(ConnectSource):
-                continue
-
-            candidate = ConnectionCandidate(bee_name, exported_bee.data_type)
-            connect_sources.append(candidate)
-
-        return connect_sources
+        return cls._hive_get_external_index().connect_sources
 
     @classmethod
     def _hive_find_connect_targets(cls):
-        externals = cls._hive_ex
+        return cls._hive_get_external_index().connect_targets
 
-        # Find target hive ConnectTargets
-        connect_targets = []
-        for bee_name, bee in externals._items:
-            exported_bee = bee.export()
-
-            if not exported_bee.implements(ConnectTarget):
-                continue
-
-            candidate = ConnectionCandidate(bee_name, exported_bee.data_type)
-            connect_targets.append(candidate)
+    @classmethod
+    def _hive_find_connect_sources_by_key(cls):
+        """Return mapping from connection key (see get_connection_key) to connect source candidates"""
+        return cls._hive_get_external_index().connect_sources_by_key
 
-        return connect_targets
+    @classmethod
+    def _hive_find_connect_targets_by_key(cls):
+        """Return mapping from connection key (see get_connection_key) to connect target candidates"""
+        return cls._hive_get_external_index().connect_targets_by_key
 
     @classmethod
     def _hive_find_connect_source(cls, target):
@@ -421,6 +1095,15 @@ class MetaHivePrimitive(ABC):
         else:
             return hive_object
 
+    @classmethod
+    def instantiate_many(cls, count, *args, **kwargs):
+        """Return a list of new runtime Hive instances, sharing the same arguments
+
+        :param count: number of runtime hives to create
+        """
+        hive_object = cls._hive_object_class(*args, **kwargs)
+        return hive_object.instantiate_many(count)
+
 
 class HiveBuilder(object):
     """Deferred Builder for constructing Hive classes.
@@ -448,6 +1131,28 @@ class HiveBuilder(object):
         else:
             return hive_object
 
+    @classmethod
+    def instantiate_many(cls, count, *args, **kwargs):
+        """Return a list of new runtime Hive instances, sharing the same (meta) arguments.
+
+        The HiveObject class is looked up, and the arguments extracted and validated, once for the whole batch.
+
+        :param count: number of runtime hives to create
+        """
+        args, kwargs, hive_object_class = cls._hive_get_hive_object_class(args, kwargs)
+        hive_object = hive_object_class(*args, **kwargs)
+
+        return hive_object.instantiate_many(count)
+
+    @classmethod
+    def prebuild(cls, *args, **kwargs):
+        """Build the HiveObject class for these meta args ahead of instantiation, returning it.
+
+        Runtime arguments are accepted (and ignored), so that the arguments of a later instantiation may be passed as-is
+        """
+        args, kwargs, hive_object_class = cls._hive_get_hive_object_class(args, kwargs)
+        return hive_object_class
+
     @classmethod
     def _hive_get_meta_primitive(cls, *args, **kwargs):
         """Return the MetaHivePrimitive subclass associated with the HiveObject class produced for these meta args"""
@@ -457,22 +1162,46 @@ class HiveBuilder(object):
         return cls._hive_create_meta_primitive(hive_object_class)
 
     @classmethod
-    @memoize
+    def get_hive_object_class_info(cls):
+        """Return HiveObjectClassInfo for the HiveObject classes built by this HiveBuilder.
+
+        cached is the number of classes held by the bounded cache, and live the number of classes which remain alive
+        (including those which have been evicted from the cache, but are still referenced)
+        """
+        cached = cls._hive_build.cache_info(cls).entries
+        live = sum(1 for hive_object_class in list(_hive_object_classes) if hive_object_class._hive_parent_class is cls)
+        return HiveObjectClassInfo(cached, live, cls._hive_build.cache_info().maxsize)
+
+    @classmethod
+    @memoize(maxsize=HIVE_OBJECT_CLASS_CACHE_SIZE)
     def _hive_create_meta_primitive(cls, hive_object_class):
         """Return the MetaHivePrimitive subclass associated with this HiveObject class """
         return type("MetaHivePrimitive::{}".format(cls.__name__), (MetaHivePrimitive,),
                     {'_hive_object_class': hive_object_class})
 
     @classmethod
-    @memoize
+    @memoize(maxsize=HIVE_OBJECT_CLASS_CACHE_SIZE, key=_meta_arg_values_key)
     def _hive_build(cls, meta_arg_values):
-        """Build a HiveObject for this Hive, with appropriate Args instance
+        """Build a HiveObject for this Hive, with appropriate Args instance.
+
+        HiveObject classes are cached for each distinct combination of meta args, evicting the least recently used
+        (see set_hive_object_class_cache_size). Unhashable meta arg values (lists, sets and dicts) are canonicalised.
 
-        :param kwargs: Parameter keyword arguments
+        :param meta_arg_values: tuple of meta arg values
+        """
+        with profile_section("build", cls.__name__):
+            return cls._hive_build_hive_object_class(meta_arg_values)
+
+    @classmethod
+    def _hive_build_hive_object_class(cls, meta_arg_values):
+        """Build a HiveObject class for this Hive (uncached, see _hive_build)
+
+        :param meta_arg_values: tuple of meta arg values
         """
         hive_object_dict = {'__doc__': cls.__doc__, "_hive_parent_class": cls}
         hive_object_class_name = "HiveObject<{}>".format(cls.__name__)
         hive_object_class = type(hive_object_class_name, (HiveObject,), hive_object_dict)
+        _hive_object_classes.add(hive_object_class)
 
         hive_object_class._hive_i = internals = HiveInternalWrapper(hive_object_class,
                                                                     validator=lambda n, v: validate_internal_name(n))
@@ -502,17 +1231,20 @@ class HiveBuilder(object):
                     builder_args = builder_args + (frozen_meta_args,)
 
                 try:
-                    builder(*builder_args)
+                    with profile_section("builder", builder):
+                        builder(*builder_args)
 
                 except Exception:
                     print("Unable to invoke builder '{}'".format(builder))
                     raise
 
-            cls._hive_build_namespace(hive_object_class)
+            with profile_section("namespace", cls.__name__):
+                cls._hive_build_namespace(hive_object_class)
 
             # Root hives build
             if is_root:
-                cls._hive_build_connectivity(hive_object_class)
+                with profile_section("connectivity", cls.__name__):
+                    cls._hive_build_connectivity(hive_object_class)
 
         # Find anonymous bees
         anonymous_bees = set(registered_bees)
@@ -540,31 +1272,102 @@ class HiveBuilder(object):
         # TODO: auto-remove connections/triggers for which the source/target has been deleted
 
         # Build runtime hive class
+        hive_object_class._hive_runtime_class = cls._hive_build_runtime_class(hive_object_class)
+        return hive_object_class
+
+    @classmethod
+    def _hive_build_runtime_class(cls, hive_object_class):
+        """Build the RuntimeHive subclass for a HiveObject class.
+
+        Stateful bees are exposed through the descriptors they provide, unless they request slot storage, in which case
+        their attribute names refer directly to a slot of the runtime hive class.
+
+        Each builder-class instance is held in a slot of the runtime hive, so that descriptors can be specialised to
+        access it without a dictionary lookup.
+
+        Bees which are exposed as attributes of the runtime hive (external bees, and internal hives and Callables) are
+        also held in slots. Should an attribute name not be permitted as a slot, the class falls back to an instance
+        dictionary.
+
+        :param hive_object_class: HiveObject class being built
+        """
         run_hive_class_dict = {"__doc__": cls.__doc__}
 
-        # For internal bees
-        for bee_name, bee in internals._items:
-            private_bee_name = "_{}".format(bee_name)
+        # Slots for builder-class instances
+        drone_attributes = {builder_cls: "_hive_drone_{}".format(i)
+                            for i, (builder, builder_cls) in enumerate(cls._builders) if builder_cls is not None}
+        run_hive_class_dict['_hive_drone_attributes'] = drone_attributes
 
-            # If the bee requires a property interface, build a property
-            if isinstance(bee, Stateful):
-                run_hive_class_dict[private_bee_name] = property(bee._hive_stateful_getter, bee._hive_stateful_setter)
+        # Find attribute names of stateful bees
+        stateful_bees = [("_{}".format(bee_name), bee) for bee_name, bee in hive_object_class._hive_i._items
+                         if isinstance(bee, Stateful)]
+        stateful_bees.extend((bee_name, bee) for bee_name, bee in hive_object_class._hive_ex._items
+                             if isinstance(bee, Stateful))
 
-        # For external bees
-        for bee_name, bee in externals._items:
-            # If the bee requires a property interface, build a property
-            if isinstance(bee, Stateful):
-                run_hive_class_dict[bee_name] = property(bee._hive_stateful_getter, bee._hive_stateful_setter)
+        bee_to_slot_name = {}
+        slot_aliases = []
+
+        for attribute_name, bee in stateful_bees:
+            # If the bee requires a property interface, build a descriptor
+            if not bee.stateful_slot_storage:
+                run_hive_class_dict[attribute_name] = bee._hive_stateful_descriptor(drone_attributes)
+                continue
+
+            # The same bee may be exposed under several names, but requires only one slot
+            try:
+                slot_name = bee_to_slot_name[bee]
+
+            except KeyError:
+                slot_name = bee_to_slot_name[bee] = "_hive_stateful_slot_{}".format(len(bee_to_slot_name))
+
+            slot_aliases.append((attribute_name, slot_name))
+
+        # Find attribute names of bees exposed by runtime hive instances
+        exposed_names = [bee_name for bee_name, bee in hive_object_class._hive_ex._items
+                         if not isinstance(bee, Stateful)]
+        exposed_names.extend("_{}".format(bee_name) for bee_name, bee in hive_object_class._hive_i._items
+                             if not isinstance(bee, Stateful) and (bee.implements(HiveObject) or
+                                                                   bee.implements(Callable)))
+
+        reserved_names = set(run_hive_class_dict)
+        reserved_names.update(RuntimeHive.__slots__)
+        reserved_names.update(attribute_name for attribute_name, slot_name in slot_aliases)
+
+        exposed_slots = []
+        for attribute_name in exposed_names:
+            if attribute_name in reserved_names or attribute_name in exposed_slots:
+                continue
+
+            # Private names would be mangled
+            if not attribute_name.isidentifier() or attribute_name.startswith("__"):
+                if "__dict__" not in exposed_slots:
+                    exposed_slots.append("__dict__")
+                continue
+
+            exposed_slots.append(attribute_name)
+
+        run_hive_class_dict['__slots__'] = tuple(bee_to_slot_name.values()) + tuple(drone_attributes.values()) + \
+                                           tuple(exposed_slots)
 
         run_hive_cls_name = "{}::run_hive".format(hive_object_class.__name__)
-        hive_object_class._hive_runtime_class = type(run_hive_cls_name, (RuntimeHive,), run_hive_class_dict)
-        return hive_object_class
+        run_hive_class = type(run_hive_cls_name, (RuntimeHive,), run_hive_class_dict)
+
+        # Expose slot member descriptors under the bee attribute names
+        for attribute_name, slot_name in slot_aliases:
+            setattr(run_hive_class, attribute_name, getattr(run_hive_class, slot_name))
+
+        for bee, slot_name in bee_to_slot_name.items():
+            bee._hive_set_stateful_slot(getattr(run_hive_class, slot_name))
+
+        return run_hive_class
 
     @classmethod
-    def _hive_build_connectivity(cls, resolved_hive_object, tracked_policies=None, plugin_map=None, socket_map=None):
+    def _hive_build_connectivity(cls, resolved_hive_object, tracked_policies=None, plugin_namespace=None,
+                                 socket_namespace=None):
         """Connect plugins and sockets together by identifier.
 
-        If children allow importing of namespace, pass namespace to children.
+        If children allow importing of namespace, pass namespace to children. Children register their plugins and
+        sockets with child namespaces, which are not visible to their parent or siblings.
         """
         externals = resolved_hive_object._hive_ex
         internals = resolved_hive_object._hive_i
@@ -577,8 +1380,8 @@ class HiveBuilder(object):
         if is_root:
             exported_to_parent = set()
 
-            plugin_map = defaultdict(list)
-            socket_map = defaultdict(list)
+            plugin_namespace = IdentifierNamespace()
+            socket_namespace = IdentifierNamespace()
 
             resolved_bee_source = externals
             tracked_policies = []
@@ -593,8 +1396,8 @@ class HiveBuilder(object):
             else:
                 exported_to_parent = frozenset()
 
-            plugin_map = plugin_map.copy()
-            socket_map = socket_map.copy()
+            plugin_namespace = plugin_namespace.child()
+            socket_namespace = socket_namespace.child()
 
             # Get the external bees' ResolveBee instead of raw bee, so that connect() correctly resolves bee relative to root
             # Due to chaining of resolve bees, this works
@@ -616,13 +1419,13 @@ class HiveBuilder(object):
             bee = getattr(resolved_bee_source, bee_name)
 
             if bee.implements(Plugin):
-                register_map = plugin_map
-                lookup_map = socket_map
+                register_namespace = plugin_namespace
+                lookup_namespace = socket_namespace
                 connect_bees = connect
 
             elif bee.implements(Socket):
-                register_map = socket_map
-                lookup_map = plugin_map
+                register_namespace = socket_namespace
+                lookup_namespace = plugin_namespace
                 def connect_bees(target, source):
                     return connect(source, target)
             else:
@@ -635,15 +1438,12 @@ class HiveBuilder(object):
             # Store in map of plugins or sockets
             policy = bee.policy()
             match_info = bee, policy
-            register_map[identifier].append(match_info)
+            register_namespace.register(identifier, match_info)
             # Keep track of instantiated policies
             tracked_policies.append(match_info)
 
             # Can we connect to a socket?
-            if identifier not in lookup_map:
-                continue
-
-            other_bees = lookup_map[identifier]
+            other_bees = lookup_namespace[identifier]
 
             for other_bee, other_policy in other_bees:
                 try:
@@ -661,17 +1461,18 @@ class HiveBuilder(object):
 
         # Now export to child hives
         for child in child_hives:
-            cls._hive_build_connectivity(child, tracked_policies, plugin_map, socket_map)
+            cls._hive_build_connectivity(child, tracked_policies, plugin_namespace, socket_namespace)
 
-        # Validate policies
-        if get_matchmaker_validation_enabled():
-            for bee, policy in tracked_policies:
-                try:
-                    policy.validate()
+        # Validate policies, once all hives are connected
+        if is_root and get_matchmaker_validation_enabled():
+            with profile_section("validation", cls.__name__):
+                for bee, policy in tracked_policies:
+                    try:
+                        policy.validate()
 
-                except MatchmakingPolicyError:
-                    print("Error in validating policy of {}".format(bee))
-                    raise
+                    except MatchmakingPolicyError:
+                        print("Error in validating policy of {}".format(bee))
+                        raise
 
     @classmethod
     def _hive_build_namespace(cls, hive_object_cls):
@@ -723,12 +1524,36 @@ class HiveBuilder(object):
 
     @classmethod
     def _hive_build_meta_args_wrapper(cls):
-        cls._hive_meta_args = args_wrapper = HiveMetaArgsWrapper(cls)
+        """Build and return the meta args wrapper of this hive, by executing its declarators"""
+        args_wrapper = HiveMetaArgsWrapper(cls)
 
         # Execute declarators
         with hive_mode_as("declare"):
             for declarator in cls._declarators:
-                declarator(args_wrapper)
+                with profile_section("declarator", declarator):
+                    declarator(args_wrapper)
+
+        return args_wrapper
+
+    @classmethod
+    def _hive_get_meta_args(cls):
+        """Return the meta args wrapper of this hive, building it on first use.
+
+        The wrapper is published only once its declarators have been executed, so that other threads never observe a
+        partially declared wrapper
+        """
+        args_wrapper = cls._hive_meta_args
+
+        if args_wrapper is None:
+            # Re-entrant, as declarators may build other hives
+            with _meta_args_lock:
+                args_wrapper = cls._hive_meta_args
+
+                if args_wrapper is None:
+                    args_wrapper = cls._hive_build_meta_args_wrapper()
+                    cls._hive_meta_args = args_wrapper
+
+        return args_wrapper
 
     @classmethod
     def _hive_get_hive_object_class(cls, args, kwargs):
@@ -736,11 +1561,8 @@ class HiveBuilder(object):
 
         Extract meta args from arguments and return remainder
         """
-        if cls._hive_meta_args is None:
-            cls._hive_build_meta_args_wrapper()
-
         # Map keyword arguments to parameters, return remaining arguments
-        args, kwargs, meta_arg_values = cls._hive_meta_args.extract_from_args(args, kwargs)
+        args, kwargs, meta_arg_values = cls._hive_get_meta_args().extract_from_args(args, kwargs)
 
         # If a new combination of parameters is provided
         return args, kwargs, cls._hive_build(meta_arg_values)
@@ -812,6 +1634,38 @@ class HiveBuilder(object):
         return type(name, bases, class_dict)
 
 
+def add_dispose_callback(callback):
+    """Register callback to be invoked when the runtime hive being instantiated is disposed.
+
+    Builder-class instances may use this to release external resources, such as event handlers
+
+    :param callback: callable accepting no arguments
+    """
+    run_hive = get_run_hive()
+    if run_hive is None:
+        raise RuntimeError("No runtime hive is being instantiated")
+
+    run_hive._hive_add_dispose_callback(callback)
+
+
+def set_hive_object_class_cache_size(maxsize):
+    """Set the maximum number of HiveObject classes (and meta primitives) cached by each HiveBuilder.
+
+    Least recently used classes are evicted, and rebuilt if requested again. Evicted classes remain valid for existing
+    instances.
+
+    :param maxsize: maximum number of classes
+    """
+    HiveBuilder._hive_build.cache_resize(maxsize)
+    HiveBuilder._hive_create_meta_primitive.cache_resize(maxsize)
+
+
+def get_hive_object_class_statistics():
+    """Return a dictionary of HiveObjectClassInfo for each HiveBuilder with live HiveObject classes"""
+    builders = {hive_object_class._hive_parent_class for hive_object_class in list(_hive_object_classes)}
+    return {builder: builder.get_hive_object_class_info() for builder in builders}
+
+
 # TODO options for namespaces (old frame/hive distinction)
 def hive(name, builder=None, builder_cls=None, bases=()):
     return HiveBuilder.extend(name, builder, builder_cls, bases=bases)
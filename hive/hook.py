@@ -1,4 +1,4 @@
-from .manager import ModeFactory
+from .manager import ModeFactory, memoize
 from .protocols import Bee, TriggerSource, Exportable
 
 
@@ -12,6 +12,7 @@ class Hook(Exportable):
         self._target = target
         super().__init__()
 
+    @memoize
     def export(self):
         # TODO: somehow log the redirection path
         target = self._target
@@ -21,6 +22,13 @@ class Hook(Exportable):
 
         return target
 
+    def implements(self, cls):
+        # The target implements TriggerSource (see __init__)
+        if cls is TriggerSource:
+            return True
+
+        return super().implements(cls)
+
     def __repr__(self):
         return "Hook({!r})".format(self._target)
 
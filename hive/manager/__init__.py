@@ -1,2 +1,2 @@
 from .factory import ModeFactory
-from .memoize import memoize, memo_property, MemoProperty
+from .memoize import memoize, memo_property, MemoProperty, MemoInfo, get_memo_statistics
@@ -1,32 +1,312 @@
-from weakref import WeakKeyDictionary
+from collections import namedtuple, OrderedDict
+from weakref import ref, WeakKeyDictionary, WeakSet
 from functools import wraps
 
 
-def memoize(func):
-    """Memoizing decorator
+MemoInfo = namedtuple("MemoInfo", "hits misses evictions entries instances maxsize")
 
-    Cache function call results for similar arguments
-    """
-    func_instance_cache = WeakKeyDictionary()
+# Attribute under which per-instance caches are stored (a slot of Bee)
+CACHES_ATTRIBUTE = "_hive_memo_caches"
+
+# Classes (for memoized classmethods) must not share the caches of their bases, so are stored separately
+_class_caches = WeakKeyDictionary()
+
+_memoized_functions = []
+
+
+def _get_instance_caches(instance):
+    """Return the dictionary of memo caches owned by an instance (or class)
 
-    @wraps(func)
-    def wrapper(self, *args):
+    :param instance: instance (or class) which owns the caches
+    """
+    if isinstance(instance, type):
         try:
-            results_cache = func_instance_cache[self]
+            return _class_caches[instance]
 
         except KeyError:
-            results_cache = func_instance_cache[self] = {}
+            caches = _class_caches[instance] = {}
+            return caches
+
+    # Do not defer to __getattr__ of proxies (e.g. ResolveBee)
+    try:
+        caches = object.__getattribute__(instance, CACHES_ATTRIBUTE)
+
+    except AttributeError:
+        caches = None
+
+    if caches is None:
+        caches = {}
+        setattr(instance, CACHES_ATTRIBUTE, caches)
+
+    return caches
+
+
+class _WeakKeyCache(WeakKeyDictionary):
+    """WeakKeyDictionary which strongly holds keys that cannot be weakly referenced (e.g. None)"""
+
+    def __init__(self):
+        super().__init__()
+
+        self._strong_data = {}
+
+    def __getitem__(self, key):
+        try:
+            return self.data[ref(key)]
+
+        except TypeError:
+            return self._strong_data[key]
+
+    def __setitem__(self, key, value):
+        try:
+            super().__setitem__(key, value)
+
+        except TypeError:
+            self._strong_data[key] = value
+
+    def __len__(self):
+        return super().__len__() + len(self._strong_data)
+
+    def setdefault(self, key, default=None):
+        try:
+            return super().setdefault(key, default)
+
+        except TypeError:
+            return self._strong_data.setdefault(key, default)
+
+    def pop(self, key, *args):
+        try:
+            return super().pop(key, *args)
+
+        except TypeError:
+            return self._strong_data.pop(key, *args)
+
+
+def _first_argument(args):
+    return args[0]
+
+
+def _make_memoize(func, maxsize, key, weak_keys):
+    hits = misses = evictions = 0
+    # Instances which own a cache for this function
+    instances = WeakSet()
+
+    if weak_keys:
+        cache_factory = _WeakKeyCache
+
+        if key is None:
+            key = _first_argument
+
+    else:
+        cache_factory = dict if maxsize is None else OrderedDict
+
+    def get_results_cache(instance):
+        caches = _get_instance_caches(instance)
 
         try:
-            return results_cache[args]
+            return caches[wrapper]
 
         except KeyError:
-            result = results_cache[args] = func.__get__(self)(*args)
+            # Another thread may create the cache concurrently, only one may be kept
+            results_cache = caches.setdefault(wrapper, cache_factory())
+            instances.add(instance)
+            return results_cache
+
+    if maxsize is None:
+        @wraps(func)
+        def wrapper(self, *args):
+            nonlocal hits, misses
+
+            cache_key = args if key is None else key(args)
+
+            try:
+                results_cache = self._hive_memo_caches[wrapper]
+
+            except (AttributeError, TypeError, KeyError):
+                results_cache = get_results_cache(self)
+
+            try:
+                result = results_cache[cache_key]
+
+            except KeyError:
+                misses += 1
+                # If another thread stored a result whilst this one was computed, return the stored result
+                return results_cache.setdefault(cache_key, func(self, *args))
+
+            hits += 1
             return result
 
+    else:
+        @wraps(func)
+        def wrapper(self, *args):
+            nonlocal hits, misses, evictions
+
+            cache_key = args if key is None else key(args)
+
+            try:
+                results_cache = self._hive_memo_caches[wrapper]
+
+            except (AttributeError, TypeError, KeyError):
+                results_cache = get_results_cache(self)
+
+            try:
+                result = results_cache[cache_key]
+
+            except KeyError:
+                misses += 1
+                result = results_cache.setdefault(cache_key, func(self, *args))
+
+                if len(results_cache) > maxsize:
+                    try:
+                        results_cache.popitem(last=False)
+
+                    except KeyError:
+                        pass
+
+                    else:
+                        evictions += 1
+
+                return result
+
+            try:
+                results_cache.move_to_end(cache_key)
+
+            except KeyError:
+                # Evicted by another thread
+                pass
+
+            hits += 1
+            return result
+
+    def cache_info(instance=None):
+        """Return MemoInfo for this function, accumulated over all instances.
+
+        Hits, misses and evictions are always accumulated over all instances
+
+        :param instance: optional instance to which entries are limited
+        """
+        entries = 0
+        live_instances = 0
+
+        for owner in (instances if instance is None else (instance,)):
+            results_cache = _get_instance_caches(owner).get(wrapper)
+            if results_cache is not None:
+                entries += len(results_cache)
+                live_instances += 1
+
+        return MemoInfo(hits, misses, evictions, entries, live_instances, maxsize)
+
+    def cache_clear(instance=None):
+        """Clear the cached results of this function, for a single instance if given, otherwise all instances.
+
+        Statistics are reset only when all instances are cleared
+
+        :param instance: optional instance whose cache is cleared
+        """
+        nonlocal hits, misses, evictions
+
+        if instance is not None:
+            _get_instance_caches(instance).pop(wrapper, None)
+            instances.discard(instance)
+            return
+
+        for instance in list(instances):
+            _get_instance_caches(instance).pop(wrapper, None)
+
+        instances.clear()
+        hits = misses = evictions = 0
+
+    def cache_evict(instance, *args):
+        """Remove and return the cached result of a call, or None if no result is cached
+
+        :param instance: instance whose result is evicted
+        :param args: call arguments
+        """
+        results_cache = _get_instance_caches(instance).get(wrapper)
+        if results_cache is None:
+            return None
+
+        cache_key = args if key is None else key(args)
+        return results_cache.pop(cache_key, None)
+
+    def cache_resize(new_maxsize):
+        """Set the maximum number of results cached per instance, evicting least recently used results
+
+        :param new_maxsize: maximum number of results
+        """
+        nonlocal maxsize, evictions
+
+        if new_maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+
+        maxsize = new_maxsize
+
+        for instance in instances:
+            results_cache = _get_instance_caches(instance).get(wrapper)
+            if results_cache is None:
+                continue
+
+            while len(results_cache) > maxsize:
+                results_cache.popitem(last=False)
+                evictions += 1
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    wrapper.cache_evict = cache_evict
+
+    # Only bounded caches can be resized
+    if maxsize is not None:
+        wrapper.cache_resize = cache_resize
+
+    _memoized_functions.append(wrapper)
     return wrapper
 
 
+def memoize(func=None, maxsize=None, key=None, weak_keys=False):
+    """Memoizing decorator
+
+    Cache method call results for similar arguments. Results are stored by the instance whose method is called, in the
+    Bee._hive_memo_caches slot (or an instance attribute of the same name), so that they are released with the instance.
+    Classes (for memoized classmethods) store their results in a weak mapping.
+
+    Memoized functions provide cache_info(), cache_clear() and cache_evict(), and bounded functions cache_resize().
+
+    Instances which forward attribute access (through __getattr__) must initialise this attribute, as Bee does, so that
+    the caches of the proxied object are not found.
+
+    Can be used directly, or called with arguments to configure the cache:
+        @memoize(maxsize=128)
+
+    getinstance() results are weakly keyed by the HiveObject, so that they are released with the HiveObject:
+        @memoize(weak_keys=True)
+
+    :param func: function to decorate
+    :param maxsize: maximum number of results cached per instance, evicting least recently used results. If None,
+    the cache is unbounded
+    :param key: optional callable to derive a hashable cache key from the tuple of call arguments
+    :param weak_keys: if True, results are held only whilst the cache key is alive (by default, the first argument).
+    Weakly keyed caches cannot be bounded
+    """
+    if maxsize is not None and maxsize < 1:
+        raise ValueError("maxsize must be a positive integer or None")
+
+    if weak_keys and maxsize is not None:
+        raise ValueError("Weakly keyed caches cannot be bounded")
+
+    if func is None:
+        def decorator(func):
+            return _make_memoize(func, maxsize, key, weak_keys)
+
+        return decorator
+
+    return _make_memoize(func, maxsize, key, weak_keys)
+
+
+def get_memo_statistics():
+    """Return a dictionary of MemoInfo for each memoized function, keyed by qualified function name"""
+    return {"{}.{}".format(wrapper.__module__, wrapper.__qualname__): wrapper.cache_info()
+            for wrapper in _memoized_functions}
+
+
 class MemoProperty:
 
     def __init__(self, fget):
@@ -46,4 +326,4 @@ class MemoProperty:
 
 
 def memo_property(fget):
-    return MemoProperty(fget)
\ No newline at end of file
+    return MemoProperty(fget)
@@ -1,3 +1,4 @@
+from .classes import TaskSet
 from .exception import HiveConnectionError
 from .manager import ModeFactory, memoize
 from .protocols import TriggerTarget, ConnectTarget, TriggerSource, Callable, Bee, Bindable, Nameable
@@ -5,6 +6,7 @@ from .protocols import TriggerTarget, ConnectTarget, TriggerSource, Callable, Be
 
 class Modifier(TriggerTarget, ConnectTarget, Bindable, Callable, Nameable):
     """Callable Python snippet which is passed the current run hive"""
+    __slots__ = ("_func", "_run_hive")
 
     def __init__(self, func, run_hive=None):
         assert callable(func), func
@@ -12,6 +14,8 @@ class Modifier(TriggerTarget, ConnectTarget, Bindable, Callable, Nameable):
         self._func = func
         self._run_hive = run_hive
 
+        super().__init__()
+
     def __call__(self):
         self.trigger()
 
@@ -49,7 +53,7 @@ class ModifierBuilder(Bee, TriggerTarget, ConnectTarget):
 
         super().__init__()
 
-    @memoize
+    @memoize(weak_keys=True)
     def getinstance(self, hive_object):
         func = self._target
         if isinstance(func, Bee):
@@ -67,4 +71,49 @@ class ModifierBuilder(Bee, TriggerTarget, ConnectTarget):
         return "Modifier({!r})".format(self._target)
 
 
+class AsyncModifier(Modifier):
+    """Coroutine function which is passed the current run hive, and scheduled on the running event loop when
+    triggered
+    """
+    __slots__ = ("_tasks",)
+
+    def __init__(self, func, run_hive=None):
+        self._tasks = TaskSet()
+
+        super().__init__(func, run_hive)
+
+    def __call__(self):
+        return self.trigger()
+
+    def trigger(self):
+        """Schedule the coroutine, returning its task"""
+        return self._tasks.create_task(self._func(self._run_hive))
+
+    def unbind(self, run_hive):
+        bound = super().unbind(run_hive)
+
+        if bound is not None:
+            bound._tasks.cancel()
+
+        return bound
+
+
+class AsyncModifierBuilder(ModifierBuilder):
+    """Coroutine function which is passed the current run hive, and scheduled on the running event loop when
+    triggered
+    """
+
+    @memoize(weak_keys=True)
+    def getinstance(self, hive_object):
+        func = self._target
+        if isinstance(func, Bee):
+            func = func.getinstance(hive_object)
+
+        return AsyncModifier(func)
+
+    def __repr__(self):
+        return "AsyncModifier({!r})".format(self._target)
+
+
 modifier = ModeFactory("hive.modifier", immediate=Modifier, build=ModifierBuilder)
+async_modifier = ModeFactory("hive.async_modifier", immediate=AsyncModifier, build=AsyncModifierBuilder)
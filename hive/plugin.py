@@ -7,6 +7,8 @@ from .typing import is_valid_data_type
 
 
 class HivePlugin(Exportable, Bindable, Plugin, ConnectSource, Nameable):
+    __slots__ = ("_run_hive", "_func", "_data_type")
+
     def __init__(self, func, data_type='', run_hive=None):
         if not is_valid_data_type(data_type):
             raise ValueError(data_type)
@@ -97,7 +99,7 @@ class HivePluginBuilder(Exportable, Plugin, ConnectSource):
     def identifier(self):
         return self._identifier
 
-    @memoize
+    @memoize(weak_keys=True)
     def getinstance(self, hive_object):
         target = self._target
         if isinstance(target, Bee):
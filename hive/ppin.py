@@ -1,7 +1,8 @@
 from functools import partial
+from inspect import isawaitable
 
 from .annotations import get_argument_types
-from .classes import Pusher
+from .classes import Pusher, TaskSet
 from .exception import HiveConnectionError
 from .manager import memoize, ModeFactory
 from .protocols import (Antenna, Output, Stateful, ConnectTarget, TriggerSource, TriggerTarget, Bindable, Callable,
@@ -18,6 +19,9 @@ def get_callable_data_type(target):
 
 
 class PPInBase(Bindable, Antenna, ConnectTarget, TriggerSource, Nameable):
+    __slots__ = ("target", "data_type", "_set_value", "_run_hive", "_trigger", "_pretrigger", "_push_trigger",
+                 "_push_pretrigger")
+
     def __init__(self, target, data_type='', run_hive=None):
         if not is_valid_data_type(data_type):
             raise ValueError(data_type)
@@ -27,8 +31,13 @@ class PPInBase(Bindable, Antenna, ConnectTarget, TriggerSource, Nameable):
 
         if isinstance(target, Stateful):
             data_type = target.data_type
+
             # If not yet bound, set_value will have None for run hive!
-            self._set_value = partial(target._hive_stateful_setter, run_hive)
+            if run_hive is None:
+                self._set_value = partial(target._hive_stateful_setter, run_hive)
+
+            else:
+                self._set_value = target._hive_stateful_bound_setter(run_hive)
 
         else:
             if data_type_is_untyped(data_type):
@@ -39,8 +48,8 @@ class PPInBase(Bindable, Antenna, ConnectTarget, TriggerSource, Nameable):
         self.data_type = data_type
 
         self._run_hive = run_hive
-        self._trigger = Pusher(self)
-        self._pretrigger = Pusher(self)
+        self._trigger = Pusher(self, bind_as="_push_trigger")
+        self._pretrigger = Pusher(self, bind_as="_push_pretrigger")
 
         super().__init__()
 
@@ -61,20 +70,35 @@ class PPInBase(Bindable, Antenna, ConnectTarget, TriggerSource, Nameable):
 
         return self.__class__(target, data_type=self.data_type, run_hive=run_hive)
 
+    def unbind(self, run_hive):
+        bound = super().unbind(run_hive)
+
+        if bound is not None:
+            bound._trigger.clear()
+            bound._pretrigger.clear()
+
+        target = self.target
+        if isinstance(target, Bindable):
+            target.unbind(run_hive)
+
+        return bound
+
     def __repr__(self):
         return "{}({!r}, {!r}, {!r})".format(self.__class__.__name__, self.target, self.data_type, self._run_hive)
 
 
 class PushIn(PPInBase):
+    __slots__ = ()
+
     mode = "push"
 
     def push(self, value):
         # TODO: exception handling hooks
-        self._pretrigger.push()
+        self._push_pretrigger()
 
         self._set_value(value)
 
-        self._trigger.push()
+        self._push_trigger()
 
     def _hive_is_connectable_target(self, source):
         if not isinstance(source, Output):
@@ -91,17 +115,23 @@ class PushIn(PPInBase):
 
 
 class PullIn(PPInBase, TriggerTarget):
+    __slots__ = ("_pull_callback",)
+
     mode = "pull"
-    _pull_callback = None
+
+    def __init__(self, target, data_type='', run_hive=None):
+        self._pull_callback = None
+
+        super().__init__(target, data_type, run_hive)
 
     def pull(self):
         # TODO: exception handling hooks
-        self._pretrigger.push()
+        self._push_pretrigger()
         value = self._pull_callback()
 
         self._set_value(value)
 
-        self._trigger.push()
+        self._push_trigger()
 
     def _hive_is_connectable_target(self, source):
         if not isinstance(source, Output):
@@ -125,6 +155,47 @@ class PullIn(PPInBase, TriggerTarget):
     __call__ = pull
 
 
+class AsyncPullIn(PullIn):
+    """Pull input whose source may return an awaitable (e.g. a pull_out of a coroutine function).
+
+    When triggered, the pull is scheduled on the running event loop; pull_async() may instead be awaited directly
+    """
+    __slots__ = ("_tasks",)
+
+    def __init__(self, target, data_type='', run_hive=None):
+        self._tasks = TaskSet()
+
+        super().__init__(target, data_type, run_hive)
+
+    async def pull_async(self):
+        self._push_pretrigger()
+        value = self._pull_callback()
+
+        if isawaitable(value):
+            value = await value
+
+        self._set_value(value)
+
+        self._push_trigger()
+
+    def pull(self):
+        """Schedule the pull, returning its task"""
+        return self._tasks.create_task(self.pull_async())
+
+    def unbind(self, run_hive):
+        bound = super().unbind(run_hive)
+
+        if bound is not None:
+            bound._tasks.cancel()
+
+        return bound
+
+    def _hive_trigger_target(self):
+        return self.pull
+
+    __call__ = pull
+
+
 class PPInBuilder(Bee, Antenna, ConnectTarget, TriggerSource):
     mode = None
 
@@ -149,7 +220,7 @@ class PPInBuilder(Bee, Antenna, ConnectTarget, TriggerSource):
 
         super().__init__()
 
-    @memoize
+    @memoize(weak_keys=True)
     def getinstance(self, hive_object):
         target = self.target
 
@@ -159,7 +230,7 @@ class PPInBuilder(Bee, Antenna, ConnectTarget, TriggerSource):
         if self.mode == "push":
             return PushIn(target, data_type=self.data_type)
 
-        return PullIn(target, data_type=self.data_type)
+        return self.pull_in_class(target, data_type=self.data_type)
 
     def __repr__(self):
         return "{}({!r}, {!r})".format(self.__class__.__name__, self.target, self.data_type)
@@ -171,7 +242,13 @@ class PushInBuilder(PPInBuilder):
 
 class PullInBuilder(PPInBuilder, TriggerTarget):
     mode = "pull"
+    pull_in_class = PullIn
+
+
+class AsyncPullInBuilder(PullInBuilder):
+    pull_in_class = AsyncPullIn
 
 
 push_in = ModeFactory("hive.push_in", immediate=PushIn, build=PushInBuilder)
 pull_in = ModeFactory("hive.pull_in", immediate=PullIn, build=PullInBuilder)
+async_pull_in = ModeFactory("hive.async_pull_in", immediate=AsyncPullIn, build=AsyncPullInBuilder)
@@ -10,6 +10,9 @@ from .typing import data_type_is_untyped, data_types_match, MatchFlags, is_valid
 
 
 class PPOutBase(Bindable, Output, ConnectSource, TriggerSource, Nameable):
+    __slots__ = ("target", "data_type", "_get_value", "_run_hive", "_trigger", "_pretrigger", "_push_trigger",
+                 "_push_pretrigger")
+
     def __init__(self, target, data_type='', run_hive=None):
         if not is_valid_data_type(data_type):
             raise ValueError(data_type)
@@ -21,7 +24,12 @@ class PPOutBase(Bindable, Output, ConnectSource, TriggerSource, Nameable):
 
         if is_stateful:
             data_type = target.data_type
-            self._get_value = partial(target._hive_stateful_getter, run_hive)
+
+            if run_hive is None:
+                self._get_value = partial(target._hive_stateful_getter, run_hive)
+
+            else:
+                self._get_value = target._hive_stateful_bound_getter(run_hive)
 
         else:
             if data_type_is_untyped(data_type):
@@ -33,8 +41,8 @@ class PPOutBase(Bindable, Output, ConnectSource, TriggerSource, Nameable):
         self.data_type = data_type
 
         self._run_hive = run_hive
-        self._trigger = Pusher(self)
-        self._pretrigger = Pusher(self)
+        self._trigger = Pusher(self, bind_as="_push_trigger")
+        self._pretrigger = Pusher(self, bind_as="_push_pretrigger")
 
         super().__init__()
 
@@ -49,6 +57,19 @@ class PPOutBase(Bindable, Output, ConnectSource, TriggerSource, Nameable):
 
         return self.__class__(target, data_type=self.data_type, run_hive=run_hive)
 
+    def unbind(self, run_hive):
+        bound = super().unbind(run_hive)
+
+        if bound is not None:
+            bound._trigger.clear()
+            bound._pretrigger.clear()
+
+        target = self.target
+        if isinstance(target, Bindable):
+            target.unbind(run_hive)
+
+        return bound
+
     def _hive_trigger_source(self, func):
         self._trigger.add_target(func)
 
@@ -60,13 +81,15 @@ class PPOutBase(Bindable, Output, ConnectSource, TriggerSource, Nameable):
 
 
 class PullOut(PPOutBase):
+    __slots__ = ()
+
     mode = "pull"
 
     def pull(self):
         # TODO: exception handling hooks
-        self._pretrigger.push()
+        self._push_pretrigger()
         value = self._get_value()
-        self._trigger.push()
+        self._push_trigger()
 
         return value
 
@@ -86,6 +109,8 @@ class PullOut(PPOutBase):
 
 
 class PushOut(PPOutBase, Socket, TriggerTarget):
+    __slots__ = ("_targets",)
+
     mode = "push"
 
     def __init__(self, target, data_type='', run_hive=None):
@@ -95,14 +120,22 @@ class PushOut(PPOutBase, Socket, TriggerTarget):
 
     def push(self):
         # TODO: exception handling hooks
-        self._pretrigger.push()
+        self._push_pretrigger()
 
         value = self._get_value()
 
         for target in self._targets:
             target(value)
 
-        self._trigger.push()
+        self._push_trigger()
+
+    def unbind(self, run_hive):
+        bound = super().unbind(run_hive)
+
+        if bound is not None:
+            bound._targets.clear()
+
+        return bound
 
     def socket(self):
         return self.push
@@ -149,7 +182,7 @@ class PPOutBuilder(Bee, Output, ConnectSource, TriggerSource):
 
         super().__init__()
 
-    @memoize
+    @memoize(weak_keys=True)
     def getinstance(self, hive_object):
         target = self.target
 
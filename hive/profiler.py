@@ -0,0 +1,263 @@
+"""Profiling of the build and instantiation phases of hives.
+
+Within a profile_build() context, the wall time and call count of each build phase are recorded in a tree of
+ProfileNodes, keyed by (category, name):
+    build           HiveObject class built by a HiveBuilder (name of the HiveBuilder)
+    declarator      declarator function
+    builder         builder function (qualified by module, which distinguishes hivemap-generated builders)
+    namespace       HiveBuilder._hive_build_namespace
+    connectivity    HiveBuilder._hive_build_connectivity (plugin and socket matchmaking)
+    validation      matchmaking policy validation
+    instantiate     RuntimeHive.__init__ (name of the HiveBuilder)
+    builder_cls     builder class __init__
+    getinstance     bee.getinstance() (name of the bee class)
+    bind            bee.bind() (name of the bee class)
+
+When no profiler is active, instrumented code only tests whether get_build_profiler() returned None.
+"""
+from collections import namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+
+
+ProfileEntry = namedtuple("ProfileEntry", "category name calls total_time self_time")
+
+
+# Profilers are scoped to the context (thread or asyncio task) in which they are activated
+_profiler = ContextVar("hive_build_profiler", default=None)
+
+
+def get_build_profiler():
+    """Return the active BuildProfiler, or None"""
+    return _profiler.get()
+
+
+def get_callable_name(func):
+    """Return the qualified name of a function or class"""
+    module = getattr(func, "__module__", None)
+    name = getattr(func, "__qualname__", None) or getattr(func, "__name__", None) or repr(func)
+
+    if module is None:
+        return name
+
+    return "{}.{}".format(module, name)
+
+
+class ProfileNode:
+    """Wall time and call count of a build phase, within its parent phase"""
+
+    __slots__ = ("category", "name", "calls", "total_time", "children")
+
+    def __init__(self, category, name):
+        self.category = category
+        self.name = name
+        self.calls = 0
+        self.total_time = 0.0
+        self.children = {}
+
+    @property
+    def self_time(self):
+        """Time spent in this phase, excluding its child phases"""
+        return self.total_time - sum(child.total_time for child in self.children.values())
+
+    def __repr__(self):
+        return "<ProfileNode {}:{} calls={} total={:.6f}s>".format(self.category, self.name, self.calls,
+                                                                   self.total_time)
+
+
+class _InactiveSection:
+    """Context manager used when no profiler is active"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_inactive_section = _InactiveSection()
+
+
+class BuildProfiler:
+    """Records the wall time and call counts of build phases"""
+
+    def __init__(self):
+        self.root = ProfileNode("profile", "root")
+        self._stack = [self.root]
+
+    def enter(self, category, name):
+        """Enter a phase, returning the start time to be passed to exit()
+
+        :param category: category of phase
+        :param name: name of phase, or function (or class) from which the name is taken
+        """
+        parent = self._stack[-1]
+        key = category, name
+
+        try:
+            node = parent.children[key]
+
+        except KeyError:
+            if not isinstance(name, str):
+                name = get_callable_name(name)
+
+            node = parent.children[key] = ProfileNode(category, name)
+
+        node.calls += 1
+        self._stack.append(node)
+
+        return perf_counter()
+
+    def exit(self, start_time):
+        """Exit the current phase
+
+        :param start_time: time returned by enter()
+        """
+        node = self._stack.pop()
+        node.total_time += perf_counter() - start_time
+
+    @contextmanager
+    def section(self, category, name):
+        """Context manager which records a phase
+
+        :param category: category of phase
+        :param name: name of phase (see enter())
+        """
+        start_time = self.enter(category, name)
+
+        try:
+            yield
+
+        finally:
+            self.exit(start_time)
+
+    def call(self, category, name, func, *args):
+        """Call a function, recording it as a phase
+
+        :param category: category of phase
+        :param name: name of phase (see enter())
+        :param func: function to call
+        """
+        start_time = self.enter(category, name)
+
+        try:
+            return func(*args)
+
+        finally:
+            self.exit(start_time)
+
+    def iter_tree(self):
+        """Yield (depth, node) pairs for each node of the tree (excluding the root), depth-first"""
+        pending = [(0, node) for node in reversed(list(self.root.children.values()))]
+
+        while pending:
+            depth, node = pending.pop()
+            yield depth, node
+
+            pending.extend((depth + 1, child) for child in reversed(list(node.children.values())))
+
+    def get_flat_table(self):
+        """Return a list of ProfileEntry, one per (category, name), sorted by self time (largest first).
+
+        Total time is not counted again for phases which recursively re-enter themselves
+        """
+        totals = {}
+
+        def visit(node, active_keys):
+            key = node.category, node.name
+
+            try:
+                calls, total_time, self_time = totals[key]
+
+            except KeyError:
+                calls, total_time, self_time = 0, 0.0, 0.0
+
+            if key not in active_keys:
+                total_time += node.total_time
+
+            totals[key] = calls + node.calls, total_time, self_time + node.self_time
+
+            child_active_keys = active_keys | {key}
+            for child in node.children.values():
+                visit(child, child_active_keys)
+
+        for node in self.root.children.values():
+            visit(node, frozenset())
+
+        entries = [ProfileEntry(category, name, *values) for (category, name), values in totals.items()]
+        entries.sort(key=lambda entry: entry.self_time, reverse=True)
+        return entries
+
+    def format_tree(self, min_time=0.0):
+        """Return the tree of phases as a string
+
+        :param min_time: phases (and their children) taking less time than this are omitted
+        """
+        lines = ["{:>10} {:>10} {:>8}  {}".format("total ms", "self ms", "calls", "phase")]
+        skip_depth = None
+
+        for depth, node in self.iter_tree():
+            if skip_depth is not None:
+                if depth > skip_depth:
+                    continue
+
+                skip_depth = None
+
+            if node.total_time < min_time:
+                skip_depth = depth
+                continue
+
+            lines.append("{:>10.3f} {:>10.3f} {:>8}  {}{}: {}".format(node.total_time * 1e3, node.self_time * 1e3,
+                                                                      node.calls, "  " * depth, node.category,
+                                                                      node.name))
+
+        return "\n".join(lines)
+
+    def format_flat_table(self, limit=None):
+        """Return the flat table of phases as a string
+
+        :param limit: maximum number of rows
+        """
+        lines = ["{:>10} {:>10} {:>8}  {}".format("total ms", "self ms", "calls", "phase")]
+
+        for entry in self.get_flat_table()[:limit]:
+            lines.append("{:>10.3f} {:>10.3f} {:>8}  {}: {}".format(entry.total_time * 1e3, entry.self_time * 1e3,
+                                                                    entry.calls, entry.category, entry.name))
+
+        return "\n".join(lines)
+
+
+def profile_section(category, name):
+    """Return a context manager which records a phase with the active profiler, if any
+
+    :param category: category of phase
+    :param name: name of phase
+    """
+    profiler = _profiler.get()
+    if profiler is None:
+        return _inactive_section
+
+    return profiler.section(category, name)
+
+
+@contextmanager
+def profile_build():
+    """Context manager which profiles the building and instantiation of hives, yielding a BuildProfiler.
+
+    HiveObject classes are cached, so hives built before the profiler is active are not rebuilt:
+        with hive.profile_build() as profiler:
+            my_hive = MyHive()
+
+        print(profiler.format_tree())
+    """
+    profiler = BuildProfiler()
+    token = _profiler.set(profiler)
+
+    try:
+        yield profiler
+
+    finally:
+        _profiler.reset(token)
@@ -1,3 +1,5 @@
+from functools import partial
+from operator import attrgetter
 from weakref import WeakSet
 
 from builtins import property as py_property
@@ -40,6 +42,27 @@ class Property(Exportable, Bindable, Stateful, Nameable):
 
         setattr(instance, self._attr, value)
 
+    def _hive_stateful_bound_getter(self, run_hive):
+        instance = run_hive._hive_build_class_to_instance[self._cls]
+
+        return partial(getattr, instance, self._attr)
+
+    def _hive_stateful_bound_setter(self, run_hive):
+        instance = run_hive._hive_build_class_to_instance[self._cls]
+
+        return partial(setattr, instance, self._attr)
+
+    def _hive_stateful_descriptor(self, drone_attributes):
+        drone_attribute = drone_attributes[self._cls]
+        attr = self._attr
+
+        get_instance = attrgetter(drone_attribute)
+
+        def fset(run_hive, value):
+            setattr(get_instance(run_hive), attr, value)
+
+        return py_property(attrgetter("{}.{}".format(drone_attribute, attr)), fset)
+
     def export(self):
         return self
 
@@ -58,6 +81,11 @@ class Property(Exportable, Bindable, Stateful, Nameable):
 
         return self
 
+    def unbind(self, run_hive):
+        self._bound.discard(run_hive)
+
+        return super().unbind(run_hive)
+
     def __repr__(self):
         return "Property({!r}, {!r}, {!r}, {!r})".format(self._cls, self._attr, self._data_type, self.start_value)
 
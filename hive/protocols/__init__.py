@@ -1,8 +1,6 @@
 from collections import namedtuple
 from weakref import ref
 
-from ..manager import memo_property
-
 
 class Parameter:
     _hive_parameter_name = None
@@ -15,17 +13,26 @@ class Parameter:
 
 
 class Connectable:
-    pass
+    __slots__ = ()
 
 
 RuntimeAlias = namedtuple("RuntimeAlias", "parent_ref name")
 
 
 class Nameable:
-    # TOOD move this to bee
-    @memo_property
+    """Bee which records the runtime hives (and attribute names) under which it is referred.
+
+    Aliases are stored in the Bee._hive_aliases slot, which is only populated when the first alias is registered
+    """
+    __slots__ = ()
+
+    @property
     def _hive_runtime_aliases(self):
-        return set()
+        aliases = self._hive_aliases
+        if aliases is None:
+            aliases = self._hive_aliases = set()
+
+        return aliases
 
     def register_alias(self, parent, name):
         """Register alias to this bee as a child of a given parent hive, under attribute name
@@ -36,17 +43,32 @@ class Nameable:
         alias = RuntimeAlias(ref(parent), name)
         self._hive_runtime_aliases.add(alias)
 
+    def unregister_aliases(self, parent):
+        """Unregister all aliases to this bee as a child of a given parent hive (and of parents which no longer exist)
+
+        :param parent: runtime hive instance
+        """
+        aliases = self._hive_aliases
+        if not aliases:
+            return
+
+        for alias in list(aliases):
+            alias_parent = alias.parent_ref()
+
+            if alias_parent is parent or alias_parent is None:
+                aliases.remove(alias)
+
 
 class Callable:
-    pass
+    __slots__ = ()
 
 
 class Plugin:
-    pass
+    __slots__ = ()
 
 
 class Socket:
-    pass
+    __slots__ = ()
 
 
 from .bees import Bindable, Exportable, Bee
@@ -13,6 +13,8 @@ Hence, Bindable and Exportable must be Bees
 
 from abc import ABC, abstractmethod
 from logging import getLogger
+
+from . import Nameable
 from ..contexts import get_building_hive
 
 
@@ -22,13 +24,19 @@ logger = getLogger(__name__)
 class Bee:
     # TODO: resolve method for arguments that are bees (returns a new HiveBee class?)
 
-    _parent_hive_object_cls = None
-    _hive_wrapper_name = None
+    # Bees are created for each runtime hive, so instance attributes are declared as slots.
+    # Protocol mixins declare empty slots, so that concrete bees may also declare their own
+    __slots__ = ("_parent_hive_object_cls", "_hive_wrapper_name", "_hive_aliases", "_hive_memo_caches", "__weakref__")
 
     def __init__(self):
         self._parent_hive_object_cls = get_building_hive()
+        self._hive_wrapper_name = None
+        self._hive_aliases = None
+        self._hive_memo_caches = None
+
         if get_building_hive() is None:
-            logger.warning("Building hive is none for {}, is this the root hive?".format(self))
+            # Defer formatting, as the warning is usually disabled
+            logger.warning("Building hive is none for %s, is this the root hive?", self)
 
     def implements(self, cls):
         """Return True if the Bee returned by getinstance will implement a given class
@@ -42,12 +50,35 @@ class Bee:
 
 
 class Bindable(Bee, ABC):
+    __slots__ = ()
+
     @abstractmethod
     def bind(self, run_hive):
         raise NotImplementedError
 
+    def unbind(self, run_hive):
+        """Release the bee returned by bind() for a runtime hive which is being disposed.
+
+        Return the released bee, or None if this bee was not bound to the runtime hive
+
+        :param run_hive: runtime hive
+        """
+        # Only memoized bind() results are retained
+        cache_evict = getattr(type(self).bind, "cache_evict", None)
+        if cache_evict is None:
+            return None
+
+        bound = cache_evict(self, run_hive)
+
+        if isinstance(bound, Nameable):
+            bound.unregister_aliases(run_hive)
+
+        return bound
+
 
 class Exportable(Bee, ABC):
+    __slots__ = ()
+
     export_only = True
 
     @abstractmethod
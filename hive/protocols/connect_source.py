@@ -15,10 +15,12 @@ from abc import ABC, abstractmethod
 
 
 class ConnectSourceBase(Connectable, ABC):
-    pass
+    __slots__ = ()
 
 
 class ConnectSource(ConnectSourceBase):
+    __slots__ = ()
+
     data_type = None
 
     def _hive_is_connectable_source(self, target):
@@ -29,9 +31,16 @@ class ConnectSource(ConnectSourceBase):
 
 
 class ConnectSourceDerived(ConnectSourceBase):
+    __slots__ = ()
 
     def _hive_find_connect_sources(self):
         raise NotImplementedError
 
+    def _hive_find_connect_sources_by_key(self):
+        raise NotImplementedError
+
+    def _hive_find_connect_source(self, target):
+        raise NotImplementedError
+
     def _hive_get_connect_source(self, target):
         raise NotImplementedError
\ No newline at end of file
@@ -12,10 +12,12 @@ from . import Connectable
 
 
 class ConnectTargetBase(Connectable):
-    pass
+    __slots__ = ()
 
 
 class ConnectTarget(ConnectTargetBase):
+    __slots__ = ()
+
     data_type = None
 
     def _hive_is_connectable_target(self, source):
@@ -25,10 +27,17 @@ class ConnectTarget(ConnectTargetBase):
         raise NotImplementedError
 
 
-class ConnectTargetDerived(ConnectTargetBase):    
+class ConnectTargetDerived(ConnectTargetBase):
+    __slots__ = ()
 
     def _hive_find_connect_targets(self):
         raise NotImplementedError
 
+    def _hive_find_connect_targets_by_key(self):
+        raise NotImplementedError
+
+    def _hive_find_connect_target(self, source):
+        raise NotImplementedError
+
     def _hive_get_connect_target(self, source):
         raise NotImplementedError    
@@ -1,8 +1,10 @@
 class IO:
-    pass
+    __slots__ = ()
 
 
 class Antenna(IO):
+    __slots__ = ()
+
     mode = None #must be push or pull
 
     def push(self): #only needs to be defined if mode is "push"
@@ -10,6 +12,8 @@ class Antenna(IO):
 
 
 class Output(IO):
+    __slots__ = ()
+
     mode = None #must be push or pull
 
     def pull(self): #only needs to be defined if mode is "pull"
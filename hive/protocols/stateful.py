@@ -6,15 +6,50 @@ The getter/setter of this attribute are hiveinstance._hive_stateful.getter and h
  respectively
  
 A Stateful object's getter/setter always accept a run_hive object, which will be None in immediate mode
+
+The descriptor used for this attribute is returned by _hive_stateful_descriptor, when the runtime hive class is built
+Stateful objects may specialise this descriptor, and the bound getter/setter used by bees bound to a runtime hive
+ (_hive_stateful_bound_getter and _hive_stateful_bound_setter), to avoid per-access lookups
+
+Stateful objects which set stateful_slot_storage store their values on the runtime hive itself
+Instead of a descriptor, the runtime hive class is given a slot, whose member descriptor is passed to
+ _hive_set_stateful_slot. The slot is then read and written directly by attribute access on the runtime hive
 """
+from functools import partial
 
 
 class Stateful(object):
+    __slots__ = ()
 
     data_type = None
+    stateful_slot_storage = False
 
     def _hive_stateful_getter(self, run_hive):
         raise NotImplementedError
 
     def _hive_stateful_setter(self, run_hive, value):
         raise NotImplementedError    
+
+    def _hive_stateful_bound_getter(self, run_hive):
+        """Return callable which gets the value for a runtime hive
+
+        :param run_hive: runtime hive
+        """
+        return partial(self._hive_stateful_getter, run_hive)
+
+    def _hive_stateful_bound_setter(self, run_hive):
+        """Return callable which sets the value for a runtime hive
+
+        :param run_hive: runtime hive
+        """
+        return partial(self._hive_stateful_setter, run_hive)
+
+    def _hive_stateful_descriptor(self, drone_attributes):
+        """Return descriptor which exposes the value on the runtime hive class
+
+        :param drone_attributes: mapping from builder class to runtime hive attribute name of its instance
+        """
+        return property(self._hive_stateful_getter, self._hive_stateful_setter)
+
+    def _hive_set_stateful_slot(self, slot):
+        raise NotImplementedError
@@ -8,10 +8,11 @@ from . import Connectable
 
 
 class TriggerSourceBase(Connectable):
-    pass
+    __slots__ = ()
 
 
 class TriggerSource(TriggerSourceBase):
+    __slots__ = ()
 
     def _hive_trigger_source(self, target):
         raise NotImplementedError
@@ -21,6 +22,7 @@ class TriggerSource(TriggerSourceBase):
 
 
 class TriggerSourceDerived(TriggerSourceBase):
+    __slots__ = ()
 
     def _hive_get_trigger_source(self):
         raise NotImplementedError
\ No newline at end of file
@@ -10,7 +10,7 @@ class BindableResolveBee(Bindable, Nameable):
         self._unbound_run_hive = unbound_run_hive
 
         # Support ResolveBees used for hive_objects
-        self._hive_object = getattr(bee, '._hive_object', None)
+        self._hive_object = getattr(bee, '_hive_object', None)
 
     @property
     def _hive_runtime_aliases(self):
@@ -22,24 +22,44 @@ class BindableResolveBee(Bindable, Nameable):
         hive_instance = self._unbound_run_hive.bind(run_hive)
         return self._bee.bind(hive_instance)
 
+    def unbind(self, run_hive):
+        # The bee is released when the child hive is disposed
+        bound = super().unbind(run_hive)
+        self._unbound_run_hive.unbind(run_hive)
+        return bound
+
 
 class ResolveBee(Exportable):
     """Implements support for connecting between bees of different HiveObjects 
     (resolving the getinstance & bind methods)
+
+    ResolveBees of ResolveBees (for bees re-exported by each level of nested hives) only forward attribute access and
+    implements() to the bee they resolve, so these are taken directly from the concrete bee at the end of the chain.
+    Qualified resolve bees of child bees are cached as instance attributes, rather than allocated on each attribute
+    access.
     """
 
     def __init__(self, bee, own_hive_object):
         self._bee = bee
         self._own_hive_object = own_hive_object
 
+        if isinstance(bee, ResolveBee):
+            self._concrete_bee = bee._concrete_bee
+
+        else:
+            self._concrete_bee = bee
+
         super().__init__()
 
     def __getattr__(self, attr):
-        result = getattr(self._bee, attr)
+        result = getattr(self._concrete_bee, attr)
 
         # Return qualified resolve bee (replace child bee hiveobject with this resolution)
         if isinstance(result, ResolveBee):
             child_bee = ResolveBee(result._bee, self)
+
+            # Later access will not invoke __getattr__
+            self.__dict__[attr] = child_bee
             return child_bee
 
         return result
@@ -50,7 +70,7 @@ class ResolveBee(Exportable):
     def export(self):
         return self
 
-    @memoize
+    @memoize(weak_keys=True)
     def getinstance(self, redirected_hive_object):
         # Hive instance to which the ResolveBee belongs
         hive_instantiator = self._own_hive_object.getinstance(redirected_hive_object)
@@ -65,4 +85,4 @@ class ResolveBee(Exportable):
         return result
 
     def implements(self, cls):
-        return self._bee.implements(cls)
+        return self._concrete_bee.implements(cls)
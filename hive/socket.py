@@ -7,6 +7,8 @@ from .typing import is_valid_data_type
 
 
 class HiveSocket(Exportable, Bindable, Socket, ConnectTarget, Nameable):
+    __slots__ = ("_run_hive", "_func", "_data_type")
+
     def __init__(self, func, data_type="", run_hive=None):
         if not is_valid_data_type(data_type):
             raise ValueError(data_type)
@@ -93,7 +95,7 @@ class HiveSocketBuilder(Exportable, Socket, ConnectTarget):
     def policy(self):
         return self._policy
 
-    @memoize
+    @memoize(weak_keys=True)
     def getinstance(self, hive_object):
         target = self._target
         if isinstance(target, Bee):
@@ -40,6 +40,13 @@ class Trigger(Bindable):
 
         return build_trigger(source, target, self._pretrigger)
 
+    def unbind(self, run_hive):
+        for bee in (self._source, self._target):
+            if isinstance(bee, Bindable):
+                bee.unbind(run_hive)
+
+        return super().unbind(run_hive)
+
     def __repr__(self):
         return "Trigger({!r}, {!r}, {!r})".format(self._source, self._target, self._pretrigger)
 
@@ -52,7 +59,7 @@ class TriggerBuilder(Bee):
 
         super().__init__()
 
-    @memoize
+    @memoize(weak_keys=True)
     def getinstance(self, hive_object):
         source = self._source
         target = self._target
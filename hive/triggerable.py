@@ -5,6 +5,7 @@ from .protocols import TriggerTarget, ConnectTarget, TriggerSource, Callable, Be
 
 class Triggerable(Bindable, TriggerTarget, ConnectTarget, Callable, Nameable):
     """Callable Python snippet"""
+    __slots__ = ("_func", "_run_hive")
 
     def __init__(self, func, run_hive=None):
         assert callable(func) or isinstance(func, Callable), func
@@ -32,6 +33,13 @@ class Triggerable(Bindable, TriggerTarget, ConnectTarget, Callable, Nameable):
 
         return self.__class__(func, run_hive=run_hive)
 
+    def unbind(self, run_hive):
+        func = self._func
+        if isinstance(func, Bindable):
+            func.unbind(run_hive)
+
+        return super().unbind(run_hive)
+
     def _hive_trigger_target(self):
         return self.trigger
 
@@ -54,7 +62,7 @@ class TriggerableBuilder(Bee, TriggerTarget, ConnectTarget):
 
         super().__init__()
 
-    @memoize
+    @memoize(weak_keys=True)
     def getinstance(self, hive_object):
         func = self._func
         if isinstance(func, Bee):
@@ -6,6 +6,7 @@ from .protocols import TriggerSource, TriggerTarget, ConnectSource, Callable, Be
 
 class TriggerFunc(Bindable, TriggerSource, ConnectSource, Callable, Nameable):
     """Callable interface to HIVE (pre)trigger"""
+    __slots__ = ("_run_hive", "_func", "_trigger", "_pretrigger", "_push_trigger", "_push_pretrigger", "_name_counter")
 
     data_type = 'trigger'
 
@@ -14,8 +15,8 @@ class TriggerFunc(Bindable, TriggerSource, ConnectSource, Callable, Nameable):
         self._run_hive = run_hive
         self._func = func
 
-        self._trigger = Pusher(self)
-        self._pretrigger = Pusher(self)
+        self._trigger = Pusher(self, bind_as="_push_trigger")
+        self._pretrigger = Pusher(self, bind_as="_push_pretrigger")
 
         # TODO
         self._name_counter = 0
@@ -24,12 +25,12 @@ class TriggerFunc(Bindable, TriggerSource, ConnectSource, Callable, Nameable):
 
     def __call__(self, *args, **kwargs):
         # TODO: exception handling hooks
-        self._pretrigger.push()
+        self._push_pretrigger()
 
         if self._func is not None:
             self._func(*args, **kwargs)
 
-        self._trigger.push()
+        self._push_trigger()
 
     def _hive_trigger_source(self, target_func):
         self._trigger.add_target(target_func)
@@ -56,6 +57,19 @@ class TriggerFunc(Bindable, TriggerSource, ConnectSource, Callable, Nameable):
 
         return self.__class__(func, run_hive=run_hive)
 
+    def unbind(self, run_hive):
+        bound = super().unbind(run_hive)
+
+        if bound is not None:
+            bound._trigger.clear()
+            bound._pretrigger.clear()
+
+        func = self._func
+        if isinstance(func, Bindable):
+            func.unbind(run_hive)
+
+        return bound
+
     def __repr__(self):
         return "TriggerFunc({!r}, {!r})".format(self._func, self._run_hive)
 
@@ -68,7 +82,7 @@ class TriggerFuncBuilder(Bee, TriggerSource, ConnectSource, Callable):
 
         super().__init__()
 
-    @memoize
+    @memoize(weak_keys=True)
     def getinstance(self, hive_object):
         func = self._func
         if isinstance(func, Bee):
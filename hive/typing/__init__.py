@@ -1,4 +1,5 @@
-from .ast import TypeName, AnyType, CompositeType, SequenceType, MappingType, SimpleType, Type, get_match_score
+from .ast import (TypeName, AnyType, CompositeType, SequenceType, MappingType, SimpleType, Type, get_match_score,
+                  get_type_key)
 from .matching import (data_types_match, data_type_is_untyped, is_valid_data_type, type_asts_match, find_matching_ast,
-                       MatchFlags, get_base_data_type)
+                       find_scored_matching_ast, clear_match_cache, MatchFlags, get_base_data_type)
 from .parser import parse_type_string
@@ -11,6 +11,26 @@ TypeName = SimpleType.subclass("TypeName", "type_name")
 AnyType = SimpleType.subclass("AnyType")
 
 
+def get_type_key(type_ast):
+    """Return a hashable key describing the structure of a type AST.
+
+    Equal keys are returned for equal ASTs, so keys may be used to cache results for ASTs
+    """
+    if isinstance(type_ast, TypeName):
+        return TypeName, type_ast.type_name
+
+    if isinstance(type_ast, SequenceType):
+        return SequenceType, type_ast.type, get_type_key(type_ast.etype)
+
+    if isinstance(type_ast, MappingType):
+        return MappingType, type_ast.type, get_type_key(type_ast.ktype), get_type_key(type_ast.vtype)
+
+    if isinstance(type_ast, AnyType):
+        return AnyType,
+
+    raise TypeError("Unknown type AST: {!r}".format(type_ast))
+
+
 def get_match_score(match_ast, depth=1):
     score = depth
 
@@ -1,7 +1,8 @@
+from collections import OrderedDict
 from enum import auto, Flag
 
-from .ast import AnyType, CompositeType, MappingType, SequenceType, TypeName
-from .parser import parse_type_string
+from .ast import AnyType, CompositeType, MappingType, SequenceType, TypeName, get_match_score
+from .parser import parse_type_string, get_interned_type_key
 from ..exception import MatchFailedError, MatchCaseUnhandled, InvalidMatchCase
 
 
@@ -46,7 +47,7 @@ def find_type_name_type_name_match(source, target, flags):
 
 
 def find_sequence_sequence_match(source, target, flags):
-    element_ast = find_matching_ast(source.etype, target.etype, flags)
+    element_ast = _find_matching_ast(source.etype, target.etype, flags)
     return SequenceType(source.type, element_ast)
 
 
@@ -64,8 +65,8 @@ def find_composite_composite_match(source, target, flags):
 
 
 def find_mapping_mapping_match(source, target, flags):
-    key_ast = find_matching_ast(source.ktype, target.ktype, flags)
-    value_ast = find_matching_ast(source.vtype, target.vtype, flags)
+    key_ast = _find_matching_ast(source.ktype, target.ktype, flags)
+    value_ast = _find_matching_ast(source.vtype, target.vtype, flags)
 
     return MappingType(source.type, key_ast, value_ast)
 
@@ -156,7 +157,14 @@ def is_valid_data_type(string):
     return True
 
 
-def find_matching_ast(source, target, flags=MatchFlags.none):
+# Maximum number of (source, target, flags) match results which are cached
+MATCH_CACHE_SIZE = 4096
+
+# (source key, target key, flags) to (match AST, match score), or (exception class, None) if matching failed
+_match_cache = OrderedDict()
+
+
+def _find_matching_ast(source, target, flags):
     for matcher in _dispatch_table:
         try:
             return matcher(source, target, flags)
@@ -167,6 +175,73 @@ def find_matching_ast(source, target, flags=MatchFlags.none):
     raise InvalidMatchCase
 
 
+def _find_cached_match(source, target, flags):
+    """Return the cached (match AST, match score) for two type ASTs, matching them if not cached.
+
+    Raise MatchFailedError or InvalidMatchCase if they do not match
+    """
+    cache_key = get_interned_type_key(source), get_interned_type_key(target), flags
+
+    try:
+        result = _match_cache[cache_key]
+        _match_cache.move_to_end(cache_key)
+
+    except KeyError:
+        # Not cached, or evicted by another thread between the lookup and the reordering
+        try:
+            match = _find_matching_ast(source, target, flags)
+
+        except (MatchFailedError, InvalidMatchCase) as err:
+            result = err.__class__, None
+
+        else:
+            result = match, get_match_score(match)
+
+        _match_cache[cache_key] = result
+
+        if len(_match_cache) > MATCH_CACHE_SIZE:
+            try:
+                _match_cache.popitem(last=False)
+
+            except KeyError:
+                # Emptied by another thread
+                pass
+
+    match, score = result
+    if score is None:
+        raise match
+
+    return result
+
+
+def clear_match_cache():
+    """Clear cached match results"""
+    _match_cache.clear()
+
+
+def find_matching_ast(source, target, flags=MatchFlags.none):
+    """Return the AST of the match between source and target type ASTs.
+
+    Results are cached, so must not be modified
+
+    :param source: source type AST
+    :param target: target type AST
+    :param flags: MatchFlags
+    """
+    match, _ = _find_cached_match(source, target, flags)
+    return match
+
+
+def find_scored_matching_ast(source, target, flags=MatchFlags.none):
+    """Return the AST and score (see get_match_score) of the match between source and target type ASTs
+
+    :param source: source type AST
+    :param target: target type AST
+    :param flags: MatchFlags
+    """
+    return _find_cached_match(source, target, flags)
+
+
 def type_asts_match(source, target, flags=MatchFlags.none):
     try:
         find_matching_ast(source, target, flags)
@@ -1,92 +1,182 @@
-from derp.grammar import Grammar
-from derp.parsers import lit, parse
-from derp.utilities import unpack_n
-from grammars.ebnf.tokenizer import tokenize_text as _tokenize_text
+"""Parser for type strings.
 
-from .ast import AnyType, MappingType, SequenceType, TypeName
+The type language is small:
+    definition := sequence | mapping | type_name | "?"
+    sequence := ID "[" definition "]"
+    mapping := ID "[" definition "->" definition "]"
+    type_name := ID ("." ID)*
 
+where ID is a Python identifier, and whitespace between tokens is ignored.
+"""
+import re
 
-def tokenize_text(string):
-    """Change collections tokens from ID tokens to distinct token types"""
-    return strip_end_formatting_tokens(_tokenize_text(string))
+from .ast import AnyType, MappingType, SequenceType, TypeName, get_type_key
 
+# Each match is a single token, with any preceding whitespace
+_token_pattern = re.compile(r"\s*(?:(?P<ID>[^\W\d]\w*)|(?P<OP>->|[\[\].?]))")
+_trailing_pattern = re.compile(r"\s*")
 
-def strip_end_formatting_tokens(tokens):
-    token_list = list(tokens)
-    for token in reversed(token_list.copy()):
-        if token.first not in {'\n', 'ENDMARKER'}:
-            break
-        token_list.pop()
-    yield from token_list
 
+def tokenize_type_string(type_string):
+    """Return a list of (kind, value) tokens for a type string, where kind is "ID" or "OP"
 
-def parse_type_string(type_string):
-    if not isinstance(type_string, str):
-        if type_string is None:
+    :param type_string: type string
+    """
+    tokens = []
+    position = 0
+    end = len(type_string)
+    match_token = _token_pattern.match
+
+    while True:
+        match = match_token(type_string, position)
+
+        if match is None:
+            position = _trailing_pattern.match(type_string, position).end()
+
+            if position != end:
+                raise ValueError("Unable to parse type string: {}".format(type_string))
+
+            return tokens
+
+        tokens.append((match.lastgroup, match.group(match.lastgroup)))
+        position = match.end()
+
+
+class _TypeStringParser:
+    """Recursive descent parser for a single type string"""
+
+    def __init__(self, type_string):
+        self.type_string = type_string
+        self.tokens = tokenize_type_string(type_string)
+        self.position = 0
+
+    def error(self):
+        return ValueError("Unable to parse type string: {}".format(self.type_string))
+
+    def peek(self):
+        try:
+            return self.tokens[self.position]
+
+        except IndexError:
+            return None, None
+
+    def take(self, kind, value=None):
+        token_kind, token_value = self.peek()
+
+        if token_kind != kind or (value is not None and token_value != value):
+            raise self.error()
+
+        self.position += 1
+        return token_value
+
+    def parse(self):
+        type_ast = self.parse_definition()
+
+        if self.position != len(self.tokens):
+            raise self.error()
+
+        return type_ast
+
+    def parse_definition(self):
+        kind, value = self.peek()
+
+        if kind == "OP" and value == "?":
+            self.position += 1
             return AnyType()
-        raise ValueError("Require string or None for type string, not {!r}".format(type_string))
 
-    if not type_string:
-        return AnyType()
+        name = self.take("ID")
+        kind, value = self.peek()
 
-    tokens = strip_end_formatting_tokens(tokenize_text(type_string))
-    tree = parse(t.definition, tokens)
+        if kind == "OP":
+            if value == "[":
+                self.position += 1
+                return self.parse_collection(name)
 
-    if len(tree) != 1:
-        raise ValueError("Unable to parse type string: {}".format(type_string))
+            if value == ".":
+                return self.parse_type_name(name)
 
-    return tree.pop()
+        return TypeName((name,))
 
+    def parse_collection(self, name):
+        first = self.parse_definition()
 
-def emit_sequence(args):
-    type_name, specialism = args
-    return SequenceType(type_name, specialism)
+        if self.peek() == ("OP", "->"):
+            self.position += 1
+            second = self.parse_definition()
+            self.take("OP", "]")
 
+            return MappingType(name, first, second)
 
-def emit_mapping(args):
-    type_name, _, key, _, _, value, _ = unpack_n(args, 7)
-    return MappingType(type_name, key, value)
+        self.take("OP", "]")
+        return SequenceType(name, first)
 
+    def parse_type_name(self, name):
+        names = [name]
 
-def emit_single_specialism(args):
-    _, name, _ = unpack_n(args, 3)
-    return name
+        while self.peek() == ("OP", "."):
+            self.position += 1
+            names.append(self.take("ID"))
 
+        return TypeName(tuple(names))
 
-def reduce(op, seq):
-    left, *remainder = tuple(seq)
-    for item in remainder:
-        left = op(left, item)
-    return left
 
+# Type string to interned AST. Type strings are drawn from a small vocabulary, so this is not bounded
+_interned_asts = {}
 
-def emit_simple_type_name(args):
-    root, delimited = args
+# Type key to interned AST
+_interned_asts_by_key = {}
 
-    type_name = root,
+# id() of interned AST to its type key. Interned ASTs are never released, so their ids are not reused
+_interned_type_keys = {}
+
+
+def parse_type_string(type_string):
+    """Return the AST of a type string.
+
+    The same AST instance is returned for every call with equal type strings, so ASTs must not be modified
+
+    :param type_string: type string, or None (untyped)
+    """
+    try:
+        return _interned_asts[type_string]
+
+    except KeyError:
+        pass
+
+    except TypeError:
+        raise ValueError("Require string or None for type string, not {!r}".format(type_string))
 
-    if delimited != '':
-        _, following = zip(*delimited)
-        type_name = type_name + following
+    type_ast = _parse_type_string(type_string)
 
-    return TypeName(type_name)
+    # Share a single AST between equal types, regardless of formatting
+    type_key = get_type_key(type_ast)
+    type_ast = _interned_asts_by_key.setdefault(type_key, type_ast)
 
+    _interned_asts[type_string] = type_ast
+    _interned_type_keys[id(type_ast)] = type_key
 
-def emit_any_type(args):
-    return AnyType()
+    return type_ast
 
 
-t = Grammar('types')
-t.single_specialism = (lit('[') & t.definition & lit(']')) >> emit_single_specialism
-t.sequence = (lit('ID') & t.single_specialism) >> emit_sequence
-t.mapping = (lit('ID') & lit('[') & t.definition & lit('-') & lit('>') & t.definition & lit(']')) >> emit_mapping
-t.collections = t.sequence | t.mapping
-t.simple_type_name = (lit('ID') & +(lit('.') & lit('ID'))) >> emit_simple_type_name
-t.any_type = lit('?') >> emit_any_type
-t.definition = t.collections | t.simple_type_name | t.any_type
-t.ensure_parsers_defined()
+def get_interned_type_key(type_ast):
+    """Return the type key of a type AST, which is precomputed for interned ASTs
 
+    :param type_ast: type AST
+    """
+    try:
+        return _interned_type_keys[id(type_ast)]
+
+    except KeyError:
+        return get_type_key(type_ast)
+
+
+def _parse_type_string(type_string):
+    if not isinstance(type_string, str):
+        if type_string is None:
+            return AnyType()
+        raise ValueError("Require string or None for type string, not {!r}".format(type_string))
+
+    if not type_string:
+        return AnyType()
 
-def build_ast(string):
-    tokens = tuple(tokenize_text(string))
-    return parse(t.definition, tokens).pop()
+    return _TypeStringParser(type_string).parse()
@@ -1,3 +1,4 @@
+from functools import partial
 from weakref import WeakKeyDictionary
 
 from .manager import ModeFactory, memoize
@@ -9,13 +10,18 @@ class Variable(Exportable, Bindable, Stateful, Nameable):
     """Stateful data store object"""
 
     export_only = False
+    stateful_slot_storage = True
 
     def __init__(self, data_type='', start_value=None):
 
         if not is_valid_data_type(data_type):
             raise ValueError(data_type)
 
-        self._values = WeakKeyDictionary()
+        # Values are held in a WeakKeyDictionary until a runtime hive class slot is assigned
+        self._values = values = WeakKeyDictionary()
+        self._get_value = values.__getitem__
+        self._set_value = values.__setitem__
+
         self._data_type = data_type
 
         self.start_value = start_value
@@ -27,10 +33,25 @@ class Variable(Exportable, Bindable, Stateful, Nameable):
         return self._data_type
 
     def _hive_stateful_getter(self, run_hive):
-        return self._values[run_hive]
+        return self._get_value(run_hive)
 
     def _hive_stateful_setter(self, run_hive, value):
-        self._values[run_hive] = value
+        self._set_value(run_hive, value)
+
+    def _hive_stateful_bound_getter(self, run_hive):
+        return partial(self._get_value, run_hive)
+
+    def _hive_stateful_bound_setter(self, run_hive):
+        return partial(self._set_value, run_hive)
+
+    def _hive_set_stateful_slot(self, slot):
+        """Store values in a slot of the runtime hive class, instead of the values dictionary
+
+        :param slot: member descriptor of the runtime hive class
+        """
+        self._values = None
+        self._get_value = slot.__get__
+        self._set_value = slot.__set__
 
     @memoize
     def bind(self, run_hive):
@@ -39,9 +60,15 @@ class Variable(Exportable, Bindable, Stateful, Nameable):
         if isinstance(start_value, Parameter):
             start_value = run_hive._hive_object._hive_args_frozen.get_parameter_value(start_value)
 
-        self._values[run_hive] = start_value
+        self._set_value(run_hive, start_value)
         return self
 
+    def unbind(self, run_hive):
+        if self._values is not None:
+            self._values.pop(run_hive, None)
+
+        return super().unbind(run_hive)
+
     def export(self):
         return self
 
@@ -200,11 +200,8 @@ class HiveNodeInspector:
             else:
                 hive_cls = import_result.cls
 
-                # Build the meta-args wrapper
-                hive_cls._hive_build_meta_args_wrapper()
-
                 # If the meta-args wrapper is not empty
-                meta_args_wrapper = hive_cls._hive_meta_args
+                meta_args_wrapper = hive_cls._hive_get_meta_args()
                 if meta_args_wrapper:
                     meta_args = yield ("meta_args", self._scrape_wrapper(meta_args_wrapper))
 
@@ -0,0 +1,201 @@
+from __future__ import print_function
+
+import os
+import sys
+import time
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "../..")
+
+import multiprocessing
+import pickle
+import socket
+import struct
+
+import hive
+import dragonfly.sys
+from dragonfly.sys.channel import SharedRingBuffer, get_record_layout
+
+_length = struct.Struct("<I")
+
+
+def send_tcp(address, values):
+    sock = socket.create_connection(address)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    for value in values:
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        sock.sendall(_length.pack(len(data)) + data)
+
+    sock.close()
+
+
+def receive_tcp(values):
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("localhost", 0))
+    listener.listen(1)
+
+    process = multiprocessing.get_context("fork").Process(target=send_tcp, args=(listener.getsockname(), values))
+    process.start()
+
+    connection, _ = listener.accept()
+    stream = connection.makefile("rb")
+    received = 0
+
+    while received < len(values):
+        length, = _length.unpack(stream.read(_length.size))
+        pickle.loads(stream.read(length))
+        received += 1
+
+    process.join()
+    stream.close()
+    connection.close()
+    listener.close()
+
+
+def send_ring_buffer(name, data_type, values):
+    ring_buffer = SharedRingBuffer(get_record_layout(data_type, 256), name)
+
+    for value in values:
+        ring_buffer.push(value)
+
+    ring_buffer.close()
+
+
+def receive_ring_buffer(data_type, values):
+    ring_buffer = SharedRingBuffer(get_record_layout(data_type, 256), create=True, capacity=1024)
+    process = multiprocessing.get_context("fork").Process(target=send_ring_buffer,
+                                                          args=(ring_buffer.name, data_type, values))
+    process.start()
+
+    received = 0
+    while received < len(values):
+        batch = ring_buffer.receive()
+        received += len(batch)
+
+        # Yield to the sender when idle (as a consumer which synchronises each tick would)
+        if not batch:
+            time.sleep(0)
+
+    process.join()
+    ring_buffer.close()
+
+
+def send_channel(name, data_type, values):
+    channel = dragonfly.sys.Channel(name=name, data_type=data_type)
+
+    for value in values:
+        channel.value_in.push(value)
+
+    channel.dispose()
+
+
+def receive_channel(data_type, values):
+    channel = dragonfly.sys.Channel(data_type=data_type, create=True, capacity=1024)
+    received = []
+
+    def on_received(value):
+        received.append(value)
+
+    hive.connect(channel.value_out, hive.push_in(on_received))
+
+    process = multiprocessing.get_context("fork").Process(target=send_channel,
+                                                          args=(channel.name.pull(), data_type, values))
+    process.start()
+
+    while len(received) < len(values):
+        count = len(received)
+        channel.synchronise()
+
+        if len(received) == count:
+            time.sleep(0)
+
+    process.join()
+    channel.dispose()
+
+
+def measure_tcp_cost(values, batch_size):
+    """Return the time taken to send and receive values through a TCP loopback connection, within this process"""
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.bind(("localhost", 0))
+    listener.listen(1)
+
+    sender = socket.create_connection(listener.getsockname())
+    sender.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    connection, _ = listener.accept()
+    stream = connection.makefile("rb")
+
+    start = time.perf_counter()
+
+    for batch_start in range(0, len(values), batch_size):
+        batch = values[batch_start: batch_start + batch_size]
+
+        for value in batch:
+            data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            sender.sendall(_length.pack(len(data)) + data)
+
+        for _ in batch:
+            length, = _length.unpack(stream.read(_length.size))
+            pickle.loads(stream.read(length))
+
+    elapsed = time.perf_counter() - start
+
+    stream.close()
+    connection.close()
+    sender.close()
+    listener.close()
+
+    return elapsed
+
+
+def measure_ring_buffer_cost(data_type, values, batch_size):
+    """Return the time taken to send and receive values through a shared ring buffer, within this process"""
+    consumer = SharedRingBuffer(get_record_layout(data_type, 256), create=True, capacity=batch_size)
+    producer = SharedRingBuffer(get_record_layout(data_type, 256), consumer.name)
+
+    start = time.perf_counter()
+
+    for batch_start in range(0, len(values), batch_size):
+        for value in values[batch_start: batch_start + batch_size]:
+            producer.push(value)
+
+        consumer.receive()
+
+    elapsed = time.perf_counter() - start
+
+    producer.close()
+    consumer.close()
+
+    return elapsed
+
+
+def main(count=100000, batch_size=256):
+    workloads = [("int", list(range(count))), ("tuple", [(i, float(i), "entity") for i in range(count)])]
+    transports = [("tcp loopback", lambda data_type, values: receive_tcp(values)),
+                  ("shared ring buffer", receive_ring_buffer),
+                  ("Channel hive", receive_channel)]
+
+    print("{:<22}{:<10}{:>14}{:>16}".format("transport", "type", "total ms", "values / s"))
+
+    for data_type, values in workloads:
+        for name, receive in transports:
+            start = time.perf_counter()
+            receive(data_type, values)
+            elapsed = time.perf_counter() - start
+
+            print("{:<22}{:<10}{:>14.1f}{:>16.0f}".format(name, data_type, elapsed * 1e3, count / elapsed))
+
+    # Cost of transferring values, excluding the scheduling of the sending and receiving processes
+    print()
+    print("{:<22}{:<10}{:>14}".format("transport (1 process)", "type", "us / value"))
+
+    for data_type, values in workloads:
+        tcp_cost = measure_tcp_cost(values, batch_size)
+        ring_buffer_cost = measure_ring_buffer_cost(data_type, values, batch_size)
+
+        print("{:<22}{:<10}{:>14.2f}".format("tcp loopback", data_type, tcp_cost / count * 1e6))
+        print("{:<22}{:<10}{:>14.2f}".format("shared ring buffer", data_type, ring_buffer_cost / count * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "../..")
+
+import dragonfly.std
+
+
+def plain_call(data_type, start_value=None):
+    return data_type, start_value
+
+
+def main(number=20000):
+    hive_object_class = dragonfly.std.Variable(data_type="int", start_value=0)._hive_object.__class__
+    wrapper = hive_object_class._hive_args
+    meta_wrapper = dragonfly.std.Variable._hive_meta_args
+
+    timings = [
+        ("plain call", lambda: plain_call(data_type="int", start_value=0)),
+        ("compiled binder", lambda: meta_wrapper.extract_from_args((), {"data_type": "int", "start_value": 0})),
+        ("general binder", lambda: meta_wrapper._extract_from_args((), {"data_type": "int", "start_value": 0})),
+        ("freeze", lambda: wrapper.freeze(())),
+        ("HiveObject", lambda: hive_object_class(start_value=0)),
+        ("std.Variable", lambda: dragonfly.std.Variable(data_type="int", start_value=0)),
+    ]
+
+    print("{:<20}{:>16}".format("operation", "us/call"))
+
+    for name, func in timings:
+        seconds = min(timeit.repeat(func, number=number, repeat=3))
+        print("{:<20}{:>16.2f}".format(name, seconds / number * 1e6))
+
+
+if __name__ == "__main__":
+    main()
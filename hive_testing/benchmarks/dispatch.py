@@ -0,0 +1,75 @@
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "../..")
+
+import hive
+from hive.classes import Pusher
+from hive.triggerfunc import TriggerFunc
+
+
+class GenericPusher(Pusher):
+    """Pusher which always iterates over its targets (the behaviour before push was specialised)"""
+    __slots__ = ()
+
+    def _specialise(self):
+        targets = self._targets
+
+        def push(*args, **kwargs):
+            for target in targets:
+                target(*args, **kwargs)
+
+        self.push = push
+
+        if self._bind_as is not None:
+            setattr(self._parent(), self._bind_as, push)
+
+
+def build_chain(pusher_cls, length, fan_out):
+    """Build a chain of trigger funcs, each triggering the next and fan_out - 1 further triggerables"""
+    trigger_funcs = [TriggerFunc() for _ in range(length)]
+    counter = [0]
+
+    def count():
+        counter[0] += 1
+
+    for trigger_func in trigger_funcs:
+        trigger_func._trigger = pusher_cls(trigger_func, bind_as="_push_trigger")
+        trigger_func._pretrigger = pusher_cls(trigger_func, bind_as="_push_pretrigger")
+
+    for source, target in zip(trigger_funcs, trigger_funcs[1:]):
+        hive.trigger(source, hive.triggerable(target))
+
+    for trigger_func in trigger_funcs:
+        for _ in range(fan_out - 1):
+            hive.trigger(trigger_func, hive.triggerable(count))
+
+    return trigger_funcs[0]
+
+
+def main(number=20000):
+    graphs = [
+        ("chain x16, fan 1", 16, 1),
+        ("chain x16, fan 2", 16, 2),
+        ("chain x8, fan 4", 8, 4),
+    ]
+
+    print("{:<20}{:>16}{:>16}".format("graph", "generic us", "specialised us"))
+
+    for name, length, fan_out in graphs:
+        timings = []
+
+        for pusher_cls in (GenericPusher, Pusher):
+            trigger = build_chain(pusher_cls, length, fan_out)
+            seconds = min(timeit.repeat(trigger, number=number, repeat=3))
+            timings.append(seconds / number * 1e6)
+
+        print("{:<20}{:>16.2f}{:>16.2f}".format(name, *timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "../..")
+
+import hive
+
+
+def build_leaf(i, ex, args):
+    i.value = hive.variable("int", 0)
+    i.push_value = hive.push_in(i.value)
+    ex.value = hive.antenna(i.push_value)
+
+    i.push_out = hive.push_out(i.value)
+    ex.value_out = hive.output(i.push_out)
+    hive.trigger(i.push_value, i.push_out)
+
+    i.on_trigger = hive.triggerable(i.push_out)
+    ex.trigger = hive.entry(i.on_trigger)
+    ex.pushed = hive.hook(i.push_value)
+
+
+Leaf = hive.hive("Leaf", build_leaf)
+
+
+def make_nested(depth):
+    """Return a new HiveBuilder which wraps a Leaf in depth levels of hives, each exporting its child hive and
+    re-exporting the IO of its child
+    """
+    nested = Leaf
+
+    for level in range(depth):
+        def build_level(i, ex, args, child_class=nested):
+            ex.inner = child_class()
+            i.second = child_class()
+            hive.connect(ex.inner.value_out, i.second.value)
+            hive.trigger(ex.inner.pushed, i.second.trigger)
+
+            ex.value = hive.antenna(ex.inner.value)
+            ex.value_out = hive.output(i.second.value_out)
+            ex.trigger = hive.entry(ex.inner.trigger)
+            ex.pushed = hive.hook(i.second.pushed)
+
+        nested = hive.hive("Level{}".format(level), build_level)
+
+    return nested
+
+
+def main(depths=(2, 4, 6), number=5, resolve_number=10000):
+    print("{:<10}{:>16}{:>16}{:>20}".format("depth", "resolve us", "build ms", "instantiate ms"))
+
+    for depth in depths:
+        def build():
+            make_nested(depth)._hive_get_hive_object_class((), {})
+
+        nested = make_nested(depth)
+        nested()
+
+        # Resolve the antenna of the innermost Leaf, through the exported hives of each level
+        hive_object = nested._hive_get_hive_object_class((), {})[2]()
+        path = ["inner"] * depth + ["value"]
+
+        def resolve():
+            bee = hive_object
+            for name in path:
+                bee = getattr(bee, name)
+
+        resolved = min(timeit.repeat(resolve, number=resolve_number, repeat=3)) / resolve_number
+        built = min(timeit.repeat(build, number=number, repeat=3)) / number
+        instantiated = min(timeit.repeat(nested, number=number, repeat=3)) / number
+        print("{:<10}{:>16.2f}{:>16.2f}{:>20.2f}".format(depth, resolved * 1e6, built * 1e3, instantiated * 1e3))
+
+
+if __name__ == "__main__":
+    main()
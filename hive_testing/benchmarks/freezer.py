@@ -0,0 +1,74 @@
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "../..")
+
+import hive
+
+
+class StageClass:
+
+    def __init__(self):
+        self.count = 0
+
+    def on_value(self):
+        self.count += 1
+
+
+def build_stage(cls, i, ex, args):
+    i.value = hive.property(cls, "_value", "int")
+    i.push_value = hive.push_in(i.value)
+    ex.value = hive.antenna(i.push_value)
+
+    i.on_value = hive.triggerable(cls.on_value)
+    hive.trigger(i.push_value, i.on_value)
+
+    i.push_out = hive.push_out(i.value)
+    ex.value_out = hive.output(i.push_out)
+    hive.trigger(i.push_value, i.push_out)
+
+
+Stage = hive.hive("Stage", build_stage, builder_cls=StageClass)
+
+
+def make_pipeline(length):
+    """Return a new HiveBuilder (so that its HiveObject class is not cached) of a pipeline of stages"""
+    def build_pipeline(i, ex, args):
+        stages = [Stage() for _ in range(length)]
+
+        for index, stage in enumerate(stages):
+            setattr(i, "stage_{}".format(index), stage)
+
+        for source, target in zip(stages, stages[1:]):
+            hive.connect(source.value_out, target.value)
+
+        ex.value = hive.antenna(stages[0].value)
+
+    return hive.hive("Pipeline", build_pipeline)
+
+
+def main(lengths=(4, 16, 64), number=5):
+    print("{:<10}{:>16}{:>16}".format("stages", "built ms", "frozen ms"))
+
+    for length in lengths:
+        code = compile(hive.freeze_hive(make_pipeline(length)), "<frozen pipeline>", "exec")
+
+        def build():
+            make_pipeline(length)()
+
+        def load_frozen():
+            namespace = {}
+            exec(code, namespace)
+            namespace["instantiate"]()
+
+        built = min(timeit.repeat(build, number=number, repeat=3)) / number
+        frozen = min(timeit.repeat(load_frozen, number=number, repeat=3)) / number
+        print("{:<10}{:>16.2f}{:>16.2f}".format(length, built * 1e3, frozen * 1e3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "../..")
+
+import hive
+
+
+class StageClass:
+
+    def __init__(self):
+        self.count = 0
+
+    def on_value(self):
+        self.count += 1
+
+
+def build_stage(cls, i, ex, args):
+    i.value = hive.property(cls, "_value", "int")
+    i.push_value = hive.push_in(i.value)
+    ex.value = hive.antenna(i.push_value)
+
+    i.on_value = hive.triggerable(cls.on_value)
+    hive.trigger(i.push_value, i.on_value)
+
+    i.push_out = hive.push_out(i.value)
+    ex.value_out = hive.output(i.push_out)
+    hive.trigger(i.push_value, i.push_out)
+
+
+Stage = hive.hive("Stage", build_stage, builder_cls=StageClass)
+
+
+def build_pipeline(i, ex, args):
+    i.first = Stage()
+    i.second = Stage()
+    i.third = Stage()
+    i.fourth = Stage()
+
+    hive.connect(i.first.value_out, i.second.value)
+    hive.connect(i.second.value_out, i.third.value)
+    hive.connect(i.third.value_out, i.fourth.value)
+
+    ex.value = hive.antenna(i.first.value)
+
+
+Pipeline = hive.hive("Pipeline", build_pipeline)
+
+
+def main(number=20000):
+    dispatched = Pipeline()
+    fused = Pipeline()
+    hive.compile_hive(fused)
+
+    timings = [
+        ("dispatched", lambda: dispatched.value.push(1)),
+        ("fused", lambda: fused.value.push(1)),
+    ]
+
+    print("{:<20}{:>16}".format("push (4 stages)", "us/call"))
+
+    for name, func in timings:
+        seconds = min(timeit.repeat(func, number=number, repeat=3))
+        print("{:<20}{:>16.2f}".format(name, seconds / number * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+from __future__ import print_function
+
+import os
+import sys
+import time
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "../..")
+
+import random
+
+import hive
+import dragonfly.sys
+
+
+def encode(values):
+    """Heavy pure computation (as done by a modifier which encodes or sorts large state)"""
+    return len(repr(sorted(values)))
+
+
+def run_inline(values, ticks, interval):
+    """Return the tick durations of a mainloop whose modifier calls encode() every interval ticks"""
+    durations = []
+
+    for tick in range(ticks):
+        start = time.perf_counter()
+
+        if tick % interval == 0:
+            encode(values)
+
+        durations.append(time.perf_counter() - start)
+        time.sleep(1 / 120)
+
+    return durations
+
+
+def run_job(values, ticks, interval, executor):
+    """Return the tick durations of a mainloop which submits encode() to a Job every interval ticks"""
+    job = dragonfly.sys.Job(executor=executor, max_pending=1)
+    results = []
+
+    hive.connect(hive.pull_out(lambda: encode), job.function_in)
+    hive.connect(job.result_out, hive.push_in(results.append))
+
+    durations = []
+
+    for tick in range(ticks):
+        start = time.perf_counter()
+
+        job.synchronise()
+        if tick % interval == 0:
+            job.arguments_in.push((values,))
+
+        durations.append(time.perf_counter() - start)
+        time.sleep(1 / 120)
+
+    job.dispose()
+    return durations
+
+
+def main(size=200000, ticks=240, interval=30):
+    values = [random.random() for _ in range(size)]
+
+    print("{:<16}{:>16}{:>16}".format("mode", "mean tick ms", "max tick ms"))
+
+    modes = [("inline", lambda: run_inline(values, ticks, interval)),
+             ("thread job", lambda: run_job(values, ticks, interval, "thread")),
+             ("process job", lambda: run_job(values, ticks, interval, "process"))]
+
+    for name, run in modes:
+        durations = run()
+        print("{:<16}{:>16.2f}{:>16.2f}".format(name, sum(durations) / len(durations) * 1e3, max(durations) * 1e3))
+
+
+if __name__ == "__main__":
+    main()
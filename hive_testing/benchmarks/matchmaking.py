@@ -0,0 +1,68 @@
+from __future__ import print_function
+
+import os
+import sys
+import time
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "../..")
+
+import hive
+import dragonfly.app
+import dragonfly.event
+
+
+def make_stack_hive(width):
+    """Create a new (unbuilt) hive class, with a mainloop and event manager stack at the root, and nested levels of
+    drones below it.
+
+    Each level holds width event listeners, which are matched with the plugins of the event manager
+    """
+
+    def declare_level(meta_args):
+        meta_args.depth = hive.parameter("int", 1)
+
+    def build_level(i, ex, args, meta_args):
+        for index in range(width):
+            setattr(i, "on_start_{}".format(index), dragonfly.event.OnStart())
+            setattr(i, "on_stop_{}".format(index), dragonfly.event.OnStop())
+
+        if meta_args.depth > 1:
+            i.inner = level_hive(depth=meta_args.depth - 1, import_namespace=True, export_namespace=False)
+
+    level_hive = hive.dyna_hive("Level", build_level, declarator=declare_level)
+
+    def declare_stack(meta_args):
+        meta_args.depth = hive.parameter("int", 1)
+
+    def build_stack(i, ex, args, meta_args):
+        i.mainloop = dragonfly.app.Mainloop(tick_rate=60)
+        i.event_manager = dragonfly.event.EventManager(export_namespace=True)
+        i.levels = level_hive(depth=meta_args.depth, import_namespace=True, export_namespace=False)
+
+    return hive.dyna_hive("Stack", build_stack, declarator=declare_stack)
+
+
+def measure_build_time(depth, width, repeat=5):
+    """Return the shortest time taken to build the HiveObject class of a stack (including matchmaking), in seconds"""
+    timings = []
+
+    for _ in range(repeat):
+        stack_hive = make_stack_hive(width)
+
+        start = time.perf_counter()
+        stack_hive._hive_get_hive_object_class((), {"depth": depth})
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main():
+    print("{:<8}{:<8}{:>16}".format("depth", "width", "build ms"))
+
+    for depth, width in ((1, 4), (5, 4), (10, 4), (10, 16)):
+        print("{:<8}{:<8}{:>16.2f}".format(depth, width, measure_build_time(depth, width) * 1e3))
+
+
+if __name__ == "__main__":
+    main()
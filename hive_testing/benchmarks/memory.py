@@ -0,0 +1,50 @@
+from __future__ import print_function
+
+import os
+import sys
+import tracemalloc
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "../..")
+
+import dragonfly.std
+import dragonfly.logic
+import dragonfly.op
+
+
+HIVES = [
+    ("std.Variable", dragonfly.std.Variable, {"data_type": "int", "start_value": 0}),
+    ("std.Buffer", dragonfly.std.Buffer, {"data_type": "int"}),
+    ("std.Transistor", dragonfly.std.Transistor, {"data_type": "int"}),
+    ("logic.Sorted", dragonfly.logic.Sorted, {}),
+    ("logic.Toggle", dragonfly.logic.Toggle, {}),
+    ("logic.Cycle", dragonfly.logic.Cycle, {}),
+    ("op.MathOperator", dragonfly.op.MathOperator, {"data_type": "int", "operator": "+"}),
+]
+
+
+def measure_bytes_per_hive(hive_cls, kwargs, count):
+    """Return the number of bytes allocated for each runtime hive, excluding the first (which builds the classes)"""
+    hive_cls(**kwargs)
+
+    tracemalloc.start()
+    start_size, _ = tracemalloc.get_traced_memory()
+
+    run_hives = hive_cls.instantiate_many(count, **kwargs)
+
+    end_size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert len(run_hives) == count
+    return (end_size - start_size) / count
+
+
+def main(count=1000):
+    print("{:<20}{:>16}".format("hive", "bytes/hive"))
+
+    for name, hive_cls, kwargs in HIVES:
+        print("{:<20}{:>16.0f}".format(name, measure_bytes_per_hive(hive_cls, kwargs, count)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+from __future__ import print_function
+
+import gc
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "../..")
+
+import hive
+import dragonfly.std
+
+
+def build_relay(i, ex, args):
+    i.value = hive.variable("int", 0)
+    i.push_value = hive.push_in(i.value)
+    ex.value = hive.antenna(i.push_value)
+
+    i.push_out = hive.push_out(i.value)
+    ex.value_out = hive.output(i.push_out)
+    hive.trigger(i.push_value, i.push_out)
+
+
+Relay = hive.hive("Relay", build_relay)
+
+
+def build_chain(i, ex, args):
+    i.first = Relay()
+    i.second = Relay()
+    hive.connect(i.first.value_out, i.second.value)
+
+    i.buffer = dragonfly.std.Buffer("int")
+    hive.connect(i.second.value_out, i.buffer.value)
+
+    ex.value = hive.antenna(i.first.value)
+
+
+Chain = hive.hive("Chain", build_chain)
+
+
+def spawn_and_dispose(count):
+    for _ in range(count):
+        run_hive = Chain()
+        run_hive.value.push(1)
+        run_hive.dispose()
+
+
+def measure_allocated_blocks(count, rounds):
+    """Return the number of allocated memory blocks after each round of spawning and disposing hives"""
+    allocated_blocks = []
+
+    for _ in range(rounds):
+        spawn_and_dispose(count // rounds)
+        gc.collect()
+
+        allocated_blocks.append(sys.getallocatedblocks())
+
+    return allocated_blocks
+
+
+def main(count=100000, rounds=10, warmup=1000, max_growth=1000):
+    # Build classes and populate caches before measuring
+    spawn_and_dispose(warmup)
+    gc.collect()
+
+    start_blocks = sys.getallocatedblocks()
+    allocated_blocks = measure_allocated_blocks(count, rounds)
+
+    print("{:<12}{:>16}".format("hives", "blocks"))
+    for i, blocks in enumerate(allocated_blocks, 1):
+        print("{:<12}{:>16}".format(i * (count // rounds), blocks - start_blocks))
+
+    growth = allocated_blocks[-1] - start_blocks
+    assert growth <= max_growth, "Memory grows when hives are disposed ({} blocks)".format(growth)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+from __future__ import print_function
+
+import os
+import sys
+import timeit
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "../..")
+
+from hive.typing import data_types_match, is_valid_data_type, MatchFlags, clear_match_cache
+from hive.typing.parser import _parse_type_string
+
+
+TYPE_PAIRS = [
+    ("int", "int"),
+    ("int.entity_id", "int"),
+    ("str.path", "str.id"),
+    ("list[int]", "list[float]"),
+    ("dict[str->tuple.vector]", "dict[str->tuple]"),
+    ("tuple.vector", "?"),
+]
+
+
+def match_all():
+    for source, target in TYPE_PAIRS:
+        data_types_match(source, target, MatchFlags.match_shortest | MatchFlags.permit_any_target)
+
+
+def parse_all_uncached():
+    for source, target in TYPE_PAIRS:
+        _parse_type_string(source)
+        _parse_type_string(target)
+
+
+def main(number=2000):
+    timings = [
+        ("parse (uncached)", parse_all_uncached),
+        ("is_valid_data_type", lambda: [is_valid_data_type(source) for source, _ in TYPE_PAIRS]),
+        ("data_types_match", match_all),
+    ]
+
+    clear_match_cache()
+
+    print("{:<20}{:>16}".format("operation", "us/pair"))
+
+    for name, func in timings:
+        seconds = min(timeit.repeat(func, number=number, repeat=3))
+        print("{:<20}{:>16.2f}".format(name, seconds / number / len(TYPE_PAIRS) * 1e6))
+
+
+if __name__ == "__main__":
+    main()
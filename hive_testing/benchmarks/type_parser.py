@@ -0,0 +1,47 @@
+from __future__ import print_function
+
+import os
+import subprocess
+import sys
+import timeit
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+root_directory = os.path.abspath(current_directory + "/" + "../..")
+sys.path.append(root_directory)
+sys.path.append(current_directory + "/" + "..")
+
+TYPE_STRINGS = ["int", "int.entity_id", "list[int]", "dict[str.id->tuple.vector]", "dict[str->list[?]]"]
+
+
+def measure_import_time(module_name, repeat=5):
+    """Return the shortest time taken to import a module in a new interpreter, in seconds"""
+    code = ("import sys, time; sys.path[:0] = {!r}; start = time.perf_counter(); import {}; "
+            "print(time.perf_counter() - start)".format([root_directory, current_directory + "/" + ".."], module_name))
+
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, "-c", code])
+        timings.append(float(output))
+
+    return min(timings)
+
+
+def main(number=2000):
+    from hive.typing.parser import _parse_type_string
+    import reference_type_parser
+
+    print("{:<28}{:>16}".format("import", "ms"))
+    for module_name in ("hive.typing.parser", "reference_type_parser", "hive"):
+        print("{:<28}{:>16.2f}".format(module_name, measure_import_time(module_name) * 1e3))
+
+    print()
+    print("{:<28}{:>16}".format("parse", "us/type string"))
+
+    for name, parse_type_string in (("hand-written", _parse_type_string),
+                                    ("reference (derp)", reference_type_parser.parse_type_string)):
+        seconds = min(timeit.repeat(lambda: [parse_type_string(s) for s in TYPE_STRINGS], number=number, repeat=3))
+        print("{:<28}{:>16.2f}".format(name, seconds / number / len(TYPE_STRINGS) * 1e6))
+
+
+if __name__ == "__main__":
+    main()
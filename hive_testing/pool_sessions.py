@@ -0,0 +1,24 @@
+"""Hives run by HiveProcessPool in test_process_pool.py (imported by worker processes)"""
+import os
+
+import hive
+
+
+def build_echo(i, ex, args):
+    i.message = hive.variable()
+    i.push_message = hive.push_in(i.message)
+    ex.message_in = hive.antenna(i.push_message)
+
+    i.reply = hive.variable()
+    i.push_reply = hive.push_out(i.reply)
+    ex.message_out = hive.output(i.push_reply)
+
+    def reply(self):
+        self._reply = os.getpid(), self._message * 2
+
+    i.reply_to_message = hive.modifier(reply)
+    hive.trigger(i.push_message, i.reply_to_message)
+    hive.trigger(i.push_message, i.push_reply)
+
+
+Echo = hive.hive("Echo", build_echo)
@@ -0,0 +1,106 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+from hive.classes import HiveArgsWrapper
+from hive.parameter import HiveParameter
+
+
+class HiveObjectStub:
+    pass
+
+
+def make_wrapper(**parameters):
+    wrapper = HiveArgsWrapper(HiveObjectStub)
+
+    for name in sorted(parameters):
+        setattr(wrapper, name, parameters[name])
+
+    return wrapper
+
+
+def extract(wrapper, *args, **kwargs):
+    try:
+        return wrapper.extract_from_args(args, kwargs)
+
+    except ValueError:
+        return ValueError
+
+
+def extract_general(wrapper, *args, **kwargs):
+    try:
+        return wrapper._extract_from_args(args, kwargs)
+
+    except ValueError:
+        return ValueError
+
+
+CALLS = [
+    ((), {}),
+    ((1,), {}),
+    ((1, 2), {}),
+    ((1, 2, 3), {}),
+    ((1, 2, 3, 4), {"x": 5}),
+    ((1,), {"b": 2}),
+    ((1,), {"c": 3}),
+    ((1, 2), {"a": 3}),
+    ((1, 2), {"b": 3}),
+    ((), {"a": 1, "b": 2, "c": 3, "d": 4}),
+    ((1,), {"a": 2}),
+]
+
+
+def test_binder_matches_general_rules():
+    wrappers = [
+        make_wrapper(a=HiveParameter("int"), b=HiveParameter("int", 2), c=HiveParameter("int", 3)),
+        make_wrapper(a=HiveParameter("int", 1), b=HiveParameter("int"), c=HiveParameter("int", 3)),
+        make_wrapper(a=HiveParameter("int"), b=HiveParameter("int"), c=HiveParameter("int")),
+        make_wrapper(),
+    ]
+
+    for wrapper in wrappers:
+        for args, kwargs in CALLS:
+            assert extract(wrapper, *args, **kwargs) == extract_general(wrapper, *args, **kwargs), (args, kwargs)
+
+
+def test_binder_is_recompiled():
+    wrapper = make_wrapper(a=HiveParameter("int"))
+    assert wrapper.extract_from_args((1,), {}).parameter_values == (1,)
+
+    wrapper.b = HiveParameter("int", 2)
+    assert wrapper.extract_from_args((1,), {}).parameter_values == (1, 2)
+
+    del wrapper.b
+    assert wrapper.extract_from_args((1, 2), {}) == ((2,), {}, (1,))
+
+
+def test_freeze():
+    wrapper = make_wrapper(a=HiveParameter("int", options={1, 2}), b=HiveParameter("object"))
+
+    view = wrapper.freeze((1, 2))
+    assert view.a == 1 and view.b == 2
+    assert wrapper.freeze((1, 2)) is view
+
+    # Equal values of different types are not shared
+    assert type(wrapper.freeze((True, 2)).a) is bool
+
+    # Unhashable values are not cached
+    assert wrapper.freeze((1, [])).b == []
+
+    try:
+        wrapper.freeze((3, 2))
+
+    except ValueError:
+        pass
+
+    else:
+        assert False, "Expected ValueError for option"
+
+
+test_binder_matches_general_rules()
+test_binder_is_recompiled()
+test_freeze()
@@ -0,0 +1,167 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import asyncio
+import time
+
+import hive
+import dragonfly.app
+
+
+def build_fetcher(i, ex, args):
+    i.value = hive.variable("int", 0)
+
+    async def fetch(self):
+        await asyncio.sleep(0)
+        self._value = 42
+
+    i.fetch = hive.async_modifier(fetch)
+    ex.fetch = hive.entry(i.fetch)
+
+
+Fetcher = hive.hive("Fetcher", build_fetcher)
+
+
+class SourceClass:
+
+    def __init__(self):
+        self.requests = 0
+
+    async def get_value(self):
+        self.requests += 1
+        await asyncio.sleep(0)
+        return self.requests * 10
+
+
+def build_puller(cls, i, ex, args):
+    i.pull_source = hive.pull_out(cls.get_value)
+
+    i.value = hive.variable("int", 0)
+    i.pull_value = hive.async_pull_in(i.value)
+    hive.connect(i.pull_source, i.pull_value)
+
+    i.pulled = hive.variable("int", 0)
+
+    def on_pulled(self):
+        self._pulled += 1
+
+    i.on_pulled = hive.modifier(on_pulled)
+    hive.trigger(i.pull_value, i.on_pulled)
+
+    ex.pull = hive.entry(i.pull_value)
+
+
+Puller = hive.hive("Puller", build_puller, builder_cls=SourceClass)
+
+
+def test_async_modifier():
+    async def main():
+        fetcher = Fetcher()
+        task = fetcher.fetch()
+        assert fetcher._value == 0
+
+        await task
+        assert fetcher._value == 42
+
+    asyncio.run(main())
+
+    # An event loop must be running
+    fetcher = Fetcher()
+    try:
+        fetcher.fetch()
+
+    except RuntimeError:
+        pass
+
+    else:
+        assert False, "Expected RuntimeError"
+
+
+def test_async_pull_in():
+    async def main():
+        puller = Puller()
+
+        # Triggered pulls are scheduled
+        await puller.pull()
+        assert puller._value == 10
+        assert puller._pulled == 1
+
+        # Or awaited directly
+        await puller.pull.pull_async()
+        assert puller._value == 20
+        assert puller._pulled == 2
+
+    asyncio.run(main())
+
+
+def test_dispose_cancels():
+    async def main():
+        fetcher = Fetcher()
+        task = fetcher.fetch()
+        fetcher.dispose()
+
+        try:
+            await task
+
+        except asyncio.CancelledError:
+            pass
+
+        else:
+            assert False, "Expected task to be cancelled"
+
+    asyncio.run(main())
+
+
+def build_ticker(i, ex, args):
+    i.ticks = hive.variable("int", 0)
+
+    def count(self):
+        self._ticks += 1
+
+        if self._ticks == 5:
+            self.stop()
+
+    i.count = hive.modifier(count)
+    hive.trigger(i.tick, i.count)
+
+
+Ticker = dragonfly.app.AsyncMainloop.extend("Ticker", build_ticker)
+
+
+def test_mainloop_blocking():
+    ticker = Ticker(tick_rate=1000)
+
+    start = time.monotonic()
+    ticker.run()
+
+    assert ticker._ticks == 5
+    assert time.monotonic() - start < 1.0
+
+
+def test_mainloop_task():
+    async def main():
+        ticker = Ticker(tick_rate=200)
+        ticker.run()
+
+        # Other coroutines run whilst the mainloop ticks
+        polls = 0
+        while ticker._ticks < 5:
+            polls += 1
+            await asyncio.sleep(0.001)
+
+        assert polls > 1
+        assert ticker._ticks == 5
+
+    asyncio.run(main())
+
+
+test_async_modifier()
+test_async_pull_in()
+test_dispose_cancels()
+test_mainloop_blocking()
+test_mainloop_task()
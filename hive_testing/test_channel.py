@@ -0,0 +1,188 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import multiprocessing
+import subprocess
+
+import hive
+import dragonfly.sys
+from dragonfly.sys.channel import PickleRecordLayout, StructRecordLayout, get_record_layout
+
+
+def build_receiver(i, ex, args, meta_args):
+    i.channel = dragonfly.sys.Channel(data_type=meta_args.data_type, create=True, capacity=4)
+
+    i.received = hive.variable(meta_args.data_type)
+    i.push_received = hive.push_in(i.received)
+    hive.connect(i.channel.value_out, i.push_received)
+
+    def record(self):
+        self._values.append(self._received)
+
+    i.record = hive.modifier(record)
+    hive.trigger(i.push_received, i.record)
+
+    i.values = hive.variable("list")
+
+    ex.channel = hive.hook(i.channel)
+
+
+def declare_receiver(meta_args):
+    meta_args.data_type = hive.parameter("str", "int")
+
+
+Receiver = hive.dyna_hive("Receiver", build_receiver, declare_receiver)
+
+
+def test_record_layouts():
+    assert isinstance(get_record_layout("int", 64), StructRecordLayout)
+    assert isinstance(get_record_layout("int.process_id", 64), StructRecordLayout)
+    assert isinstance(get_record_layout("float", 64), StructRecordLayout)
+    assert isinstance(get_record_layout("tuple", 64), PickleRecordLayout)
+    assert isinstance(get_record_layout("list[int]", 64), PickleRecordLayout)
+
+
+def test_wrap_around():
+    receiver = Receiver()
+    receiver._values = []
+
+    sender = dragonfly.sys.Channel(name=receiver.channel.name.pull(), data_type="int")
+
+    # Capacity is 4, so records are reused
+    for start in range(0, 12, 3):
+        for value in range(start, start + 3):
+            sender.value_in.push(value)
+
+        receiver.channel.synchronise()
+
+    assert receiver._values == list(range(12)), receiver._values
+
+    sender.dispose()
+    receiver.dispose()
+
+
+def test_pickle():
+    receiver = Receiver(data_type="tuple")
+    receiver._values = []
+
+    sender = dragonfly.sys.Channel(name=receiver.channel.name.pull(), data_type="tuple")
+    sender.value_in.push((1, "two", [3.0]))
+    receiver.channel.synchronise()
+
+    assert receiver._values == [(1, "two", [3.0])], receiver._values
+
+    # Values larger than the record size are rejected
+    try:
+        sender.value_in.push(("x" * 1024,))
+
+    except ValueError:
+        pass
+
+    else:
+        assert False, "Expected ValueError"
+
+    sender.dispose()
+    receiver.dispose()
+
+
+def send_values(name, count):
+    sender = dragonfly.sys.Channel(name=name, data_type="int")
+
+    for value in range(count):
+        sender.value_in.push(value)
+
+    sender.dispose()
+
+
+def test_processes():
+    receiver = Receiver()
+    receiver._values = []
+
+    # The sender waits whilst the buffer is full
+    count = 1000
+    process = multiprocessing.get_context("fork").Process(target=send_values,
+                                                          args=(receiver.channel.name.pull(), count))
+    process.start()
+
+    while len(receiver._values) < count:
+        receiver.channel.synchronise()
+
+    process.join()
+    assert receiver._values == list(range(count))
+
+    receiver.dispose()
+
+
+sender_script = """
+import dragonfly.sys
+
+sender = dragonfly.sys.Channel(name={name!r}, data_type="int")
+
+for value in range({count}):
+    sender.value_in.push(value)
+
+sender.dispose()
+"""
+
+
+def test_separate_interpreter():
+    receiver = Receiver()
+    receiver._values = []
+    name = receiver.channel.name.pull()
+
+    # The sender is not started by multiprocessing, so it has its own resource tracker
+    count = 100
+    environment = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    process = subprocess.Popen([sys.executable, "-c", sender_script.format(name=name, count=count)], env=environment,
+                               stderr=subprocess.PIPE, universal_newlines=True)
+
+    while len(receiver._values) < count:
+        receiver.channel.synchronise()
+
+    _, errors = process.communicate(timeout=30)
+    assert process.returncode == 0, errors
+    assert "leaked" not in errors, errors
+    assert receiver._values == list(range(count))
+
+    # The shared memory outlives the sender
+    attached = dragonfly.sys.Channel(name=name, data_type="int")
+    attached.dispose()
+
+    receiver.dispose()
+
+
+def build_channel_process(i, ex, args):
+    ex.channel = dragonfly.sys.Channel(name="test_channel_{}".format(os.getpid()), create=True, data_type="float")
+
+
+ChannelProcess = dragonfly.sys.Process.extend("ChannelProcess", build_channel_process)
+
+
+def test_open_on_started():
+    process = ChannelProcess()
+    process.on_started()
+
+    # The channel of the process is opened when it is started, so other endpoints may attach before it is used
+    sender = dragonfly.sys.Channel(name="test_channel_{}".format(os.getpid()), data_type="float")
+    sender.value_in.push(1.5)
+
+    values = []
+    hive.connect(process.channel.value_out, hive.push_in(values.append))
+    process.channel.synchronise()
+    assert values == [1.5]
+
+    sender.dispose()
+    process.dispose()
+
+
+test_record_layouts()
+test_wrap_around()
+test_pickle()
+test_processes()
+test_separate_interpreter()
+test_open_on_started()
@@ -0,0 +1,97 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+
+
+class RecorderClass:
+
+    def __init__(self):
+        self.events = []
+
+    def on_value(self):
+        self.events.append(("value", self._value))
+
+
+def build_stage(cls, i, ex, args):
+    i.value = hive.property(cls, "_value", "int")
+    i.push_value = hive.push_in(i.value)
+    ex.value = hive.antenna(i.push_value)
+
+    i.on_value = hive.triggerable(cls.on_value)
+    hive.trigger(i.push_value, i.on_value)
+
+    i.push_out = hive.push_out(i.value)
+    ex.value_out = hive.output(i.push_out)
+    hive.trigger(i.push_value, i.push_out)
+
+    i.modify = hive.modifier(lambda h: h._hive_build_class_to_instance[RecorderClass].events.append("modified"))
+    hive.trigger(i.push_value, i.modify, pretrigger=True)
+
+
+Stage = hive.hive("Stage", build_stage, builder_cls=RecorderClass)
+
+
+def build_pipeline(i, ex, args):
+    i.first = Stage()
+    i.second = Stage()
+    i.third = Stage()
+
+    hive.connect(i.first.value_out, i.second.value)
+    hive.connect(i.second.value_out, i.third.value)
+
+    ex.value = hive.antenna(i.first.value)
+
+
+Pipeline = hive.hive("Pipeline", build_pipeline)
+
+
+def get_events(pipeline):
+    return [stage._hive_build_class_to_instance[RecorderClass].events
+            for stage in (pipeline._first, pipeline._second, pipeline._third)]
+
+
+def test_compiled_pipeline_matches():
+    expected = Pipeline()
+    compiled = Pipeline()
+
+    fused_functions = hive.compile_hive(compiled)
+    assert fused_functions
+
+    for value in (1, 2, 3):
+        expected.value.push(value)
+        compiled.value.push(value)
+
+    assert get_events(compiled) == get_events(expected)
+    assert get_events(compiled)[2] == ["modified", ("value", 1), "modified", ("value", 2), "modified", ("value", 3)]
+
+
+def test_pushers_redirected():
+    pipeline = Pipeline()
+    fused_functions = hive.compile_hive(pipeline)
+
+    push_value = pipeline.value
+    trigger_targets = push_value._trigger._targets
+    assert any(target in fused_functions.values() for target in trigger_targets)
+
+
+def test_compiled_functions_are_fused():
+    pipeline = Pipeline()
+    fused_functions = hive.compile_hive(pipeline)
+
+    # The first push_out inlines the remaining stages, so calls no other fused functions
+    push_out = pipeline._first._hive_object.__class__._hive_i.push_out.getinstance(pipeline._first._hive_object)
+    fused_push_out = fused_functions[push_out.bind(pipeline._first)]
+
+    names = fused_push_out.__code__.co_names
+    assert not any(name.startswith("fused_") for name in names), names
+
+
+test_compiled_pipeline_matches()
+test_pushers_redirected()
+test_compiled_functions_are_fused()
@@ -0,0 +1,124 @@
+from __future__ import print_function
+
+import importlib
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+
+# hive.connect is shadowed by the connect function
+connect_module = importlib.import_module("hive.connect")
+
+
+class SinkClass:
+
+    def __init__(self):
+        self.values = []
+
+    def add(self, value):
+        self.values.append(value)
+
+
+def build_source(i, ex, args):
+    i.value = hive.variable("int", 0)
+    i.push_value = hive.push_out(i.value)
+    ex.value = hive.output(i.push_value)
+
+
+def build_sink(cls, i, ex, args):
+    i.add = hive.push_in(cls.add)
+    ex.add = hive.antenna(i.add)
+
+
+Source = hive.hive("Source", build_source)
+Sink = hive.hive("Sink", build_sink, builder_cls=SinkClass)
+
+
+def build_pair(i, ex, args):
+    i.source = Source()
+    i.sink = Sink()
+
+    # Hive to hive connection, resolved by data type
+    hive.connect(i.source, i.sink)
+
+
+def test_connection_resolved_once():
+    # Defined here, so that each run resolves the connection of a new hive class
+    Pair = hive.hive("Pair", build_pair)
+
+    calls = []
+    find_connection_candidates = connect_module.find_connection_candidates
+
+    def counting_find_connection_candidates(source_hive, target_hive):
+        calls.append((source_hive, target_hive))
+        return find_connection_candidates(source_hive, target_hive)
+
+    connect_module.find_connection_candidates = counting_find_connection_candidates
+
+    try:
+        pairs = [Pair() for _ in range(3)]
+
+    finally:
+        connect_module.find_connection_candidates = find_connection_candidates
+
+    assert len(calls) == 1, calls
+
+    # Each runtime hive is still wired
+    for pair in pairs:
+        pair._source.value.push()
+
+        assert pair._sink._hive_build_class_to_instance[SinkClass].values == [0]
+
+
+def build_mixed_source(i, ex, args):
+    i.value = hive.variable("int", 0)
+    i.push_value = hive.push_out(i.value)
+    i.pull_value = hive.pull_out(i.value)
+    i.name = hive.variable("str", "")
+    i.push_name = hive.push_out(i.name)
+
+    ex.value = hive.output(i.push_value)
+    ex.pull_value = hive.output(i.pull_value)
+    ex.name = hive.output(i.push_name)
+
+
+MixedSource = hive.hive("MixedSource", build_mixed_source)
+
+
+def build_typed_sink(cls, i, ex, args):
+    i.add = hive.push_in(cls.add, "int")
+    ex.add = hive.antenna(i.add)
+
+
+TypedSink = hive.hive("TypedSink", build_typed_sink, builder_cls=SinkClass)
+
+
+def build_mixed_pair(i, ex, args):
+    i.source = MixedSource()
+    i.sink = TypedSink()
+
+    hive.connect(i.source, i.sink)
+
+
+MixedPair = hive.hive("MixedPair", build_mixed_pair)
+
+
+def test_candidates_joined_by_mode_and_type():
+    source_index = MixedSource()._hive_object._hive_get_external_index()
+    assert set(source_index.connect_sources_by_key) == {("push", "int"), ("pull", "int"), ("push", "str")}
+
+    # Index is built once per HiveObject class
+    assert MixedSource()._hive_object._hive_get_external_index() is source_index
+
+    # Only the push_out of matching type is a candidate
+    pair = MixedPair()
+    pair._source.value.push()
+
+    assert pair._sink._hive_build_class_to_instance[SinkClass].values == [0]
+
+
+test_connection_resolved_once()
+test_candidates_joined_by_mode_and_type()
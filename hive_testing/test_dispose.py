@@ -0,0 +1,175 @@
+from __future__ import print_function
+
+import gc
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from dragonfly.event import EventManager, Listener, OnStart, OnStop
+from dragonfly.event.event import EventHiveClass
+from hive.ppin import PushIn
+from hive.triggerfunc import TriggerFunc
+from hive.variable import Variable
+
+
+class CounterClass:
+
+    def __init__(self):
+        self.disposed = []
+
+        hive.add_dispose_callback(self.on_dispose)
+
+    def on_dispose(self):
+        self.disposed.append(True)
+
+
+def build_counter(cls, i, ex, args):
+    i.count = hive.property(cls, "disposed")
+    i.value = hive.variable("int", 0)
+    i.push_value = hive.push_in(i.value)
+    ex.value = hive.antenna(i.push_value)
+
+    i.push_out = hive.push_out(i.value)
+    ex.value_out = hive.output(i.push_out)
+
+    i.on_push = hive.triggerfunc()
+    ex.on_push = hive.hook(i.on_push)
+    i.do_on_push = hive.triggerable(i.on_push)
+    hive.trigger(i.push_value, i.do_on_push)
+
+
+Counter = hive.hive("Counter", build_counter, builder_cls=CounterClass)
+
+
+def build_pair(i, ex, args):
+    i.first = Counter()
+    i.second = Counter()
+    hive.connect(i.first.value_out, i.second.value)
+
+    ex.value = hive.antenna(i.first.value)
+
+
+Pair = hive.hive("Pair", build_pair)
+
+
+def test_dispose_callbacks():
+    h = Counter()
+    drone = h._hive_build_class_to_instance[CounterClass]
+
+    h.dispose()
+    assert drone.disposed == [True]
+
+    # Disposal is idempotent
+    h.dispose()
+    assert drone.disposed == [True]
+
+
+def test_dispose_releases_bind_results():
+    Pair()
+
+    baseline = {func: func.cache_info().entries for func in (PushIn.bind, TriggerFunc.bind, Variable.bind)}
+
+    h = Pair()
+    for func, entries in baseline.items():
+        assert func.cache_info().entries > entries
+
+    h.dispose()
+    for func, entries in baseline.items():
+        assert func.cache_info().entries == entries, func
+
+
+def test_dispose_children():
+    h = Pair()
+    first = h._first
+
+    first_drone = first._hive_build_class_to_instance[CounterClass]
+    second_drone = h._second._hive_build_class_to_instance[CounterClass]
+
+    h.dispose()
+    assert first_drone.disposed == [True]
+    assert second_drone.disposed == [True]
+    assert not hasattr(h, "_first")
+    assert not hasattr(first, "value")
+
+
+def test_dispose_removes_aliases():
+    h = Counter()
+
+    steps = h._hive_object._hive_instantiation_plan.steps
+    bees = [step.bee.getinstance(h._hive_object) for step in steps if step.register_alias]
+
+    def aliased_by(run_hive):
+        return [bee for bee in bees if bee._hive_aliases and
+                any(alias.parent_ref() is run_hive for alias in bee._hive_aliases)]
+
+    assert aliased_by(h)
+
+    h.dispose()
+    assert not aliased_by(h)
+
+
+def test_dispose_state():
+    h = Counter()
+    h.value.push(2)
+
+    property_bee = h._hive_object.__class__._hive_i.count.getinstance(h._hive_object)
+    assert h in property_bee._bound
+
+    h.dispose()
+    assert h not in property_bee._bound
+
+
+def test_dispose_releases_memory():
+    h = Counter()
+    h.dispose()
+    del h
+
+    gc.collect()
+    objects = len(gc.get_objects())
+
+    for _ in range(100):
+        h = Pair()
+        h.value.push(1)
+        h.dispose()
+
+    del h
+    gc.collect()
+
+    # Allow for objects created by the collector itself
+    assert len(gc.get_objects()) - objects < 100
+
+
+def build_event_listeners(i, ex, args):
+    i.events = EventManager()
+    i.on_start = OnStart()
+    i.on_stop = OnStop()
+    i.listener = Listener(event=("key",))
+
+
+EventListeners = hive.hive("EventListeners", build_event_listeners)
+
+
+def test_dispose_removes_event_handlers():
+    """Event listening hives remove their handlers from the event manager when disposed"""
+    h = EventListeners()
+    dispatcher = h._events._hive_build_class_to_instance[EventHiveClass]
+    assert len(dispatcher._handlers) == 3
+
+    for child in (h._on_start, h._on_stop, h._listener):
+        handlers = len(dispatcher._handlers)
+        child.dispose()
+        assert len(dispatcher._handlers) == handlers - 1
+
+    assert not dispatcher.has_handlers
+
+
+test_dispose_callbacks()
+test_dispose_releases_bind_results()
+test_dispose_children()
+test_dispose_removes_aliases()
+test_dispose_state()
+test_dispose_releases_memory()
+test_dispose_removes_event_handlers()
@@ -0,0 +1,148 @@
+from __future__ import print_function
+
+import os
+import sys
+import types
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+
+
+class CounterClass:
+
+    def __init__(self, step=1):
+        self.step = step
+        self.history = []
+
+    def increment(self):
+        self.count += self.step
+
+    def record(self):
+        self.history.append(self.count)
+
+    def set_report(self, report):
+        self.report = report
+
+
+class ReporterClass:
+
+    def __init__(self, prefix=""):
+        self.prefix = prefix
+        self.reports = []
+
+    def report(self, value):
+        self.reports.append(self.prefix + value)
+
+
+def double(run_hive):
+    run_hive._doubled = run_hive._value * 2
+
+
+def build_counter(cls, i, ex, args):
+    i.count = hive.property(cls, "count", "int", 0)
+    i.pull_count = hive.pull_out(i.count)
+    ex.count_out = hive.output(i.pull_count)
+
+    i.increment = hive.triggerfunc(cls.increment)
+    i.do_increment = hive.triggerable(i.increment)
+    ex.increment = hive.entry(i.do_increment)
+
+    i.record = hive.triggerable(cls.record)
+    hive.trigger(i.increment, i.record)
+
+    ex.report = hive.socket(cls.set_report, "report")
+
+
+Counter = hive.hive("Counter", build_counter, builder_cls=CounterClass)
+
+
+def build_frozen(cls, i, ex, args):
+    i.counter = Counter(lazy=True)
+
+    i.value = hive.variable("int", 3)
+    i.doubled = hive.variable("int", 0)
+    i.push_value = hive.push_in(i.value)
+    ex.value = hive.antenna(i.push_value)
+
+    i.double = hive.modifier(double)
+    hive.trigger(i.push_value, i.double)
+    hive.trigger(i.push_value, i.counter.increment)
+
+    i.pull_count = hive.pull_in(i.value)
+    hive.connect(i.counter.count_out, i.pull_count)
+    ex.pull_count = hive.entry(i.pull_count)
+
+    i.doubled_out = hive.pull_out(i.doubled)
+    ex.doubled = hive.output(i.doubled_out)
+
+    ex.report = hive.plugin(cls.report, "report")
+
+
+FrozenTest = hive.hive("FrozenTest", build_frozen, builder_cls=ReporterClass)
+
+
+def load_frozen_module(source):
+    module = types.ModuleType("frozen_test_hive")
+    exec(compile(source, "<frozen_test_hive>", "exec"), module.__dict__)
+    return module
+
+
+def test_freeze():
+    source = hive.freeze_hive(FrozenTest, prefix="> ")
+
+    # Builders are not invoked by the frozen module
+    assert "build_frozen" not in source
+
+    module = load_frozen_module(source)
+    frozen_hive = module.instantiate()
+    run_hive = FrozenTest(prefix="> ")
+
+    for h in (frozen_hive, run_hive):
+        h.value.push(5)
+        h.value.push(7)
+        h.pull_count()
+
+    assert frozen_hive._value == run_hive._value == 2
+    assert frozen_hive._doubled == run_hive._doubled == 14
+
+    frozen_counter = frozen_hive._counter
+    counter = run_hive._counter
+    assert frozen_counter._count == counter._count == 2
+    assert frozen_counter._hive_drone_0.history == counter._hive_drone_0.history == [1, 2]
+    assert frozen_hive.doubled.pull() == run_hive.doubled.pull() == 14
+
+    # Plugin is bound to the socket
+    frozen_counter._hive_drone_0.report("frozen")
+    assert frozen_hive._hive_drone_0.reports == ["> frozen"]
+
+    # Frozen runtime hives are independent
+    other_hive = module.instantiate()
+    assert other_hive._value == 3
+    assert other_hive._counter._count == 0
+
+
+def build_closure(i, ex, args):
+    i.value = hive.variable("int", 0)
+    i.modify = hive.modifier(lambda h: None)
+    i.push_value = hive.push_in(i.value)
+    hive.trigger(i.push_value, i.modify)
+
+
+Closure = hive.hive("Closure", build_closure)
+
+
+def test_unfreezable():
+    try:
+        hive.freeze_hive(Closure)
+
+    except hive.FreezeError:
+        pass
+
+    else:
+        assert False, "Expected FreezeError"
+
+
+test_freeze()
+test_unfreezable()
@@ -0,0 +1,68 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+
+
+def declare_store(meta_args):
+    meta_args.value = hive.parameter("object")
+
+
+def build_store(i, ex, args, meta_args):
+    ex.value = hive.variable("object", meta_args.value)
+
+
+Store = hive.dyna_hive("Store", build_store, declare_store)
+
+
+def test_unhashable_meta_args_are_cached():
+    """Equal unhashable meta args share a HiveObject class"""
+    first = Store([1, 2, {"a": [3]}])
+    second = Store([1, 2, {"a": [3]}])
+    third = Store((1, 2, {"a": [3]}))
+
+    assert first._hive_object.__class__ is second._hive_object.__class__
+    assert first._hive_object.__class__ is not third._hive_object.__class__
+    assert second.value == [1, 2, {"a": [3]}]
+
+
+def test_hive_object_classes_are_evicted():
+    """Least recently used HiveObject classes are evicted from the bounded cache"""
+    previous_maxsize = Store.get_hive_object_class_info().maxsize
+    hive.set_hive_object_class_cache_size(2)
+
+    try:
+        first = Store(1)
+        Store(2)
+        Store(3)
+
+        info = Store.get_hive_object_class_info()
+        assert info.cached == 2
+        assert info.maxsize == 2
+        assert info.live >= 3
+
+        # Evicted class is rebuilt, but remains valid for existing instances
+        assert Store(1)._hive_object.__class__ is not first._hive_object.__class__
+        assert first.value == 1
+
+        assert Store in hive.get_hive_object_class_statistics()
+
+    finally:
+        hive.set_hive_object_class_cache_size(previous_maxsize)
+
+
+def test_prebuild():
+    """Prebuilt HiveObject classes are shared with later instances"""
+    hive_object_class = Store.prebuild(4)
+    assert hive_object_class is Store.prebuild(value=4)
+    assert Store(4)._hive_object.__class__ is hive_object_class
+
+
+test_unhashable_meta_args_are_cached()
+test_hive_object_classes_are_evicted()
+test_prebuild()
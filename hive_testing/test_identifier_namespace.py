@@ -0,0 +1,38 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+from hive.classes import IdentifierNamespace
+
+
+def test_scoped_registration():
+    root = IdentifierNamespace()
+    root.register("event.add_handler", "root")
+
+    assert root["event.add_handler"] == ("root",)
+    assert "event.add_handler" in root
+    assert "event.process" not in root
+
+    first = root.child()
+    first.register("event.add_handler", "first")
+    first.register("event.process", "first")
+
+    second = root.child()
+
+    # Children see their ancestors' items, but not each other's
+    assert first["event.add_handler"] == ("root", "first")
+    assert second["event.add_handler"] == ("root",)
+    assert "event.process" not in second
+
+    # Parents do not see their children's items
+    assert root["event.add_handler"] == ("root",)
+
+    grandchild = first.child()
+    assert grandchild["event.process"] == ("first",)
+
+
+test_scoped_registration()
@@ -0,0 +1,142 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+
+
+class CounterClass:
+
+    def __init__(self):
+        self.count = 0
+
+    def increment(self):
+        self.count += 1
+
+
+def build_counter(cls, i, ex, args):
+    i.increment = hive.triggerable(cls.increment)
+    ex.increment = hive.entry(i.increment)
+
+    ex.count = hive.property(cls, "count", "int")
+    ex.total = hive.variable("int", 0)
+
+
+Counter = hive.hive("Counter", build_counter, CounterClass)
+
+
+def build_pair(i, ex, args):
+    i.first = Counter()
+    i.second = Counter()
+
+    i.trig = hive.triggerfunc()
+    hive.trigger(i.trig, i.first.increment)
+    hive.trigger(i.trig, i.second.increment)
+
+    ex.trig = hive.hook(i.trig)
+
+
+Pair = hive.hive("Pair", build_pair)
+
+
+def build_relay(i, ex, args):
+    i.value = hive.variable("int", 0)
+    i.push_value = hive.push_in(i.value)
+    ex.value = hive.antenna(i.push_value)
+
+    i.push_out = hive.push_out(i.value)
+    ex.value_out = hive.output(i.push_out)
+    hive.trigger(i.push_value, i.push_out)
+
+
+Relay = hive.hive("Relay", build_relay)
+
+
+def build_chain(i, ex, args):
+    i.first = Relay()
+    i.second = Relay()
+    hive.connect(i.first.value_out, i.second.value)
+
+
+Chain = hive.hive("Chain", build_chain)
+
+
+def test_plan_is_recorded_once():
+    """Instantiation plan is recorded by the first runtime hive, and reused by later runtime hives"""
+    first = Pair()
+    hive_object_class = first._hive_object.__class__
+    plan = hive_object_class._hive_instantiation_plan
+    assert plan is not None
+
+    second = Pair()
+    assert hive_object_class._hive_instantiation_plan is plan
+
+
+def test_replayed_hives_are_independent():
+    """Runtime hives created from a replayed plan do not share state or connections"""
+    first = Pair()
+    second = Pair()
+
+    first.trig()
+    first.trig()
+    second.trig()
+
+    assert first._first.count == 2
+    assert first._second.count == 2
+    assert second._first.count == 1
+    assert second._first is not first._first
+
+    first._first.total = 10
+    assert second._first.total == 0
+
+
+def test_plan_is_shared_between_hive_objects():
+    """Plans recorded for one HiveObject resolve the bees of other HiveObjects of the same class"""
+    # Record the plan for a HiveObject which is not used by Chain
+    Relay()
+
+    chain = Chain()
+    chain._first.value.push(2)
+    assert chain._second._value == 2
+
+
+def test_instantiate_many():
+    """Batch instantiation returns independent runtime hives of the same HiveObject"""
+    pairs = Pair.instantiate_many(3)
+    assert len(pairs) == 3
+    assert len({id(p) for p in pairs}) == 3
+    assert len({p._hive_object for p in pairs}) == 1
+
+    pairs[0].trig()
+    assert pairs[0]._first.count == 1
+    assert pairs[1]._first.count == 0
+
+
+def count_getinstance_calls():
+    return sum(info.hits + info.misses for name, info in hive.get_memo_statistics().items()
+               if name.endswith(".getinstance"))
+
+
+def test_replay_resolves_bees_once():
+    """Runtime hives of the same HiveObject replay its plan without resolving its bees again"""
+    hive_object = Pair.prebuild()()
+    hive_object.instantiate()
+    calls = count_getinstance_calls()
+
+    pair = hive_object.instantiate()
+    assert count_getinstance_calls() == calls
+
+    pair.trig()
+    assert pair._first.count == 1
+    assert pair._first is not hive_object.instantiate()._first
+
+
+test_plan_is_recorded_once()
+test_replayed_hives_are_independent()
+test_plan_is_shared_between_hive_objects()
+test_instantiate_many()
+test_replay_resolves_bees_once()
@@ -0,0 +1,208 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+from math import factorial
+from threading import Event
+import time
+
+import hive
+import dragonfly.event
+import dragonfly.sys
+
+
+def synchronise_until(synchronise, condition, timeout=10.0):
+    end_time = time.monotonic() + timeout
+
+    while True:
+        synchronise()
+        if condition():
+            break
+
+        assert time.monotonic() < end_time, "Timed out"
+        time.sleep(0.001)
+
+
+def make_job(function, **kwargs):
+    """Return a Job calling function, and the lists of its results and errors"""
+    job = dragonfly.sys.Job(**kwargs)
+    results = []
+    errors = []
+
+    hive.connect(hive.pull_out(lambda: function), job.function_in)
+    hive.connect(job.result_out, hive.push_in(results.append))
+    hive.connect(job.error_out, hive.push_in(errors.append))
+
+    return job, results, errors
+
+
+def test_synchronise():
+    release = Event()
+
+    def square(x):
+        release.wait(10)
+        return x * x
+
+    job, results, errors = make_job(square)
+    job.arguments_in.push((3,))
+    assert job.pending.pull() == 1
+
+    # Results are not delivered before the call completes
+    job.synchronise()
+    assert results == []
+
+    release.set()
+    synchronise_until(job.synchronise, lambda: results)
+    assert results == [9]
+    assert errors == []
+    assert job.pending.pull() == 0
+
+    job.dispose()
+
+
+def test_error():
+    job, results, errors = make_job(lambda: 1 / 0)
+    job.submit()
+
+    synchronise_until(job.synchronise, lambda: errors)
+
+    assert results == []
+    assert len(errors) == 1 and isinstance(errors[0], ZeroDivisionError)
+
+    job.dispose()
+
+
+def test_cancel_and_backlog():
+    release = Event()
+
+    def wait(x):
+        release.wait(10)
+        return x
+
+    job, results, errors = make_job(wait, max_pending=2)
+
+    rejected = []
+    hive.trigger(job.on_rejected, hive.triggerable(lambda: rejected.append(True)))
+
+    for value in range(3):
+        job.arguments_in.push((value,))
+
+    assert job.pending.pull() == 2
+    assert len(rejected) == 1
+
+    # The first call has started and runs to completion, its result is discarded
+    job.cancel()
+    assert job.pending.pull() == 0
+
+    release.set()
+    job.arguments_in.push((10,))
+    synchronise_until(job.synchronise, lambda: results)
+
+    # Calls run in order on the single worker, so the cancelled calls have completed
+    assert results == [10]
+
+    job.dispose()
+
+
+def make_host(executor, function):
+    """Return a HiveBuilder of a Job calling function, which shares the executor of its parent"""
+    def build_host(i, ex, args):
+        ex.executor = hive.plugin(lambda: executor, identifier="sys.executor")
+
+        ex.job = dragonfly.sys.Job()
+        hive.connect(hive.pull_out(lambda: function), ex.job.function_in)
+
+    return hive.hive("Host", build_host)
+
+
+def test_executor_cancelled():
+    release = Event()
+
+    def wait(x):
+        release.wait(10)
+        return x
+
+    executor = ThreadPoolExecutor(1)
+    host = make_host(executor, wait)()
+    results = []
+    errors = []
+
+    hive.connect(host.job.result_out, hive.push_in(results.append))
+    hive.connect(host.job.error_out, hive.push_in(errors.append))
+
+    host.job.arguments_in.push((1,))
+    host.job.arguments_in.push((2,))
+
+    # The queued call is cancelled by the shutdown of the shared executor
+    executor.shutdown(wait=False, cancel_futures=True)
+    release.set()
+
+    synchronise_until(host.job.synchronise, lambda: results and errors)
+    assert results == [1]
+    assert len(errors) == 1 and isinstance(errors[0], CancelledError)
+    assert host.job.pending.pull() == 0
+
+    host.dispose()
+
+
+def test_process_executor():
+    job, results, errors = make_job(factorial, executor="process", max_workers=2)
+
+    for value in range(5):
+        job.arguments_in.push((value,))
+
+    synchronise_until(job.synchronise, lambda: len(results) == 5)
+
+    assert sorted(results) == [1, 1, 2, 6, 24]
+
+    job.dispose()
+
+
+def make_game(executor):
+    """Return a HiveBuilder of a Job which receives tick events, and shares the executor of its parent"""
+    def build_game(i, ex, args):
+        ex.events = dragonfly.event.EventManager()
+
+        # Jobs may share an executor, which they do not shut down
+        ex.executor = hive.plugin(lambda: executor, identifier="sys.executor")
+
+        ex.job = dragonfly.sys.Job()
+        hive.connect(hive.pull_out(lambda: str.upper), ex.job.function_in)
+
+        i.result = hive.variable("str", "")
+        i.push_result = hive.push_in(i.result)
+        hive.connect(ex.job.result_out, i.push_result)
+
+    return hive.hive("Game", build_game)
+
+
+def test_tick():
+    executor = ThreadPoolExecutor(2)
+    game = make_game(executor)()
+    game.job.arguments_in.push(("hive",))
+
+    assert game._result == ""
+
+    # Completed results are delivered on the next tick
+    read_event = game.events.read_event.plugin()
+    synchronise_until(lambda: read_event(("tick",)), lambda: game._result)
+    assert game._result == "HIVE"
+
+    game.dispose()
+
+    # The shared executor is still usable
+    assert executor.submit(len, "hive").result() == 4
+    executor.shutdown()
+
+
+test_synchronise()
+test_error()
+test_cancel_and_backlog()
+test_executor_cancelled()
+test_process_executor()
+test_tick()
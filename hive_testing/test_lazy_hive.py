@@ -0,0 +1,135 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+
+
+class PanelClass:
+    instances = 0
+
+    def __init__(self):
+        PanelClass.instances += 1
+
+        self.values = []
+        self.triggered = 0
+
+    def on_value(self):
+        self.values.append(self._value)
+
+    def on_triggered(self):
+        self.triggered += 1
+
+
+def build_panel(cls, i, ex, args):
+    i.value = hive.property(cls, "_value", "int")
+    i.push_value = hive.push_in(i.value)
+    ex.value = hive.antenna(i.push_value)
+
+    i.on_value = hive.triggerable(cls.on_value)
+    hive.trigger(i.push_value, i.on_value)
+
+    i.on_triggered = hive.triggerable(cls.on_triggered)
+    ex.trigger = hive.entry(i.on_triggered)
+
+    i.pull_value = hive.pull_out(i.value)
+    ex.value_out = hive.output(i.pull_value)
+
+
+Panel = hive.hive("Panel", build_panel, builder_cls=PanelClass)
+
+
+def build_composite(i, ex, args):
+    i.panel = Panel(lazy=True)
+
+    i.value = hive.variable("int", 0)
+    i.push_value = hive.push_in(i.value)
+    ex.value = hive.antenna(i.push_value)
+
+    i.push_out = hive.push_out(i.value)
+    hive.trigger(i.push_value, i.push_out)
+    hive.connect(i.push_out, i.panel.value)
+
+    hive.trigger(i.push_value, i.panel.trigger)
+
+    i.panel_value = hive.variable("int", 0)
+    i.pull_panel = hive.pull_in(i.panel_value)
+    hive.connect(i.panel.value_out, i.pull_panel)
+    ex.pull_panel = hive.entry(i.pull_panel)
+
+
+Composite = hive.hive("Composite", build_composite)
+
+
+def build_debug_composite(i, ex, args):
+    i.panel = Panel(lazy=True)
+    ex.panel_value = hive.antenna(i.panel.value)
+
+
+DebugComposite = hive.hive("DebugComposite", build_debug_composite)
+
+
+def test_materialise_on_push():
+    # First instance records the instantiation plan
+    Composite()
+
+    instances = PanelClass.instances
+    h = Composite()
+    assert PanelClass.instances == instances
+
+    h.value.push(3)
+    assert PanelClass.instances == instances + 1
+
+    panel = h._panel._hive_build_class_to_instance[PanelClass]
+    assert panel.values == [3]
+    assert panel.triggered == 1
+
+    h.value.push(4)
+    assert panel.values == [3, 4]
+    assert panel.triggered == 2
+
+
+def test_materialise_on_pull():
+    Composite()
+    instances = PanelClass.instances
+
+    h = Composite()
+    h.pull_panel()
+    assert PanelClass.instances == instances + 1
+
+    h.value.push(6)
+    h.pull_panel()
+    assert h._panel_value == 6
+
+
+def test_materialise_on_access():
+    DebugComposite()
+    instances = PanelClass.instances
+
+    h = DebugComposite()
+    assert PanelClass.instances == instances
+
+    h.panel_value.push(5)
+    assert PanelClass.instances == instances + 1
+
+    panel = h._panel._hive_build_class_to_instance[PanelClass]
+    assert panel.values == [5]
+
+
+def test_dispose_lazy():
+    Composite()
+    instances = PanelClass.instances
+
+    h = Composite()
+    h.dispose()
+    assert PanelClass.instances == instances
+
+
+test_materialise_on_push()
+test_materialise_on_pull()
+test_materialise_on_access()
+test_dispose_lazy()
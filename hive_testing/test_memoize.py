@@ -0,0 +1,122 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+
+
+class Squares:
+
+    def __init__(self):
+        self.calls = 0
+
+    @hive.memoize
+    def square(self, value):
+        self.calls += 1
+        return value ** 2
+
+    @hive.memoize(maxsize=2)
+    def cube(self, value):
+        self.calls += 1
+        return value ** 3
+
+
+class Builder:
+    calls = 0
+
+    @classmethod
+    @hive.memoize
+    def build(cls, value):
+        cls.calls += 1
+        return cls, value
+
+
+class DerivedBuilder(Builder):
+    calls = 0
+
+
+def build_value(i, ex, args):
+    ex.value = hive.variable("int", 0)
+
+
+Value = hive.hive("Value", build_value)
+
+
+def test_results_are_cached_per_instance():
+    """Results are cached by each instance, and statistics are accumulated over all instances"""
+    Squares.square.cache_clear()
+
+    first = Squares()
+    second = Squares()
+
+    assert first.square(2) == 4
+    assert first.square(2) == 4
+    assert second.square(2) == 4
+    assert first.calls == 1
+    assert second.calls == 1
+
+    info = Squares.square.cache_info()
+    assert info.hits == 1
+    assert info.misses == 2
+    assert info.entries == 2
+    assert info.instances == 2
+    assert info.maxsize is None
+
+    del second
+    assert Squares.square.cache_info().instances == 1
+
+    Squares.square.cache_clear(first)
+    first.square(2)
+    assert first.calls == 2
+
+
+def test_bounded_cache_evicts_least_recently_used():
+    """Bounded caches evict the least recently used result"""
+    # Statistics are accumulated over all instances, including those of earlier runs
+    Squares.cube.cache_clear()
+    squares = Squares()
+
+    squares.cube(1)
+    squares.cube(2)
+    squares.cube(1)
+    squares.cube(3)
+    assert squares.calls == 3
+
+    # 2 was evicted, 1 was retained
+    squares.cube(1)
+    assert squares.calls == 3
+    squares.cube(2)
+    assert squares.calls == 4
+
+    info = Squares.cube.cache_info()
+    assert info.entries == 2
+    assert info.evictions == 2
+
+
+def test_classmethods_are_cached_per_class():
+    """Derived classes do not share the results of their bases"""
+    assert Builder.build(1) == (Builder, 1)
+    assert DerivedBuilder.build(1) == (DerivedBuilder, 1)
+    assert Builder.build(1) == (Builder, 1)
+
+    assert Builder.calls == 1
+    assert DerivedBuilder.calls == 1
+
+
+def test_statistics():
+    """Statistics are reported for memoized functions of the hive package"""
+    Value()
+
+    statistics = hive.get_memo_statistics()
+    assert "hive.variable.Variable.bind" in statistics
+    assert statistics["hive.variable.Variable.bind"].misses >= 1
+
+
+test_results_are_cached_per_instance()
+test_bounded_cache_evicts_least_recently_used()
+test_classmethods_are_cached_per_class()
+test_statistics()
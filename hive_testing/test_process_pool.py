@@ -0,0 +1,134 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import time
+
+import hive
+import dragonfly.sys
+
+
+def build_host(i, ex, args, meta_args):
+    i.pool = dragonfly.sys.HiveProcessPool(hive_path="hive_testing.pool_sessions.Echo",
+                                           start_method=meta_args.start_method, processes=2)
+
+    i.message = hive.variable("tuple")
+    i.push_message = hive.push_out(i.message)
+    hive.connect(i.push_message, i.pool.message_in)
+
+    i.received = hive.variable("tuple")
+    i.push_received = hive.push_in(i.received)
+    hive.connect(i.pool.message_out, i.push_received)
+
+    def record(self):
+        self._replies.append(self._received)
+
+    i.record = hive.modifier(record)
+    hive.trigger(i.push_received, i.record)
+
+    i.replies = hive.variable("list")
+
+    ex.pool = hive.hook(i.pool)
+    ex.send = hive.entry(i.push_message)
+
+
+def declare_host(meta_args):
+    meta_args.start_method = hive.parameter("str", "fork")
+
+
+Host = hive.dyna_hive("Host", build_host, declare_host)
+
+
+def run_pool(start_method):
+    host = Host(start_method=start_method)
+    host._replies = []
+
+    host.pool.start()
+
+    for process_id, value in ((0, 1), (1, 2), (0, 3)):
+        host._message = process_id, value
+        host.send()
+
+    # Pending replies are received when stopped
+    host.pool.stop()
+
+    replies = host._replies
+    assert sorted((process_id, value) for process_id, (pid, value) in replies) == [(0, 2), (0, 6), (1, 4)], replies
+
+    pids = {process_id: set() for process_id in (0, 1)}
+    for process_id, (pid, value) in replies:
+        pids[process_id].add(pid)
+
+    # Each process ID is served by a single worker process, which is not this process
+    assert all(len(process_pids) == 1 for process_pids in pids.values())
+    assert pids[0] != pids[1]
+    assert os.getpid() not in pids[0] | pids[1]
+
+    host.dispose()
+
+
+def test_fork():
+    run_pool("fork")
+
+
+def test_spawn():
+    run_pool("spawn")
+
+
+def test_synchronise():
+    host = Host()
+    host._replies = []
+    host.pool.start()
+
+    host._message = 1, 21
+    host.send()
+
+    # Replies are pushed when synchronised
+    for _ in range(1000):
+        host.pool.synchronise()
+        if host._replies:
+            break
+
+        time.sleep(0.005)
+
+    assert [value for process_id, (pid, value) in host._replies] == [42]
+
+    # Dispose stops the workers
+    host.dispose()
+
+
+def build_app(i, ex, args):
+    i.pool = dragonfly.sys.HiveProcessPool(hive_path="hive_testing.pool_sessions.Echo", start_method="fork")
+    ex.pool = hive.hook(i.pool)
+
+
+App = dragonfly.sys.Process.extend("App", build_app)
+
+
+def test_process_plugins():
+    app = App()
+    replies = []
+
+    def on_received(message):
+        replies.append(message)
+
+    hive.connect(app.pool.message_out, hive.push_in(on_received))
+
+    # The pool is started and stopped with the enclosing process
+    app.on_started()
+    app.pool.message_in.push((0, 5))
+    app.on_stopped()
+
+    assert [value for process_id, (pid, value) in replies] == [10], replies
+
+
+# Spawned workers import this module, so must not run the tests
+if __name__ == "__main__":
+    test_fork()
+    test_spawn()
+    test_synchronise()
+    test_process_plugins()
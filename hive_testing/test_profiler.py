@@ -0,0 +1,119 @@
+from __future__ import print_function
+
+import importlib
+import os
+import sys
+import tempfile
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from hive.profiler import get_build_profiler
+from hive_editor.code_generator import parameter_group_dict_to_array
+from hive_editor.importer import sys_path_add_context
+from hive_editor.models import model
+
+
+def build_child(i, ex, args):
+    i.value = hive.variable("int", 0)
+    i.pull_value = hive.pull_out(i.value)
+    ex.value_out = hive.output(i.pull_value)
+
+
+def make_profiled_parent():
+    """Return a new ProfiledParent HiveBuilder (of a new ProfiledChild), so that each test run builds both classes"""
+    ProfiledChild = hive.hive("ProfiledChild", build_child)
+
+    def build_parent(i, ex, args):
+        i.child = ProfiledChild()
+        i.value = hive.variable("int", 0)
+        i.pull_value = hive.pull_in(i.value)
+
+        hive.connect(i.child.value_out, i.pull_value)
+
+    return hive.hive("ProfiledParent", build_parent)
+
+
+def test_profile_build():
+    ProfiledParent = make_profiled_parent()
+    assert get_build_profiler() is None
+
+    with hive.profile_build() as profiler:
+        assert get_build_profiler() is profiler
+
+        ProfiledParent()
+        ProfiledParent()
+
+    assert get_build_profiler() is None
+
+    nodes = [(node.category, node.name) for depth, node in profiler.iter_tree()]
+    assert ("build", "ProfiledParent") in nodes
+    assert ("build", "ProfiledChild") in nodes
+    assert ("builder", "{}.make_profiled_parent.<locals>.build_parent".format(__name__)) in nodes
+    assert ("instantiate", "ProfiledParent") in nodes
+
+    # The HiveObject class is built only once
+    build_node = profiler.root.children["build", "ProfiledParent"]
+    assert build_node.calls == 1
+
+    instantiate_node = profiler.root.children["instantiate", "ProfiledParent"]
+    assert instantiate_node.calls == 2
+    assert instantiate_node.self_time <= instantiate_node.total_time
+
+    table = profiler.get_flat_table()
+    categories = {entry.category for entry in table}
+    assert {"build", "builder", "namespace", "instantiate", "getinstance", "bind"} <= categories
+
+    print(profiler.format_tree())
+    print(profiler.format_flat_table(limit=10))
+
+
+def test_inactive():
+    # Instantiation without a profiler records nothing
+    with hive.profile_build() as profiler:
+        pass
+
+    make_profiled_parent()()
+    assert not profiler.root.children
+
+
+def write_profiled_hivemap(directory):
+    """Write a hivemap (of a single Variable hive) to profiled_hivemap.hivemap in the given directory"""
+    parameters = dict(meta_args=dict(data_type="int"), args=dict(start_value=1))
+
+    hivemap = model.Hivemap()
+    hivemap.nodes.append(model.Node(identifier="value", family="HIVE", reference_path="dragonfly.std.Variable",
+                                    parameter_groups=parameter_group_dict_to_array(parameters)))
+
+    with open(os.path.join(directory, "profiled_hivemap.hivemap"), "w") as f:
+        f.write(str(hivemap))
+
+
+def test_profile_hivemap():
+    """Hives generated from hivemaps by the import hook are profiled"""
+    with tempfile.TemporaryDirectory() as directory:
+        write_profiled_hivemap(directory)
+
+        with sys_path_add_context(directory):
+            importlib.invalidate_caches()
+
+            try:
+                ProfiledHivemap = importlib.import_module("profiled_hivemap").ProfiledHivemap
+
+                with hive.profile_build() as profiler:
+                    ProfiledHivemap()
+
+            finally:
+                sys.modules.pop("profiled_hivemap", None)
+
+    nodes = [(node.category, node.name) for depth, node in profiler.iter_tree()]
+    assert ("build", "ProfiledHivemap") in nodes
+    assert ("builder", "profiled_hivemap.builder") in nodes
+    assert ("instantiate", "ProfiledHivemap") in nodes
+    assert ("instantiate", "Variable") in nodes
+
+
+test_profile_build()
+test_inactive()
+test_profile_hivemap()
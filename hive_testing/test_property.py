@@ -0,0 +1,51 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+
+
+class StoreClass:
+
+    def __init__(self):
+        self.value = None
+
+
+def build_store(cls, i, ex, args):
+    i.value = hive.property(cls, "value", "int", 0)
+    ex.value = i.value
+
+    i.push_value = hive.push_in(i.value)
+    ex.value_in = hive.antenna(i.push_value)
+
+    i.pull_value = hive.pull_out(i.value)
+    ex.value_out = hive.output(i.pull_value)
+
+
+Store = hive.hive("Store", build_store, StoreClass)
+
+
+def test_property_accessors():
+    """Property values are read and written on the builder-class instance of each runtime hive"""
+    first = Store()
+    second = Store()
+
+    instance = first._hive_build_class_to_instance[StoreClass]
+    assert first._drones == [instance]
+
+    first.value_in.push(4)
+    assert instance.value == 4
+    assert first.value == 4
+    assert first._value == 4
+    assert first.value_out.pull() == 4
+
+    first.value = 7
+    assert instance.value == 7
+    assert second.value == 0
+
+
+test_property_accessors()
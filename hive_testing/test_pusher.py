@@ -0,0 +1,76 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from hive.classes import Pusher
+from hive.triggerfunc import TriggerFunc
+
+
+class Owner:
+    pass
+
+
+def test_specialised_push():
+    calls = []
+    owner = Owner()
+    pusher = Pusher(owner, bind_as="push_bound")
+
+    # No targets
+    pusher.push(1)
+    assert owner.push_bound is pusher.push
+
+    # Single target is called directly
+    first = lambda value: calls.append(("first", value))
+    pusher.add_target(first)
+    assert pusher.push is first
+    assert owner.push_bound is first
+
+    # Many targets are called in order
+    for i in range(5):
+        pusher.add_target(lambda value, i=i: calls.append((i, value)))
+        assert owner.push_bound is pusher.push
+
+        del calls[:]
+        pusher.push("x")
+        assert calls == [("first", "x")] + [(j, "x") for j in range(i + 1)]
+
+    pusher.clear()
+    del calls[:]
+    owner.push_bound("x")
+    assert not calls
+
+
+def test_replace_target():
+    calls = []
+    pusher = Pusher(Owner())
+
+    first = lambda: calls.append("first")
+    pusher.add_target(first)
+    pusher.replace_target(first, lambda: calls.append("second"))
+
+    pusher.push()
+    assert calls == ["second"]
+
+
+def test_owner_trigger():
+    calls = []
+
+    trigger_func = TriggerFunc()
+    trigger_func()
+
+    hive.trigger(trigger_func, hive.triggerable(lambda: calls.append("first")))
+    hive.trigger(trigger_func, hive.triggerable(lambda: calls.append("second")))
+    hive.trigger(trigger_func, hive.triggerable(lambda: calls.append("pretrigger")), pretrigger=True)
+
+    trigger_func()
+    assert calls == ["pretrigger", "first", "second"]
+
+
+test_specialised_push()
+test_replace_target()
+test_owner_trigger()
@@ -0,0 +1,84 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+from hive.protocols import Antenna, TriggerTarget, TriggerSource
+from hive.resolve_bee import ResolveBee
+
+
+class PanelClass:
+
+    def __init__(self):
+        self.triggered = 0
+
+    def on_triggered(self):
+        self.triggered += 1
+
+
+def build_panel(cls, i, ex, args):
+    i.value = hive.variable("int", 0)
+    i.push_value = hive.push_in(i.value)
+    ex.value = hive.antenna(i.push_value)
+    ex.pushed = hive.hook(i.push_value)
+
+    i.on_triggered = hive.triggerable(cls.on_triggered)
+    ex.trigger = hive.entry(i.on_triggered)
+
+
+Panel = hive.hive("Panel", build_panel, builder_cls=PanelClass)
+
+
+def build_wrapper(i, ex, args):
+    ex.inner = Panel()
+
+
+Wrapper = hive.hive("Wrapper", build_wrapper)
+
+
+def build_outer(i, ex, args):
+    ex.inner = Wrapper()
+
+
+Outer = hive.hive("Outer", build_outer)
+
+
+def test_cached_children():
+    hive_object = Outer._hive_get_hive_object_class((), {})[2]()
+
+    value = hive_object.inner.inner.value
+    assert isinstance(value, ResolveBee)
+    assert value is hive_object.inner.inner.value
+
+    # implements() is answered by the concrete bee
+    assert value.implements(Antenna)
+    assert hive_object.inner.inner.trigger.implements(TriggerTarget)
+    assert hive_object.inner.inner.pushed.implements(TriggerSource)
+
+
+def build_trigger_panel(i, ex, args):
+    i.panel = Panel()
+    i.trig = hive.triggerfunc()
+    ex.trig = hive.hook(i.trig)
+
+    # Panel exposes a single TriggerTarget (an entry)
+    hive.trigger(i.trig, i.panel)
+
+
+TriggerPanel = hive.hive("TriggerPanel", build_trigger_panel)
+
+
+def test_trigger_entry():
+    trigger_panel = TriggerPanel()
+    trigger_panel.trig()
+    trigger_panel.trig()
+
+    assert trigger_panel._panel._hive_drone_0.triggered == 2
+
+
+test_cached_children()
+test_trigger_entry()
@@ -0,0 +1,74 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+
+
+def build_relay(i, ex, args):
+    i.value = hive.variable("int", 0)
+    i.push_value = hive.push_in(i.value)
+    ex.value = hive.antenna(i.push_value)
+
+    i.push_out = hive.push_out(i.value)
+    ex.value_out = hive.output(i.push_out)
+    hive.trigger(i.push_value, i.push_out)
+
+    i.on_push = hive.triggerfunc()
+    ex.on_push = hive.hook(i.on_push)
+
+    i.do_on_push = hive.triggerable(i.on_push)
+    hive.trigger(i.push_value, i.do_on_push)
+
+
+Relay = hive.hive("Relay", build_relay)
+
+
+def build_chain(i, ex, args):
+    i.first = Relay()
+    i.second = Relay()
+    hive.connect(i.first.value_out, i.second.value)
+
+    ex.value = hive.antenna(i.first.value)
+
+
+Chain = hive.hive("Chain", build_chain)
+
+
+def test_runtime_hives_are_slotted():
+    """Runtime hives and their bound bees do not allocate instance dictionaries"""
+    relay = Relay()
+
+    assert not hasattr(relay, "__dict__")
+    assert not hasattr(relay.value, "__dict__")
+    assert not hasattr(relay.value_out, "__dict__")
+    assert not hasattr(relay.on_push, "__dict__")
+
+    try:
+        relay.undeclared_attribute = None
+
+    except AttributeError:
+        pass
+
+    else:
+        assert False, "Runtime hive accepted undeclared attribute"
+
+
+def test_slotted_hives_are_aliased():
+    """Child hives held in slots are connected, and record the runtime hive under which they are referred"""
+    chain = Chain()
+    chain.value.push(3)
+
+    assert chain._second._value == 3
+
+    aliases = chain._first._hive_runtime_aliases
+    assert [alias.name for alias in aliases] == ["first"]
+    assert next(iter(aliases)).parent_ref() is chain
+
+
+test_runtime_hives_are_slotted()
+test_slotted_hives_are_aliased()
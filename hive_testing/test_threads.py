@@ -0,0 +1,186 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier
+import time
+
+import hive
+from hive.contexts import get_building_hive, get_mode, hive_mode_as
+from hive.typing import matching, parse_type_string
+
+
+WORKERS = 4
+
+
+def make_counter_hive(name, barrier, step):
+    """Return a HiveBuilder whose builder waits at a barrier, so that all workers are building at the same time"""
+    def build_counter(i, ex, args):
+        building_hive = get_building_hive()
+        barrier.wait(timeout=10)
+        # Other threads must not change the hive being built
+        assert get_building_hive() is building_hive
+
+        i.count = hive.variable("int", 0)
+        i.step = hive.variable("int", step)
+        i.push_count = hive.push_out(i.count)
+
+        def increment(self):
+            self._count += self._step
+
+        i.increment = hive.modifier(increment)
+        i.do_increment = hive.triggerfunc()
+        hive.trigger(i.do_increment, i.increment)
+        hive.trigger(i.do_increment, i.push_count)
+
+        ex.increment = hive.hook(i.do_increment)
+        ex.count_out = hive.output(i.push_count)
+
+    return hive.hive(name, build_counter)
+
+
+def build_sink(i, ex, args):
+    i.value = hive.variable("int", 0)
+    i.push_value = hive.push_in(i.value)
+    ex.value_in = hive.antenna(i.push_value)
+
+
+Sink = hive.hive("Sink", build_sink)
+
+
+def make_pair_hive(counter_class):
+    def build_pair(i, ex, args):
+        i.counter = counter_class()
+        i.sink = Sink()
+        hive.connect(i.counter.count_out, i.sink.value_in)
+
+        ex.counter = hive.hook(i.counter)
+        ex.sink = hive.hook(i.sink)
+
+    return hive.hive("Pair", build_pair)
+
+
+def test_parallel_build():
+    barrier = Barrier(WORKERS)
+
+    def work(step):
+        counter_class = make_counter_hive("Counter{}".format(step), barrier, step)
+        pair = make_pair_hive(counter_class)()
+
+        for _ in range(3):
+            pair.counter.increment()
+
+        return pair.sink._value
+
+    with ThreadPoolExecutor(WORKERS) as executor:
+        results = list(executor.map(work, range(1, WORKERS + 1)))
+
+    assert results == [3 * step for step in range(1, WORKERS + 1)], results
+
+
+def test_parallel_instantiate():
+    Pair = make_pair_hive(make_counter_hive("SharedCounter", Barrier(1), 2))
+
+    def work(_):
+        pair = Pair()
+        pair.counter.increment()
+        return pair.sink._value, pair._hive_object.__class__
+
+    with ThreadPoolExecutor(WORKERS) as executor:
+        results = list(executor.map(work, range(WORKERS * 8)))
+
+    assert all(value == 2 for value, _ in results), results
+    # The HiveObject class is shared between threads
+    assert len({hive_object_class for _, hive_object_class in results}) == 1
+
+
+def test_context_isolation():
+    barrier = Barrier(2)
+
+    def in_build_mode():
+        with hive_mode_as("build"):
+            barrier.wait(timeout=10)
+            barrier.wait(timeout=10)
+            return get_mode()
+
+    with ThreadPoolExecutor(1) as executor:
+        future = executor.submit(in_build_mode)
+        barrier.wait(timeout=10)
+        # The mode of the worker thread does not leak into this thread
+        assert get_mode() == "immediate"
+        barrier.wait(timeout=10)
+        assert future.result() == "build"
+
+    assert get_mode() == "immediate"
+
+
+def make_declared_hive(factory):
+    """Return a HiveBuilder whose declarator is slow, so that threads construct it for the first time together"""
+    def declare_value(meta_args):
+        meta_args.data_type = hive.parameter("str", "int")
+        time.sleep(0.05)
+        meta_args.start_value = hive.parameter("int", 1)
+
+    def build_value(i, ex, args, meta_args):
+        i.value = hive.variable(meta_args.data_type, meta_args.start_value)
+        i.pull_value = hive.pull_out(i.value)
+        ex.value_out = hive.output(i.pull_value)
+
+    return factory("Declared", build_value, declare_value)
+
+
+def test_parallel_first_construction():
+    for factory, create in ((hive.dyna_hive, lambda hive_class: hive_class(start_value=2)),
+                            (hive.meta_hive, lambda hive_class: hive_class(start_value=2)())):
+        declared_class = make_declared_hive(factory)
+        barrier = Barrier(WORKERS)
+
+        def work(_):
+            barrier.wait(timeout=10)
+            return create(declared_class).value_out.pull()
+
+        with ThreadPoolExecutor(WORKERS) as executor:
+            results = list(executor.map(work, range(WORKERS)))
+
+        assert results == [2] * WORKERS, results
+
+
+class EvictingCache(OrderedDict):
+    """Match cache whose entries are evicted (as if by another thread) as soon as they are looked up"""
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        del self[key]
+        return value
+
+
+def test_concurrent_match_eviction():
+    """Cached matches evicted by other threads between their lookup and reordering are rematched"""
+    source = parse_type_string("tuple.int")
+    target = parse_type_string("tuple")
+    other_target = parse_type_string("int")
+
+    match_cache = matching._match_cache
+    matching._match_cache = EvictingCache()
+
+    try:
+        assert matching.type_asts_match(source, target)
+        assert matching.type_asts_match(source, target)
+        assert not matching.type_asts_match(target, other_target)
+        assert not matching.type_asts_match(target, other_target)
+
+    finally:
+        matching._match_cache = match_cache
+
+
+test_parallel_build()
+test_parallel_instantiate()
+test_context_isolation()
+test_parallel_first_construction()
+test_concurrent_match_eviction()
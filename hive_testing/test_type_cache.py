@@ -0,0 +1,71 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+from hive.exception import MatchFailedError
+from hive.typing import (parse_type_string, find_matching_ast, find_scored_matching_ast, get_match_score,
+                         get_type_key, clear_match_cache, data_types_match, MatchFlags)
+from hive.typing import matching
+
+
+def test_interned_asts():
+    assert parse_type_string("int.x") is parse_type_string("int.x")
+    assert parse_type_string("dict[str->int]") is parse_type_string("dict[str->int]")
+
+    # Untyped
+    assert parse_type_string(None) is parse_type_string("")
+
+    assert get_type_key(parse_type_string("list[int]")) == get_type_key(parse_type_string("list[int]"))
+    assert get_type_key(parse_type_string("list[int]")) != get_type_key(parse_type_string("list[float]"))
+
+
+def test_cached_matches():
+    clear_match_cache()
+
+    source = parse_type_string("int.x.y")
+    target = parse_type_string("int.x")
+
+    match, score = find_scored_matching_ast(source, target, MatchFlags.match_shortest)
+    assert score == get_match_score(match)
+    assert find_matching_ast(source, target, MatchFlags.match_shortest) is match
+
+    # Flags are part of the key
+    try:
+        find_matching_ast(source, target, MatchFlags.match_source)
+
+    except MatchFailedError:
+        pass
+
+    else:
+        assert False, "match_source should fail"
+
+    # Failures are cached too
+    assert len(matching._match_cache) == 2
+    assert not data_types_match("int.x.y", "int.x", MatchFlags.match_source)
+    assert len(matching._match_cache) == 2
+
+
+def test_bounded_match_cache():
+    clear_match_cache()
+
+    maxsize = matching.MATCH_CACHE_SIZE
+    matching.MATCH_CACHE_SIZE = 4
+
+    try:
+        for i in range(10):
+            data_types_match("int", "int.t{}".format(i))
+
+        assert len(matching._match_cache) == 4
+
+    finally:
+        matching.MATCH_CACHE_SIZE = maxsize
+        clear_match_cache()
+
+
+test_interned_asts()
+test_cached_matches()
+test_bounded_match_cache()
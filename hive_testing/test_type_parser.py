@@ -0,0 +1,93 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+sys.path.append(current_directory)
+
+from hive.typing.parser import _parse_type_string
+import reference_type_parser
+
+
+VALID_TYPE_STRINGS = [
+    None,
+    "",
+    "?",
+    "int",
+    "int.entity_id",
+    "tuple.vector.position",
+    "list[int]",
+    "list[?]",
+    "list[list[str.id]]",
+    "dict[str->int]",
+    "dict[str.id->tuple.vector]",
+    "dict[str->dict[int->list[?]]]",
+    "set[ int.id ]",
+    " dict[ str -> int ] ",
+]
+
+INVALID_TYPE_STRINGS = [
+    "[",
+    "int.",
+    ".int",
+    "int..id",
+    "list[int",
+    "list[int]]",
+    "list[]",
+    "list[int]int",
+    "int.id[str]",
+    "dict[str->]",
+    "dict[->int]",
+    "dict[str-int]",
+    "int str",
+    "?.int",
+    "1int",
+]
+
+
+def test_valid_type_strings_conform():
+    for type_string in VALID_TYPE_STRINGS:
+        expected = reference_type_parser.parse_type_string(type_string)
+        result = _parse_type_string(type_string)
+
+        assert result == expected, (type_string, result, expected)
+
+
+def test_invalid_type_strings_conform():
+    for type_string in INVALID_TYPE_STRINGS:
+        # The reference tokenizer may raise its own errors (e.g. for unbalanced brackets)
+        try:
+            reference_type_parser.parse_type_string(type_string)
+
+        except Exception:
+            pass
+
+        else:
+            raise AssertionError("Reference parser accepted invalid type string {!r}".format(type_string))
+
+        try:
+            _parse_type_string(type_string)
+
+        except ValueError:
+            pass
+
+        else:
+            raise AssertionError("Parser accepted invalid type string {!r}".format(type_string))
+
+
+def test_non_string_type():
+    for parse_type_string in (reference_type_parser.parse_type_string, _parse_type_string):
+        try:
+            parse_type_string(1)
+
+        except ValueError:
+            continue
+
+        raise AssertionError("{} accepted non-string type".format(parse_type_string))
+
+
+test_valid_type_strings_conform()
+test_invalid_type_strings_conform()
+test_non_string_type()
@@ -0,0 +1,61 @@
+from __future__ import print_function
+
+import os
+import sys
+
+current_directory = os.path.split(os.path.abspath(__file__))[0]
+sys.path.append(current_directory + "/" + "..")
+
+import hive
+
+
+def double(self):
+    self._value = self._value * 2
+
+
+def build_doubler(i, ex, args):
+    args.start_value = hive.parameter("int", 1)
+    i.value = hive.variable("int", args.start_value)
+    ex.value = i.value
+
+    i.double = hive.modifier(double)
+    ex.double = hive.entry(i.double)
+
+    i.pull_value = hive.pull_out(i.value)
+    ex.value_out = hive.output(i.pull_value)
+
+    i.push_value = hive.push_in(i.value)
+    ex.value_in = hive.antenna(i.push_value)
+
+
+Doubler = hive.hive("Doubler", build_doubler)
+
+
+def test_slot_storage():
+    """Variables exposed under several names share a single slot of the runtime hive"""
+    doubler = Doubler(start_value=3)
+    run_hive_class = doubler.__class__
+
+    assert run_hive_class.value is run_hive_class._value
+    assert doubler.value == 3
+
+    doubler.double()
+    assert doubler._value == 6
+    assert doubler.value_out.pull() == 6
+
+    doubler.value_in.push(5)
+    assert doubler.value == 5
+
+
+def test_independent_values():
+    """Variable values are stored per runtime hive"""
+    first = Doubler()
+    second = Doubler()
+
+    first.double()
+    assert first.value == 2
+    assert second.value == 1
+
+
+test_slot_storage()
+test_independent_values()